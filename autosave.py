@@ -0,0 +1,190 @@
+"""
+자동 저장 (비정상 종료 복구용 변경 기록)
+"""
+import json
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from models import Person, RelationshipLine, add_change_listener, remove_change_listener
+from db_worker import DatabaseTask
+from database import Database
+from config import AUTOSAVE_INTERVAL_MS, AUTOSAVE_COMPACT_THRESHOLD, AUTOSAVE_LOCK_TIMEOUT_MS
+
+
+class AutosaveJournal(QObject):
+    """편집된 인물/관계선만 AutosaveJournal 테이블에 이어 쓰는 자동 저장기
+    
+    모델 변경 알림과 목록 추가/삭제 통지로 바뀐 항목을 모아 두었다가
+    타이머가 만료되면 한 번에 기록하므로, 기록 비용은 가계도 크기가 아니라
+    그 사이 바뀐 항목 수에만 비례합니다. 명시적 저장 직전에 checkpoint()로
+    순번을 받아 두고, 저장이 끝나면 clear_until()로 그때까지의 기록을 지웁니다.
+    기록은 GUI 스레드에서 실행되므로, 작업 스레드의 저장이나 기록 정리가 쓰기 잠금을
+    잡고 있는 동안에는 기록하지 않고 대기 중인 변경을 그대로 두었다가 다음 주기에
+    다시 시도합니다. 그 밖의 연결이 잠금을 잡고 있으면 AUTOSAVE_LOCK_TIMEOUT_MS만
+    기다리고, 기록에 실패하면 마찬가지로 변경을 남겨 두고 failed 시그널로 알립니다.
+    
+    Args:
+        db: GUI 스레드에서 사용하는 Database
+        pool: 기록 정리(compaction)를 실행할 QThreadPool
+        is_current: is_current(kind, obj) - 객체가 현재 가계도에 있는지 여부
+        is_busy: is_busy() - 작업 스레드에서 데이터베이스에 쓰는 중인지 여부 (없으면 항상 False)
+    """
+    
+    # 기록 실패 (오류 메시지)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, db, pool, is_current, is_busy=None, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.pool = pool
+        self.is_current = is_current
+        self.is_busy = is_busy or (lambda: False)
+        self.tree_name = None
+        # (종류, id) -> 객체 (삭제는 None)
+        self.pending = {}
+        self.appended_since_compact = 0
+        self.compact_task = None
+        
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(AUTOSAVE_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+        
+        add_change_listener(self._on_model_changed)
+    
+    def detach(self):
+        """모델 변경 알림 수신 중단"""
+        remove_change_listener(self._on_model_changed)
+        self.flush_timer.stop()
+    
+    def start(self, tree_name: str):
+        """tree_name 가계도의 변경 기록 시작 (이미 있는 기록은 유지)"""
+        self.tree_name = tree_name
+        self.pending.clear()
+    
+    def discard(self):
+        """현재 가계도의 저장되지 않은 기록 폐기"""
+        self.flush_timer.stop()
+        self.pending.clear()
+        if self.tree_name:
+            self.db.clear_journal(self.tree_name)
+        self.tree_name = None
+    
+    def checkpoint(self):
+        """기록 대기 중인 변경을 기록하고 마지막 순번 반환 (명시적 저장 직전에 호출)"""
+        self.flush()
+        return self.db.get_journal_seq(self.tree_name) if self.tree_name else 0
+    
+    def clear_until(self, seq: int):
+        """명시적 저장이 끝난 뒤 seq까지의 기록 삭제"""
+        if self.tree_name:
+            self.db.clear_journal(self.tree_name, seq)
+    
+    # --- 변경 수집 ---
+    
+    def _on_model_changed(self, obj, field_name, old_value, new_value):
+        kind = journal_kind(obj)
+        if kind and self.tree_name and self.is_current(kind, obj):
+            self.touch(kind, obj)
+    
+    def touch(self, kind: str, obj):
+        """객체가 추가/변경되었음을 기록 대기열에 추가"""
+        if not self.tree_name:
+            return
+        self.pending[(kind, item_id(obj))] = obj
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def forget(self, kind: str, obj):
+        """객체가 삭제되었음을 기록 대기열에 추가"""
+        if not self.tree_name:
+            return
+        self.pending[(kind, item_id(obj))] = None
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def on_list_change(self, list_name: str, obj, inserted: bool):
+        """people/relationship_lines 목록 추가/삭제 통지"""
+        kind = 'person' if list_name == 'people' else 'line'
+        if inserted:
+            self.touch(kind, obj)
+        else:
+            self.forget(kind, obj)
+    
+    # --- 기록 ---
+    
+    def flush(self):
+        """대기 중인 변경을 저널에 기록 (객체의 현재 값을 직렬화)"""
+        self.flush_timer.stop()
+        if not self.pending or not self.tree_name:
+            self.pending.clear()
+            return
+        if self.compact_task is not None or self.is_busy():
+            # 작업 스레드가 쓰기 잠금을 잡고 있으면 기다리지 않고 다음 주기에 다시 시도
+            self.flush_timer.start()
+            return
+        records = []
+        for (kind, obj_id), obj in self.pending.items():
+            if obj is None:
+                records.append((kind, 'delete', obj_id, None))
+            else:
+                data = obj if isinstance(obj, dict) else obj.to_dict()
+                records.append((kind, 'upsert', obj_id, json.dumps(data, ensure_ascii=False)))
+        try:
+            self.db.append_journal(self.tree_name, records, AUTOSAVE_LOCK_TIMEOUT_MS)
+        except Exception as e:
+            # 자동 저장 실패가 편집을 막지 않도록 알리기만 하고, 변경은 남겨 두었다가 다시 시도
+            self.flush_timer.start()
+            self.failed.emit(str(e))
+            return
+        self.pending.clear()
+        
+        self.appended_since_compact += len(records)
+        if self.appended_since_compact >= AUTOSAVE_COMPACT_THRESHOLD:
+            self.compact()
+    
+    def compact(self):
+        """작업 스레드에서 항목별 최신 기록만 남기도록 정리"""
+        if self.compact_task is not None or not self.tree_name:
+            return
+        self.appended_since_compact = 0
+        task = DatabaseTask(Database.compact_journal, self.tree_name)
+        task.signals.finished.connect(self._on_compact_done)
+        task.signals.failed.connect(self._on_compact_done)
+        # 작업이 끝날 때까지 시그널 객체가 사라지지 않도록 참조 유지
+        self.compact_task = task
+        self.pool.start(task)
+    
+    def _on_compact_done(self, _):
+        self.compact_task = None
+
+
+def journal_kind(obj):
+    """저널 항목 종류 ('person' / 'line', 해당 없으면 None)"""
+    if isinstance(obj, Person):
+        return 'person'
+    if isinstance(obj, (RelationshipLine, dict)):
+        return 'line'
+    return None
+
+
+def item_id(obj) -> str:
+    """객체/딕셔너리의 id"""
+    return obj['id'] if isinstance(obj, dict) else obj.id
+
+
+def replay_journal(people, relationship_lines, records):
+    """저장된 가계도에 저널 기록을 순서대로 적용한 (인물 목록, 관계선 목록) 반환
+    
+    복원된 항목은 새 객체(변경 상태)이므로 다음 저장 때 기록됩니다.
+    """
+    # id -> 항목 (dict는 삽입 순서를 유지하므로 기존 항목은 제자리에서 교체됨)
+    items = {
+        'person': {p.id: p for p in people},
+        'line': {item_id(line): line for line in relationship_lines},
+    }
+    factories = {'person': Person.from_dict, 'line': RelationshipLine.from_dict}
+    for kind, op, obj_id, data in records:
+        if op == 'delete':
+            items[kind].pop(obj_id, None)
+        else:
+            items[kind][obj_id] = factories[kind](json.loads(data))
+    return list(items['person'].values()), list(items['line'].values())
@@ -0,0 +1,81 @@
+"""
+편집 한 번당 CanvasWidget.draw_tree 비용 (인물 수에 따라 늘지 않아야 함)
+
+MainWindow의 추가/수정/삭제처럼 모델을 바꾸고 공유 PersonIndex를 갱신한 뒤
+draw_tree를 호출하는 시간을 잽니다. 처음 그리기는 전체 비교이므로 따로 표시합니다.
+"""
+from common import qapp, make_people, measure, print_table
+import time
+
+from models import Person
+from person_index import PersonIndex
+from canvas_widget import CanvasWidget
+
+SIZES = (1000, 4000, 16000)
+REPEAT = 20
+# 파이썬 쪽 속성이 먼저 정리되면 종료 중 뷰 콜백이 실패하므로 끝까지 보관
+_canvases = []
+
+
+def bench(size: int):
+    people = make_people(size)
+    index = PersonIndex(people)
+    canvas = CanvasWidget(person_index=index)
+    _canvases.append(canvas)
+    
+    start = time.perf_counter()
+    canvas.draw_tree(people)
+    first_draw = (time.perf_counter() - start) * 1000
+    
+    parent = people[size // 2]
+    counter = iter(range(10 ** 6))
+    added = []
+    
+    def add_person():
+        child = Person(id=f"new{next(counter)}", name="새 인물", parentId=parent.id,
+                       x=parent.x + 50, y=parent.y + 200, relationshipType='child')
+        people.append(child)
+        index.add(child)
+        added.append(child)
+        canvas.draw_tree(people)
+    
+    def rename_person():
+        parent.name = parent.name + "*"
+        canvas.draw_tree(people)
+    
+    def move_person():
+        parent.x += 10
+        canvas.draw_tree(people)
+    
+    def delete_person():
+        # 마지막에 추가한 인물부터 삭제 (목록 끝에 있음)
+        child = added.pop()
+        people.pop()
+        index.remove(child.id)
+        canvas.draw_tree(people)
+    
+    def noop():
+        canvas.draw_tree(people)
+    
+    row = (
+        size, f"{first_draw:.0f}",
+        f"{measure(add_person, REPEAT):.2f}",
+        f"{measure(rename_person, REPEAT):.2f}",
+        f"{measure(move_person, REPEAT):.2f}",
+        f"{measure(delete_person, REPEAT):.2f}",
+        f"{measure(noop, REPEAT):.2f}",
+    )
+    canvas.detach()
+    index.detach()
+    return row
+
+
+def main():
+    qapp()
+    rows = [bench(size) for size in SIZES]
+    print("draw_tree 시간 (ms, 편집 항목은 중앙값)")
+    print_table(("인물 수", "첫 그리기", "추가", "이름 수정", "이동", "삭제", "변경 없음"), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+촌수 조회 시간: 인물 1만 명 가계도에서 KinshipIndex.relation()
+
+가까운 친족(형제자매, 부모, 사촌), 무작위 두 사람, 한 줄로 1만 세대가 이어진
+가계도의 양 끝처럼 공통 조상까지 먼 경우를 나누어 재고, 구조가 바뀐 뒤 첫 조회에
+포함되는 색인 재구성 시간도 표시합니다.
+"""
+from common import make_people, measure, print_table
+import random
+import statistics
+import time
+
+from models import Person
+from person_index import PersonIndex
+from kinship import KinshipIndex
+
+SIZE = 10000
+PAIRS = 1000
+
+
+def per_query(kinship, pairs):
+    """pairs를 한 번씩 조회한 시간(us)의 (중앙값, 최댓값)"""
+    times = []
+    for a_id, b_id in pairs:
+        start = time.perf_counter()
+        kinship.relation(a_id, b_id)
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times), max(times)
+
+
+def close_pairs(people, rng):
+    """형제자매/부모/사촌 쌍"""
+    by_id = {p.id: p for p in people}
+    children = {}
+    for person in people:
+        if person.parentId:
+            children.setdefault(person.parentId, []).append(person)
+    pairs = []
+    while len(pairs) < PAIRS:
+        person = rng.choice([p for p in people if p.parentId])
+        parent = by_id[person.parentId]
+        siblings = children[parent.id]
+        pairs.append((person.id, rng.choice(siblings).id))
+        pairs.append((person.id, parent.id))
+        if parent.parentId:
+            uncles = children[parent.parentId]
+            cousins = [c for u in uncles for c in children.get(u.id, ())]
+            if cousins:
+                pairs.append((person.id, rng.choice(cousins).id))
+    return pairs[:PAIRS]
+
+
+def chain_people(count: int):
+    """한 세대에 한 명씩 count세대가 이어진 가계도"""
+    return [Person(id=f"c{i:06d}", name=str(i), parentId=f"c{i - 1:06d}" if i else None)
+            for i in range(count)]
+
+
+def bench(label, people, pairs):
+    index = PersonIndex(people)
+    kinship = KinshipIndex(index)
+    try:
+        # 첫 조회는 색인 구성 포함
+        start = time.perf_counter()
+        kinship.relation(*pairs[0])
+        build_ms = (time.perf_counter() - start) * 1000
+        median_us, max_us = per_query(kinship, pairs)
+        # 구조 편집(부모 변경) 뒤 첫 조회는 색인 전체를 다시 구성
+        person = next(p for p in people if p.parentId)
+        
+        def edit_then_query():
+            parent_id = person.parentId
+            person.parentId = None
+            person.parentId = parent_id
+            kinship.relation(*pairs[0])
+        
+        rebuild_ms = measure(edit_then_query)
+        return (label, len(people), len(pairs), f"{median_us:.0f}", f"{max_us:.0f}",
+                f"{build_ms:.0f}", f"{rebuild_ms:.0f}")
+    finally:
+        index.detach()
+
+
+def main():
+    rng = random.Random(0)
+    people = make_people(SIZE)
+    ids = [p.id for p in people]
+    chain = chain_people(SIZE)
+    rows = [
+        bench("가까운 친족", people, close_pairs(people, rng)),
+        bench("무작위 두 사람", people, [tuple(rng.sample(ids, 2)) for _ in range(PAIRS)]),
+        bench("1만 세대 양 끝", chain, [(chain[0].id, chain[-1].id)] * 20),
+        bench("1만 세대 무작위", chain, [(chain[rng.randrange(SIZE)].id, chain[rng.randrange(SIZE)].id)
+                                     for _ in range(PAIRS)]),
+    ]
+    print(f"KinshipIndex.relation() 조회 (인물 {SIZE}명)")
+    print_table(("경우", "인물 수", "조회 수", "조회 중앙값(us)", "조회 최댓값(us)",
+                 "첫 색인 구성(ms)", "편집 후 첫 조회(ms)"), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+감정 관계선 끝점 드래그: 마우스 이동 1,000번의 갱신/그리기 시간과 장면 아이템 수
+
+관계선 종류마다 장면에 선 하나를 놓고 끝점을 누른 뒤 원을 그리며 끌어
+mouseMoveEvent를 1,000번 보냅니다. 갱신만 한 시간과, 이동마다 선 주변 화면을
+다시 그린 시간을 따로 재고, 드래그 전후 장면 아이템 수가 같은지 확인합니다.
+"""
+from common import qapp, print_table
+import math
+import time
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QGraphicsScene
+
+from models import RelationshipLine
+from relationship_line_item import RelationshipLineItem
+
+MOVES = 1000
+LINE_TYPES = ('intimate-one', 'intimate-two', 'distant-one', 'distant-two', 'conflict-one', 'conflict-two')
+REPEAT = 3
+
+
+class DragEvent:
+    """드래그 처리에 쓰이는 부분만 있는 마우스 이벤트 (PyQt6에서는 장면 마우스 이벤트를 만들 수 없음)"""
+    
+    def __init__(self, pos: QPointF):
+        self._pos = pos
+    
+    def button(self):
+        return Qt.MouseButton.LeftButton
+    
+    def scenePos(self):
+        return self._pos
+    
+    def accept(self):
+        pass
+
+
+def drag_end(line_type: str, render: bool):
+    """끝점을 MOVES번 끄는 시간 (ms)과 드래그 전후 장면 아이템 수"""
+    scene = QGraphicsScene()
+    line = RelationshipLine(id='line', lineType=line_type, x1=0, y1=0, x2=300, y2=0)
+    item = RelationshipLineItem(line)
+    scene.addItem(item)
+    image = QImage(800, 800, QImage.Format.Format_ARGB32_Premultiplied)
+    source = QRectF(-400, -400, 800, 800)
+    items_before = len(scene.items())
+    
+    item.mousePressEvent(DragEvent(QPointF(300, 0)))
+    # 이벤트 객체는 미리 만들어 두고 이동 처리만 잼
+    events = [
+        DragEvent(QPointF(300 * math.cos(i * 0.01), 300 * math.sin(i * 0.01)))
+        for i in range(1, MOVES + 1)
+    ]
+    painter = QPainter(image)
+    start = time.perf_counter()
+    for event in events:
+        item.mouseMoveEvent(event)
+        if render:
+            scene.render(painter, QRectF(image.rect()), source)
+    elapsed = (time.perf_counter() - start) * 1000
+    painter.end()
+    item.dragging_state = None
+    return elapsed, items_before, len(scene.items())
+
+
+def main():
+    qapp()
+    rows = []
+    for line_type in LINE_TYPES:
+        update = min(drag_end(line_type, False)[0] for _ in range(REPEAT))
+        results = [drag_end(line_type, True) for _ in range(REPEAT)]
+        render = min(elapsed for elapsed, _, _ in results)
+        _, items_before, items_after = results[0]
+        rows.append((line_type, f"{update:.0f}", f"{render:.0f}", items_before, items_after))
+    print(f"끝점 드래그 이동 {MOVES}번 시간 (ms, {REPEAT}회 중 최솟값)")
+    print_table(("선 종류", "갱신만", "갱신+그리기", "드래그 전 아이템", "드래그 후 아이템"), rows)
+
+
+if __name__ == '__main__':
+    main()
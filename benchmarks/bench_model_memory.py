@@ -0,0 +1,104 @@
+"""
+인물 10만 명의 모델 객체 메모리 (인물당 바이트): 슬롯 모델과 이전 dataclass 비교
+
+필드 값(문자열, 좌표)은 두 방식이 같은 객체를 공유하도록 미리 만들어 두고,
+tracemalloc으로 객체 자체가 새로 차지하는 메모리만 잽니다 (보관 목록의
+항목 포인터 8바이트 포함). 직렬화는
+to_dict()와 to_tuple() 결과를 모두 보관할 때의 메모리와 변환 시간을 비교합니다.
+"""
+from common import make_people, make_lines, measure, print_table
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+from models import Person, RelationshipLine
+
+COUNT = 100000
+
+
+@dataclass
+class LegacyPerson:
+    """변경 전 Person (인스턴스마다 __dict__, 저장 후 _dirty 항목 추가)"""
+    id: str
+    name: str
+    birthYear: Optional[str] = None
+    gender: str = "male"
+    isDeceased: bool = False
+    nodeType: str = "person"
+    x: float = 0.0
+    y: float = 0.0
+    parentId: Optional[str] = None
+    spouseId: Optional[str] = None
+    relationshipType: Optional[str] = None
+    multipleBirthGroupId: Optional[str] = None
+    nextIdenticalSiblingId: Optional[str] = None
+
+
+@dataclass
+class LegacyRelationshipLine:
+    """변경 전 RelationshipLine"""
+    id: str
+    lineType: str
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+
+def traced_bytes(build):
+    """build()가 반환한 객체를 보관한 채 늘어난 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used
+
+
+def legacy_objects(cls, values):
+    objects = []
+    for value in values:
+        obj = cls(*value)
+        # 저장/불러오기 후 mark_clean()이 인스턴스 __dict__에 남기던 표시
+        obj._dirty = False
+        objects.append(obj)
+    return objects
+
+
+def slotted_objects(cls, values):
+    objects = [cls.from_tuple(value) for value in values]
+    for obj in objects:
+        obj.mark_clean()
+    return objects
+
+
+def bench(label, legacy_cls, cls, values):
+    count = len(values)
+    legacy = traced_bytes(lambda: legacy_objects(legacy_cls, values)) / count
+    slotted = traced_bytes(lambda: slotted_objects(cls, values)) / count
+    objects = slotted_objects(cls, values)
+    as_dict = traced_bytes(lambda: [obj.to_dict() for obj in objects]) / count
+    as_tuple = traced_bytes(lambda: [obj.to_tuple() for obj in objects]) / count
+    dict_ms = measure(lambda: [obj.to_dict() for obj in objects])
+    tuple_ms = measure(lambda: [obj.to_tuple() for obj in objects])
+    return (
+        (label, "객체", f"{legacy:.0f}", f"{slotted:.0f}", f"{legacy / slotted:.2f}x"),
+        (label, "직렬화", f"{as_dict:.0f}", f"{as_tuple:.0f}", f"{as_dict / as_tuple:.2f}x"),
+        (label, "직렬화 ms", f"{dict_ms:.1f}", f"{tuple_ms:.1f}", f"{dict_ms / tuple_ms:.2f}x"),
+    )
+
+
+def main():
+    people = make_people(COUNT)
+    lines = make_lines(people, COUNT)
+    rows = bench("Person", LegacyPerson, Person, [p.to_tuple() for p in people])
+    rows += bench("RelationshipLine", LegacyRelationshipLine, RelationshipLine, [l.to_tuple() for l in lines])
+    print(f"{COUNT}개 기준 객체 하나당 바이트 (직렬화 ms는 전체 변환 시간 중앙값)")
+    print_table(("모델", "항목", "dataclass/to_dict", "__slots__/to_tuple", "비율"), rows)
+
+
+if __name__ == '__main__':
+    main()
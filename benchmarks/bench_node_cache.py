@@ -0,0 +1,89 @@
+"""
+노드 1만 개 장면을 이동(pan)/확대·축소(zoom)하며 그릴 때 본체 그림 캐시의 효과
+
+1280x800 화면을 연속으로 그려 드래그 이동과 휠 확대·축소를 흉내 냅니다.
+캐시를 끄면 모든 배율에서 노드 본체를 매번 직접 그립니다. 캐시를 켠 쪽은
+QPixmapCache를 비운 상태에서 시작하므로 처음 그림을 만드는 비용도 포함됩니다.
+"""
+from common import qapp, make_people, node_scene, render_frame, print_table
+import statistics
+import time
+from contextlib import contextmanager
+
+from PyQt6.QtGui import QImage, QPixmapCache
+
+import person_node
+
+COUNT = 10000
+FRAMES = 60
+
+
+@contextmanager
+def cache_disabled():
+    """모든 배율에서 캐시하지 않고 직접 그리도록"""
+    saved = person_node.NODE_CACHE_MAX_SCALE
+    person_node.NODE_CACHE_MAX_SCALE = -1.0
+    try:
+        yield
+    finally:
+        person_node.NODE_CACHE_MAX_SCALE = saved
+
+
+def pan_frames(center, zoom: float):
+    """zoom 배율에서 화면을 오른쪽 아래로 한 프레임에 20px씩 끄는 동안의 (중심, 배율)"""
+    step = 20 / zoom
+    return [((center[0] + i * step, center[1] + i * step / 2), zoom) for i in range(FRAMES)]
+
+
+def zoom_frames(center, low: float, high: float):
+    """low에서 high까지 휠로 확대했다가 다시 축소하는 동안의 (중심, 배율)"""
+    half = FRAMES // 2
+    ratio = (high / low) ** (1 / (half - 1))
+    zooms = [low * ratio ** i for i in range(half)]
+    return [(center, zoom) for zoom in zooms + zooms[::-1]]
+
+
+def frame_times(scene, image, frames):
+    """프레임마다 그린 시간 (ms) 목록"""
+    QPixmapCache.clear()
+    times = []
+    for center, zoom in frames:
+        start = time.perf_counter()
+        render_frame(scene, image, center, zoom)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    qapp()
+    people = make_people(COUNT)
+    for person in people[::5]:
+        person.isDeceased = True
+    scene, center = node_scene(people)
+    image = QImage(1280, 800, QImage.Format.Format_ARGB32_Premultiplied)
+    
+    scenarios = (
+        ("이동 x1.0", pan_frames(center, 1.0)),
+        ("이동 x0.5", pan_frames(center, 0.5)),
+        ("이동 x0.3", pan_frames(center, 0.3)),
+        ("확대/축소 0.3~3.0", zoom_frames(center, 0.3, 3.0)),
+    )
+    rows = []
+    for label, frames in scenarios:
+        # 첫 그리기의 글자 배치 등 공통 준비 비용을 양쪽에서 빼기 위해 한 번 미리 그림
+        frame_times(scene, image, frames[:1])
+        with cache_disabled():
+            direct = frame_times(scene, image, frames)
+        cached = frame_times(scene, image, frames)
+        rows.append((
+            label,
+            f"{statistics.median(direct):.1f}", f"{statistics.median(cached):.1f}",
+            f"{max(direct):.1f}", f"{max(cached):.1f}",
+            f"{sum(direct) / sum(cached):.2f}x",
+        ))
+    print(f"인물 {COUNT}명, {FRAMES}프레임 그리기 시간 (ms)")
+    print_table(("동작", "캐시 끔 중앙값", "캐시 켬 중앙값", "캐시 끔 최대", "캐시 켬 최대", "전체 향상"), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+화면 배율별 PersonNode 그리기 시간: 세부 표시 단계(LOD)를 켰을 때와 껐을 때
+
+1280x800 화면 한 장을 여러 배율로 그립니다. LOD를 끄면 배율과 관계없이
+글자와 둥근 모서리, 안티에일리어싱까지 모두 그립니다 (본체 그림 캐시는 그대로).
+"""
+from common import qapp, make_people, node_scene, render_frame, measure, print_table
+from contextlib import contextmanager
+
+from PyQt6.QtGui import QImage
+
+import person_node
+
+COUNT = 10000
+ZOOMS = (2.0, 1.0, 0.5, 0.3, 0.15, 0.05)
+REPEAT = 10
+
+
+@contextmanager
+def lod_disabled():
+    """모든 배율에서 가장 자세히 그리도록 LOD 기준값을 0으로"""
+    names = ('NODE_LOD_TEXT', 'NODE_LOD_SIMPLE', 'NODE_LOD_DOT')
+    saved = {name: getattr(person_node, name) for name in names}
+    for name in names:
+        setattr(person_node, name, 0.0)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(person_node, name, value)
+
+
+def main():
+    qapp()
+    people = make_people(COUNT)
+    scene, center = node_scene(people)
+    image = QImage(1280, 800, QImage.Format.Format_ARGB32_Premultiplied)
+    
+    rows = []
+    for zoom in ZOOMS:
+        source = render_frame(scene, image, center, zoom)
+        visible = len(scene.items(source))
+        with lod_disabled():
+            full = measure(lambda: render_frame(scene, image, center, zoom), REPEAT)
+        lod = measure(lambda: render_frame(scene, image, center, zoom), REPEAT)
+        rows.append((zoom, visible, f"{full:.1f}", f"{lod:.1f}", f"{full / lod:.1f}x"))
+    print(f"인물 {COUNT}명, 화면 한 장 그리기 시간 (ms, {REPEAT}회 중앙값)")
+    print_table(("배율", "보이는 노드", "LOD 끔", "LOD 켬", "향상"), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+저장 시 행 기록: 행마다 execute와 executemany 비교 (인물 1만/10만 명)
+
+앱의 저장 경로인 Database.write_snapshot을 그대로 실행하되, 커서를 감싸
+executemany를 행마다 execute로 바꾼 경우와 비교합니다. 새 가계도를 처음 저장할 때
+(모든 행 삽입, 폐쇄 테이블 채우기 포함)와 모든 인물을 옮긴 뒤 다시 저장할 때
+(모든 행 갱신)를 재며, 전체 시간과 그중 행을 기록한 시간을 따로 표시합니다.
+"""
+from common import temp_database, make_people, make_lines, print_table
+import statistics
+import time
+
+from database import snapshot_rows
+
+SIZES = (10000, 100000)
+REPEAT = {10000: 4, 100000: 2}
+
+
+class RowWriteTimer:
+    """executemany에 걸린 시간을 모으는 커서 래퍼 (per_row면 행마다 execute로 실행)"""
+    
+    def __init__(self, cursor, per_row: bool):
+        self._cursor = cursor
+        self.per_row = per_row
+        self.seconds = 0.0
+    
+    def executemany(self, sql, rows):
+        rows = list(rows)
+        start = time.perf_counter()
+        if self.per_row:
+            for row in rows:
+                self._cursor.execute(sql, row)
+        else:
+            self._cursor.executemany(sql, rows)
+        self.seconds += time.perf_counter() - start
+        return self._cursor
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def timed_snapshot(db, tree_name, people, lines, per_row: bool):
+    """write_snapshot 한 번의 (전체 ms, 행 기록 ms)"""
+    person_rows, line_rows = snapshot_rows(tree_name, people, lines)
+    cursor = db.cursor
+    timer = db.cursor = RowWriteTimer(cursor, per_row)
+    try:
+        start = time.perf_counter()
+        db.write_snapshot(tree_name, person_rows, line_rows)
+        total = (time.perf_counter() - start) * 1000
+    finally:
+        db.cursor = cursor
+    for obj in people + lines:
+        obj.mark_clean()
+    return total, timer.seconds * 1000
+
+
+def bench(db, size: int):
+    people = make_people(size, prefix=f"s{size}_")
+    lines = make_lines(people, size // 10)
+    runs = {True: ([], []), False: ([], [])}
+    # 앞선 실행으로 DB 파일이 커지는 영향을 없애도록 두 방식을 번갈아, 순서도 바꿔 가며 실행
+    for run in range(REPEAT[size]):
+        for per_row in ((True, False) if run % 2 == 0 else (False, True)):
+            first, resave = runs[per_row]
+            tree_name = f"bench{size}_{'row' if per_row else 'many'}_{run}"
+            for obj in people + lines:
+                obj.mark_dirty()
+            first.append(timed_snapshot(db, tree_name, people, lines, per_row))
+            # 모든 인물을 옮겨 좌표만 바뀐 행을 다시 저장
+            for person in people:
+                person.x += 1
+            resave.append(timed_snapshot(db, tree_name, people, lines, per_row))
+            db.delete_tree(tree_name)
+    results = {
+        per_row: [tuple(statistics.median(values) for values in zip(*case)) for case in cases]
+        for per_row, cases in runs.items()
+    }
+    rows = []
+    for label, index in (("처음 저장", 0), ("다시 저장", 1)):
+        (row_total, row_write), (many_total, many_write) = results[True][index], results[False][index]
+        rows.append((
+            size, label, f"{row_total:.0f}", f"{many_total:.0f}",
+            f"{row_write:.0f}", f"{many_write:.0f}", f"{row_write / many_write:.2f}x",
+        ))
+    return rows
+
+
+def main():
+    db = temp_database()
+    try:
+        rows = [row for size in SIZES for row in bench(db, size)]
+    finally:
+        db.close()
+    print("write_snapshot 시간 (ms, 관계선은 인물 수의 1/10, 1만 명 4회/10만 명 2회 중앙값)")
+    print_table(("인물 수", "경우", "전체(행마다)", "전체(executemany)",
+                 "행 기록(행마다)", "행 기록(executemany)", "행 기록 향상"), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+가계도 1,000개가 든 데이터베이스에서 가계도 하나를 불러오기/저장/삭제하는 시간
+
+인덱스가 없던 스키마로 파일을 만들어 채운 뒤 Database()로 열어 제자리
+마이그레이션(스키마 버전 기록)을 확인하고, tree_name으로 시작하는 인덱스가
+있을 때와 지웠을 때(마이그레이션 전과 같은 전체 테이블 스캔)를 비교합니다.
+"""
+from common import temp_db_path, make_people, make_lines, print_table
+import sqlite3
+import statistics
+import time
+from types import SimpleNamespace
+
+from database import Database, INSERT_PERSON_SQL, INSERT_LINE_SQL, person_row, line_row
+
+TREES = 1000
+PEOPLE_PER_TREE = 100
+LINES_PER_TREE = 10
+CALLS = 20
+# tree_name으로 시작해 가계도 하나만 고르는 인덱스
+TREE_INDEXES = ('idx_people_tree_person', 'idx_lines_tree_line', 'idx_people_position')
+
+
+def create_legacy_file(path: str):
+    """마이그레이션 전 스키마(인덱스 없음)로 가계도 TREES개를 채운 파일"""
+    conn = sqlite3.connect(path)
+    Database.create_tables(SimpleNamespace(conn=conn, cursor=conn.cursor()))
+    people = make_people(PEOPLE_PER_TREE)
+    lines = make_lines(people, LINES_PER_TREE)
+    for t in range(TREES):
+        name = f"tree{t:04d}"
+        conn.execute('INSERT INTO FamilyTrees (tree_name) VALUES (?)', (name,))
+        conn.executemany(INSERT_PERSON_SQL, [person_row(name, p) for p in people])
+        conn.executemany(INSERT_LINE_SQL, [line_row(name, line) for line in lines])
+    conn.commit()
+    conn.close()
+
+
+def per_call(func, names):
+    """가계도마다 func를 한 번씩 호출한 시간(ms)의 중앙값"""
+    times = []
+    for name in names:
+        start = time.perf_counter()
+        func(name)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def bench(db, offset: int):
+    # 가계도마다 다른 이름을 써서 삭제한 가계도를 다시 고르지 않음
+    names = [f"tree{t:04d}" for t in range(offset, TREES, TREES // CALLS)][:CALLS]
+    loaded = {name: db.load_tree(name) for name in names}
+    assert all(len(people) == PEOPLE_PER_TREE for people, _ in loaded.values())
+    return (
+        per_call(db.load_tree, names),
+        per_call(db.count_people, names),
+        per_call(lambda name: db.save_tree(name, *loaded[name]), names),
+        per_call(db.delete_tree, names),
+    )
+
+
+def main():
+    create_legacy_file(temp_db_path())
+    
+    start = time.perf_counter()
+    db = Database()
+    migrate_ms = (time.perf_counter() - start) * 1000
+    try:
+        version = db.cursor.execute('SELECT MAX(version) FROM SchemaVersion').fetchone()[0]
+        indexes = [row[0] for row in db.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%' ORDER BY name"
+        )]
+        print(f"가계도 {TREES}개 x 인물 {PEOPLE_PER_TREE}명, 관계선 {LINES_PER_TREE}개")
+        print(f"제자리 마이그레이션: {migrate_ms:.0f} ms, 스키마 버전 {version}")
+        print(f"인덱스: {', '.join(indexes)}")
+        print()
+        
+        with_index = bench(db, 0)
+        for name in TREE_INDEXES:
+            db.cursor.execute(f'DROP INDEX {name}')
+        db.conn.commit()
+        without_index = bench(db, 1)
+    finally:
+        db.close()
+    
+    rows = [
+        (label, f"{before:.2f}", f"{after:.2f}", f"{before / after:.1f}x")
+        for label, before, after in zip(
+            ("load_tree", "count_people", "save_tree", "delete_tree"), without_index, with_index
+        )
+    ]
+    print(f"가계도 하나 처리 시간 (ms, {CALLS}회 중앙값)")
+    print_table(("작업", "인덱스 없음", "인덱스 있음", "향상"), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+벤치마크 공통 도구: 화면 없이 Qt 실행, 임시 데이터베이스, 예제 가계도 생성
+
+각 벤치마크는 저장소 최상위에서 `python benchmarks/bench_xxx.py`로 실행합니다.
+"""
+import os
+import sys
+import time
+import tempfile
+import statistics
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from models import Person, RelationshipLine
+
+
+_app = None
+
+
+def qapp():
+    """QApplication (이미 있으면 재사용, 벤치마크가 끝날 때까지 보관)"""
+    global _app
+    from PyQt6.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def temp_db_path():
+    """database.DB_PATH를 새 임시 파일 경로로 바꾸고 반환 (실제 familytree.db는 건드리지 않음)"""
+    import database
+    database.DB_PATH = os.path.join(tempfile.mkdtemp(prefix='familytree_bench_'), 'bench.db')
+    return database.DB_PATH
+
+
+def temp_database():
+    """임시 파일을 사용하는 Database"""
+    import database
+    temp_db_path()
+    return database.Database()
+
+
+def make_people(count: int, prefix: str = 'p'):
+    """부부와 자녀 2~3명이 세대마다 이어지는 예제 가계도 (좌표는 세대별 격자)
+    
+    인물의 절반 가량은 배우자이고, 다태아 그룹과 일란성 쌍둥이도 일부 포함합니다.
+    """
+    people = []
+    generation_x = {}
+    
+    def new_person(parent_id=None, generation=0, **fields):
+        x = generation_x.get(generation, 0)
+        generation_x[generation] = x + 150
+        person = Person(
+            id=f"{prefix}{len(people):06d}",
+            name=f"인물{len(people)}",
+            birthYear=str(1900 + generation * 25),
+            gender='male' if len(people) % 2 == 0 else 'female',
+            x=float(x),
+            y=float(generation * 200),
+            parentId=parent_id,
+            **fields
+        )
+        people.append(person)
+        return person
+    
+    queue = [(new_person(), 0)]
+    while queue and len(people) < count:
+        person, generation = queue.pop(0)
+        spouse = new_person(generation=generation, spouseId=person.id, relationshipType='spouse')
+        person.spouseId = spouse.id
+        num_children = 2 + len(people) % 2
+        twins = len(people) % 7 == 0
+        previous = None
+        for i in range(num_children):
+            if len(people) >= count:
+                break
+            child = new_person(person.id, generation + 1, relationshipType='child')
+            if twins and i < 2:
+                child.multipleBirthGroupId = f"g{person.id}"
+                if previous is not None:
+                    previous.nextIdenticalSiblingId = child.id
+                previous = child
+            queue.append((child, generation + 1))
+    for person in people:
+        person.mark_clean()
+    return people[:count]
+
+
+def make_lines(people, count: int):
+    """인물 좌표를 잇는 감정 관계선 목록"""
+    types = ('intimate-one', 'intimate-two', 'distant-one', 'distant-two', 'conflict-one', 'conflict-two')
+    lines = []
+    for i in range(count):
+        a = people[(i * 7) % len(people)]
+        b = people[(i * 13 + 1) % len(people)]
+        lines.append(RelationshipLine(
+            id=f"line{i:06d}", lineType=types[i % len(types)],
+            x1=a.x, y1=a.y, x2=b.x, y2=b.y
+        ))
+    return lines
+
+
+def node_scene(people, columns: int = 100):
+    """인물마다 PersonNode를 columns열 격자(150x120 간격)에 놓은 QGraphicsScene과 가운데 좌표
+    
+    화면 한 장에 보이는 노드 수가 배율에 따라 고르게 늘도록 가계도 좌표 대신 격자를
+    사용합니다. 첫 인물이 중심인물입니다.
+    """
+    from PyQt6.QtWidgets import QGraphicsScene
+    from person_node import PersonNode
+    scene = QGraphicsScene()
+    for i, person in enumerate(people):
+        node = PersonNode(person, is_center=(i == 0))
+        node.setPos(i % columns * 150, i // columns * 120)
+        scene.addItem(node)
+    rows = (len(people) + columns - 1) // columns
+    return scene, ((columns - 1) * 150 / 2, (rows - 1) * 120 / 2)
+
+
+def render_frame(scene, image, center, zoom: float):
+    """center를 가운데 두고 zoom 배율로 본 화면 한 장을 image에 그리기"""
+    from PyQt6.QtCore import QRectF, Qt
+    from PyQt6.QtGui import QPainter
+    width, height = image.width() / zoom, image.height() / zoom
+    source = QRectF(center[0] - width / 2, center[1] - height / 2, width, height)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(image.rect()), source, Qt.AspectRatioMode.IgnoreAspectRatio)
+    painter.end()
+    return source
+
+
+def measure(func, repeat: int = 5):
+    """func를 repeat번 실행한 시간(ms)의 중앙값"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def print_table(headers, rows):
+    """결과 표 출력"""
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print('  '.join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print('  '.join(str(c).rjust(w) for c, w in zip(row, widths)))
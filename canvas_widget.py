@@ -1,17 +1,28 @@
 from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsLineItem, QGraphicsPathItem
-from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt6.QtCore import Qt, QPointF, QRectF, QTimer, pyqtSignal
 from PyQt6.QtGui import QPen, QColor, QBrush, QPainterPath, QTransform, QPainter
+from PyQt6 import sip
 from typing import List, Optional, Set
-from models import Person
-from person_node import PersonNode
-from config import NODE_WIDTH, NODE_HEIGHT, TEXT_COLOR
+from models import Person, add_change_listener, remove_change_listener
+from person_node import PersonNode, BODY_RECT
+from person_index import PersonIndex
+from config import NODE_WIDTH, NODE_HEIGHT, TEXT_COLOR, LINE_REDRAW_INTERVAL_MS, VIEWPORT_SIGNAL_DELAY_MS
+
+def spouse_unit_key(person_id: str, spouse_id: str):
+    """부부 단위 키 (어느 쪽에서 찾아도 같도록 ID 순서로 정렬)"""
+    if spouse_id < person_id:
+        person_id, spouse_id = spouse_id, person_id
+    return ('spouse', person_id, spouse_id)
+
 
 class CanvasWidget(QGraphicsView):
     """가계도를 그리는 캔버스 위젯"""
     
     person_selected = pyqtSignal(object)
+    # 스크롤/확대/크기 변경 후 보이는 씬 영역 (움직임이 멈추면 한 번 발생)
+    viewport_changed = pyqtSignal(QRectF)
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, person_index: Optional[PersonIndex] = None):
         super().__init__(parent)
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
@@ -37,11 +48,73 @@ class CanvasWidget(QGraphicsView):
         
         # 데이터
         self.people: List[Person] = []
+        # 인덱스를 전달받지 않으면 draw_tree 때마다 직접 구성
+        self._owns_index = person_index is None
+        self.person_index = person_index if person_index is not None else PersonIndex()
         self.node_map = {}  # person.id -> PersonNode 매핑
-        self.line_items = []  # 관계선 아이템 저장
+        self.line_items = {}  # 관계선 키 -> 관계선 아이템
+        self.emotional_line_items = {}  # line.id -> RelationshipLineItem
+        self._live_line_keys = set()  # 현재 그리는 단위에서 사용된 관계선 키
+        self.connector_units = {}  # 단위 키 -> 단위를 구성하는 인물 ID
+        self.person_connectors = {}  # person.id -> 그 인물이 관여하는 단위 키 집합
+        self.unit_line_keys = {}  # 단위 키 -> 단위가 그린 관계선 키 집합
+        self.unit_related = {}  # 단위 키 -> 단위 모양에 영향을 주는 인물 ID 집합
+        self.line_owners = {}  # 관계선 키 -> 그 선을 마지막으로 그린 단위 키
+        self._drawing_unit = None  # 지금 그리고 있는 단위 키
+        
+        # 지난 draw_tree 이후 바뀐 인물 (다음 draw_tree에서 이 인물과 관련 선만 갱신)
+        self._changed_ids: Set[str] = set()
+        self._full_sync = True  # 처음 그리거나 인덱스가 다시 구성되면 전체 비교
+        self._center_person_id = None
+        add_change_listener(self._on_model_changed)
+        self.person_index.add_listener(self._on_index_changed)
+        
+        # 드래그 중 관계선 갱신을 한 프레임에 한 번으로 모으는 스케줄러
+        self._dirty_connector_units = set()
+        self._line_flush_timer = QTimer(self)
+        self._line_flush_timer.setSingleShot(True)
+        self._line_flush_timer.setInterval(LINE_REDRAW_INTERVAL_MS)
+        self._line_flush_timer.timeout.connect(self.flush_line_updates)
+        self.line_flush_count = 0  # 지금까지 실행된 관계선 갱신 횟수
+        self._syncing_nodes = False  # 노드 동기화 중에는 선 재계산 생략
+        self._content_rect = QRectF()  # 씬에 그려진 내용의 범위
+        self._content_shrunk = False  # 범위 가장자리에 닿던 아이템이 사라지거나 옮겨짐 (다시 계산 필요)
+        self._included_rect = QRectF()  # include_scene_rect로 넓힌 범위 (지연 불러오기)
+        self._label_overhang = 0.0  # 글자가 노드 본체 옆으로 나온 최대 길이 (범위 재계산용)
+        self.selection_order: List[str] = []  # 선택된 인물 ID (선택한 순서)
+        
+        # 보이는 영역 변경 알림을 모아서 한 번만 보내는 타이머
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(VIEWPORT_SIGNAL_DELAY_MS)
+        self._viewport_timer.timeout.connect(lambda: self.viewport_changed.emit(self.visible_scene_rect()))
+    
+    def detach(self):
+        """모델 변경/인덱스 알림 수신 중단"""
+        remove_change_listener(self._on_model_changed)
+        self.person_index.remove_listener(self._on_index_changed)
+    
+    def _on_model_changed(self, obj, field_name, old_value, new_value):
+        """그려진(또는 인덱스에 있는) 인물의 필드가 바뀌면 다음 draw_tree의 갱신 대상으로 표시"""
+        if isinstance(obj, Person) and (obj.id in self.node_map or obj.id in self.person_index):
+            self._changed_ids.add(obj.id)
+    
+    def _on_index_changed(self, person_id):
+        """인덱스에 인물이 추가/삭제되면 갱신 대상으로 표시 (인덱스를 비우면 전체 비교)"""
+        if person_id is None:
+            self._full_sync = True
+        else:
+            self._changed_ids.add(person_id)
     
     def on_selection_changed(self):
-        """선택 변경 시 시그널 발생"""
+        """선택 변경 시 선택 순서 갱신 후 시그널 발생"""
+        if sip.isdeleted(self.scene):
+            # 종료 중 씬이 정리되면서 선택이 풀리는 경우
+            return
+        selected = [item.person.id for item in self.scene.selectedItems() if isinstance(item, PersonNode)]
+        still_selected = set(selected)
+        self.selection_order = [pid for pid in self.selection_order if pid in still_selected]
+        self.selection_order += [pid for pid in selected if pid not in self.selection_order]
         person = self.get_selected_person()
         self.person_selected.emit(person)
 
@@ -52,6 +125,60 @@ class CanvasWidget(QGraphicsView):
             self.scale(zoom_factor, zoom_factor)
         else:
             self.scale(1/zoom_factor, 1/zoom_factor)
+        self._viewport_timer.start()
+    
+    def scrollContentsBy(self, dx, dy):
+        """스크롤 시 보이는 영역 변경 알림 예약"""
+        super().scrollContentsBy(dx, dy)
+        self._viewport_timer.start()
+    
+    def resizeEvent(self, event):
+        """크기 변경 시 보이는 영역 변경 알림 예약"""
+        super().resizeEvent(event)
+        self._viewport_timer.start()
+    
+    def visible_scene_rect(self) -> QRectF:
+        """현재 화면에 보이는 씬 영역"""
+        return self.mapToScene(self.viewport().rect()).boundingRect()
+    
+    def include_scene_rect(self, rect: QRectF):
+        """아직 그리지 않은 영역까지 스크롤할 수 있도록 씬 범위 확장 (지연 불러오기용)"""
+        self._included_rect = self._included_rect.united(rect)
+        self._content_rect = self._content_rect.united(rect)
+        self.scene.setSceneRect(self._content_rect.adjusted(-100, -100, 100, 100))
+    
+    def _forget_item_rect(self, rect: QRectF):
+        """사라지거나 옮겨지는 아이템의 이전 범위 (가장자리에 닿아 있었으면 범위를 다시 계산)"""
+        content = self._content_rect
+        if (rect.left() <= content.left() or rect.top() <= content.top()
+                or rect.right() >= content.right() or rect.bottom() >= content.bottom()):
+            self._content_shrunk = True
+    
+    def content_bounds(self) -> QRectF:
+        """그려진 노드와 감정 관계선을 감싸는 범위를 좌표 저장소에서 다시 계산
+        
+        노드 범위는 인물 좌표 범위를 본체 크기만큼 넓혀 구하고, 글자가 본체보다 넓은
+        노드가 범위를 넓힐 수 있는 왼쪽/오른쪽 끝 부근의 노드만 따로 확인합니다.
+        """
+        rect = QRectF(self._included_rect)
+        coords = self.person_index.coords
+        bounds = coords.bounds() if self.node_map else None
+        if bounds is not None:
+            min_x, min_y, max_x, max_y = bounds
+            rect = rect.united(QRectF(QPointF(min_x, min_y), QPointF(max_x, max_y)).adjusted(
+                BODY_RECT.left(), BODY_RECT.top(), BODY_RECT.right(), BODY_RECT.bottom()
+            ))
+            overhang = self._label_overhang
+            if overhang > 0:
+                edge_ids = coords.ids_in_rect(min_x, min_y, min_x + overhang, max_y) + \
+                    coords.ids_in_rect(max_x - overhang, min_y, max_x, max_y)
+                for person_id in edge_ids:
+                    node = self.node_map.get(person_id)
+                    if node is not None:
+                        rect = rect.united(node.sceneBoundingRect())
+        for item in self.emotional_line_items.values():
+            rect = rect.united(item.sceneBoundingRect())
+        return rect
     
     def mousePressEvent(self, event):
         """마우스 버튼 눌림"""
@@ -67,6 +194,13 @@ class CanvasWidget(QGraphicsView):
             item = self.itemAt(event.pos())
             if isinstance(item, PersonNode) or (item and isinstance(item.parentItem(), PersonNode)):
                 node = item if isinstance(item, PersonNode) else item.parentItem()
+                # 클릭한 노드 선택 (Ctrl을 누르면 기존 선택에 추가)
+                if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                    node.setSelected(True)
+                elif not node.isSelected():
+                    self.scene.clearSelection()
+                    node.setSelected(True)
+                
                 self.dragging_nodes = True
                 self.drag_start_pos = event.pos()
                 self.current_drag_axis = None
@@ -78,8 +212,8 @@ class CanvasWidget(QGraphicsView):
                 if not (event.modifiers() & Qt.KeyboardModifier.ControlModifier):
                     if node.person.multipleBirthGroupId:
                         group_id = node.person.multipleBirthGroupId
-                        for person in self.people:
-                            if person.multipleBirthGroupId == group_id and person.id != node.person.id:
+                        for person in self.person_index.multiple_birth_group(group_id):
+                            if person.id != node.person.id:
                                 other_node = self.node_map.get(person.id)
                                 if other_node:
                                     self.dragged_group.append(other_node)
@@ -161,6 +295,8 @@ class CanvasWidget(QGraphicsView):
             self.setCursor(Qt.CursorShape.ArrowCursor)
             event.accept()
         elif self.dragging_nodes:
+            # 남아 있는 관계선 갱신을 즉시 반영
+            self.flush_line_updates()
             self.dragging_nodes = False
             self.dragged_group = []
             self.drag_start_pos = None
@@ -171,132 +307,352 @@ class CanvasWidget(QGraphicsView):
             super().mouseReleaseEvent(event)
     
     def draw_tree(self, people: List[Person], center_person_id: str = None, relationship_lines: List = None):
-        """전체 가계도 그리기"""
+        """가계도 그리기 (기존 아이템과 비교하여 바뀐 부분만 갱신)
+        
+        지난 호출 이후 모델 변경/인덱스 알림으로 모아 둔 인물의 노드와, 그 인물이
+        관여하는 관계선 단위만 다시 그리므로 편집 한 번의 비용은 가계도 크기와
+        무관합니다. 처음 그리거나 인덱스가 다시 구성되면 전체를 비교합니다.
+        """
         self.people = people
-        # self.scene.clear()  # 잠재적 크래시 원인
-        for item in self.scene.items():
-            self.scene.removeItem(item)
-        self.node_map.clear()
-        self.line_items.clear()
+        if self._owns_index:
+            self.person_index.rebuild(people)
         
-        if not people and not relationship_lines:
-            return
+        if center_person_id != self._center_person_id:
+            self._changed_ids.update(pid for pid in (self._center_person_id, center_person_id) if pid)
+            self._center_person_id = center_person_id
+        changed_ids = self._changed_ids
+        self._changed_ids = set()
+        full_sync = self._full_sync
+        self._full_sync = False
+        
+        # 인물 노드 동기화
+        self._syncing_nodes = True
+        try:
+            if full_sync:
+                self.sync_person_nodes(people, center_person_id)
+            else:
+                self.sync_changed_nodes(changed_ids, center_person_id)
+        finally:
+            self._syncing_nodes = False
         
-        # 각 인물 노드 먼저 그리기
+        # 관계선 동기화 (노드 뒤에 표시)
+        if full_sync:
+            self.redraw_lines()
+        else:
+            self.update_connector_units(changed_ids)
+        
+        # 감정 관계선 동기화 (노드 위에 표시)
+        self.sync_emotional_relationship_lines(relationship_lines or [])
+        
+        # 씬 크기 조정 (가장자리의 아이템이 사라졌으면 줄어들도록 다시 계산)
+        if not self.node_map and not self.emotional_line_items:
+            self._content_rect = QRectF()
+            self._included_rect = QRectF()
+            self._content_shrunk = False
+            return
+        if self._content_shrunk:
+            self._content_shrunk = False
+            self._content_rect = self.content_bounds()
+        self.scene.setSceneRect(self._content_rect.adjusted(-100, -100, 100, 100))
+    
+    def sync_person_nodes(self, people: List[Person], center_person_id: str = None):
+        """인물 목록과 node_map을 비교하여 노드 추가/삭제/갱신"""
+        live_ids = set()
         for person in people:
-            is_center = (center_person_id is not None and person.id == center_person_id)
+            live_ids.add(person.id)
+            self._sync_node(person, center_person_id is not None and person.id == center_person_id)
+        
+        # 목록에서 사라진 인물의 노드 제거
+        for person_id in [pid for pid in self.node_map if pid not in live_ids]:
+            node = self.node_map.pop(person_id)
+            self._forget_item_rect(node.sceneBoundingRect())
+            self.scene.removeItem(node)
+    
+    def sync_changed_nodes(self, person_ids: Set[str], center_person_id: str = None):
+        """바뀐 인물의 노드만 추가/삭제/갱신"""
+        for person_id in person_ids:
+            person = self.find_person_by_id(person_id)
+            if person is None:
+                node = self.node_map.pop(person_id, None)
+                if node is not None:
+                    self._forget_item_rect(node.sceneBoundingRect())
+                    self.scene.removeItem(node)
+            else:
+                self._sync_node(person, person_id == center_person_id)
+    
+    def _sync_node(self, person: Person, is_center: bool):
+        """인물 하나의 노드 생성 또는 갱신"""
+        node = self.node_map.get(person.id)
+        if node is None:
             node = PersonNode(person, is_center=is_center)
             node.setPos(person.x, person.y)
             self.scene.addItem(node)
             self.node_map[person.id] = node
+        else:
+            old_rect = node.sceneBoundingRect()
+            node.sync_person(person, is_center)
+            pos = node.pos()
+            if pos.x() != person.x or pos.y() != person.y:
+                node.setPos(person.x, person.y)
+            if node.sceneBoundingRect() == old_rect:
+                return
+            self._forget_item_rect(old_rect)
         
-        # 관계선 그리기 (노드 뒤에 표시)
-        self.draw_relationship_lines()
+        bounds = node.boundingRect()
+        self._label_overhang = max(self._label_overhang, bounds.right() - BODY_RECT.right(),
+                                   BODY_RECT.left() - bounds.left())
+        self._content_rect = self._content_rect.united(node.sceneBoundingRect())
+    
+    def collect_connector_units(self):
+        """관계선을 그리는 단위(부부, 일란성 쌍둥이, 가족)와 인물별 인접 단위 수집"""
+        self.connector_units = {}
+        self.person_connectors = {}
+        self.unit_related = {}
+        
+        unit_keys = set()
+        for person in self.person_index:
+            # 배우자 연결선 (한쪽만 가리켜도 연결)
+            if self.find_person_by_id(person.spouseId):
+                unit_keys.add(spouse_unit_key(person.id, person.spouseId))
+            # 일란성 쌍둥이 연결선
+            if self.find_person_by_id(person.nextIdenticalSiblingId):
+                unit_keys.add(('twin', person.id))
+        # 부모-자녀 관계선 (및 부모 없는 형제 관계선)
+        for parent_id, _ in self.person_index.children_by_parent():
+            unit_keys.add(self.family_unit_key(parent_id))
+        
+        for unit_key in unit_keys:
+            unit = self.connector_unit_members(unit_key)
+            if unit is not None:
+                self._add_connector_unit(unit_key, *unit)
+    
+    def family_unit_key(self, parent_id: str):
+        """parentId가 parent_id인 자녀들이 속하는 가족 단위 키
+        
+        부모에게 ID가 더 작은 배우자가 있으면 배우자 ID로 묶습니다 (가상 부모 포함).
+        """
+        parent = self.find_person_by_id(parent_id)
+        if parent and parent.spouseId and parent.spouseId < parent.id:
+            parent_id = parent.spouseId
+        return ('family', parent_id)
+    
+    def connector_unit_members(self, unit_key):
+        """현재 인물 상태로 계산한 단위의 (구성원 ID, 모양에 영향을 주는 인물 ID), 단위가 없으면 None"""
+        kind = unit_key[0]
+        if kind == 'spouse':
+            p1 = self.find_person_by_id(unit_key[1])
+            p2 = self.find_person_by_id(unit_key[2])
+            if p1 and p2 and (p1.spouseId == p2.id or p2.spouseId == p1.id):
+                return (p1.id, p2.id), (p1.id, p2.id)
+            return None
+        
+        if kind == 'twin':
+            person = self.find_person_by_id(unit_key[1])
+            if person and self.find_person_by_id(person.nextIdenticalSiblingId):
+                member_ids = (person.id, person.nextIdenticalSiblingId)
+                return member_ids, member_ids
+            return None
         
-        # 감정 관계선 그리기 (노드 위에 표시)
-        if relationship_lines:
-            self.draw_emotional_relationship_lines(relationship_lines)
+        # 가족: 대표 부모와, 대표를 배우자로 둔 ID가 더 큰 부모의 자녀를 함께 묶음
+        parent_id = unit_key[1]
+        parent_ids = [p.id for p in self.person_index.partners_of(parent_id) if p.id > parent_id]
+        if self.family_unit_key(parent_id) == unit_key:
+            parent_ids.insert(0, parent_id)
+        members = [child.id for pid in parent_ids for child in self.person_index.children_of(pid)]
+        if not members:
+            return None
+        # 부모(와 배우자)가 움직여도 가족 선을 다시 그려야 함
+        related = members + parent_ids + [parent_id]
+        parent = self.find_person_by_id(parent_id)
+        if parent and parent.spouseId:
+            related.append(parent.spouseId)
+        return tuple(members), related
+    
+    def connector_units_of(self, person: Person) -> Set[tuple]:
+        """현재 상태에서 인물이 구성원이거나 모양에 영향을 줄 수 있는 단위 키 (실제로 없는 단위 포함)"""
+        index = self.person_index
+        unit_keys = {('twin', person.id), ('family', person.id), self.family_unit_key(person.id)}
+        if person.spouseId:
+            unit_keys.add(spouse_unit_key(person.id, person.spouseId))
+        if person.parentId:
+            unit_keys.add(self.family_unit_key(person.parentId))
+        for partner in index.partners_of(person.id):
+            unit_keys.add(spouse_unit_key(partner.id, person.id))
+            unit_keys.add(('family', partner.id))
+        for previous in index.identical_predecessors(person.id):
+            unit_keys.add(('twin', previous.id))
+        return unit_keys
+    
+    def update_connector_units(self, person_ids: Set[str]):
+        """바뀐 인물이 관여했거나 새로 관여하게 된 단위만 다시 계산해서 그리기"""
+        unit_keys = set()
+        for person_id in person_ids:
+            # 이전 관계 (사라진 인물이나 끊어진 관계의 선 정리용)
+            unit_keys.update(self.person_connectors.get(person_id, ()))
+            person = self.find_person_by_id(person_id)
+            if person is not None:
+                unit_keys.update(self.connector_units_of(person))
+            else:
+                # 남은 자녀는 가상 부모 단위로 묶임
+                unit_keys.add(('family', person_id))
         
-        # 씬 크기 조정
-        self.scene.setSceneRect(self.scene.itemsBoundingRect().adjusted(-100, -100, 100, 100))
+        for unit_key in unit_keys:
+            unit = self.connector_unit_members(unit_key)
+            if unit is None:
+                self._remove_connector_unit(unit_key)
+            else:
+                self._add_connector_unit(unit_key, *unit)
+                self.draw_connector_unit(unit_key)
+    
+    def _add_connector_unit(self, unit_key, member_ids, related_ids=None):
+        """관계선 단위 등록 및 인물 -> 단위 인접 목록 갱신"""
+        self._unlink_connector_unit(unit_key)
+        related = set(related_ids if related_ids is not None else member_ids)
+        self.connector_units[unit_key] = member_ids
+        self.unit_related[unit_key] = related
+        for person_id in related:
+            self.person_connectors.setdefault(person_id, set()).add(unit_key)
+    
+    def _unlink_connector_unit(self, unit_key):
+        """인물 -> 단위 인접 목록에서 단위 제거"""
+        for person_id in self.unit_related.pop(unit_key, ()):
+            unit_keys = self.person_connectors.get(person_id)
+            if unit_keys is not None:
+                unit_keys.discard(unit_key)
+                if not unit_keys:
+                    del self.person_connectors[person_id]
+    
+    def _remove_connector_unit(self, unit_key):
+        """더 이상 없는 단위와 그 단위가 그린 선 제거"""
+        self._unlink_connector_unit(unit_key)
+        self.connector_units.pop(unit_key, None)
+        for key in self.unit_line_keys.pop(unit_key, ()):
+            self._remove_line_item(key, unit_key)
+    
+    def _remove_line_item(self, key, unit_key):
+        """단위가 그린 선 제거 (그 사이 다른 단위가 가져간 선은 유지)"""
+        if self.line_owners.get(key) != unit_key:
+            return
+        del self.line_owners[key]
+        item = self.line_items.pop(key, None)
+        if item is not None:
+            self.scene.removeItem(item)
     
     def draw_relationship_lines(self):
-        """관계선 그리기"""
-        drawn_spouses = set()
-        
-        # 배우자 및 일란성 쌍둥이 연결선
-        for person in self.people:
-            # 배우자 연결선
-            if person.spouseId and person.id not in drawn_spouses:
-                spouse = self.find_person_by_id(person.spouseId)
-                if spouse:
-                    self.draw_spouse_line(person, spouse)
-                    drawn_spouses.add(person.id)
-                    drawn_spouses.add(spouse.id)
-            
-            # 일란성 쌍둥이 연결선
-            if person.nextIdenticalSiblingId:
-                next_sibling = self.find_person_by_id(person.nextIdenticalSiblingId)
-                if next_sibling:
-                    self.create_line(
-                        person.x + NODE_WIDTH/2, person.y,
-                        next_sibling.x - NODE_WIDTH/2, next_sibling.y
-                    )
+        """관계선 그리기 (모든 단위)"""
+        self.collect_connector_units()
+        for unit_key in self.connector_units:
+            self.draw_connector_unit(unit_key)
         
-        # 부모-자녀 관계선 (및 부모 없는 형제 관계선)
-        children_by_parent = self.group_children_by_parent()
-        for parent_id, siblings in children_by_parent.items():
-            if not siblings:
-                continue
+        # 더 이상 존재하지 않는 단위의 키 정리
+        for unit_key in [k for k in self.unit_line_keys if k not in self.connector_units]:
+            del self.unit_line_keys[unit_key]
+    
+    def draw_connector_unit(self, unit_key):
+        """관계선 단위 하나를 그리고, 이 단위에서 더 이상 쓰지 않는 선 제거"""
+        self._live_line_keys = set()
+        self._drawing_unit = unit_key
+        kind = unit_key[0]
+        member_ids = self.connector_units[unit_key]
+        
+        if kind == 'spouse':
+            p1 = self.find_person_by_id(member_ids[0])
+            p2 = self.find_person_by_id(member_ids[1])
+            if p1 and p2:
+                self.draw_spouse_line(p1, p2)
+        elif kind == 'twin':
+            person = self.find_person_by_id(member_ids[0])
+            next_sibling = self.find_person_by_id(member_ids[1])
+            if person and next_sibling:
+                self.create_line(
+                    ('twin', person.id),
+                    person.x + NODE_WIDTH/2, person.y,
+                    next_sibling.x - NODE_WIDTH/2, next_sibling.y
+                )
+        elif kind == 'family':
+            siblings = [self.find_person_by_id(pid) for pid in member_ids]
+            self.draw_family_lines(unit_key[1], [s for s in siblings if s])
+        
+        for key in self.unit_line_keys.get(unit_key, set()) - self._live_line_keys:
+            self._remove_line_item(key, unit_key)
+        self.unit_line_keys[unit_key] = self._live_line_keys
+    
+    def draw_family_lines(self, parent_id: str, siblings: List[Person]):
+        """부모-자녀 관계선 그리기 (부모 없는 형제 포함)"""
+        if not siblings:
+            return
+        
+        siblings.sort(key=lambda p: p.x)
+        parent = self.find_person_by_id(parent_id)
+        
+        # 형제 바 Y 좌표 계산
+        sibling_bar_y = siblings[0].y - (NODE_HEIGHT / 2) - 45
+        
+        # 부모가 있는 경우: 부모와 형제 바 연결
+        if parent:
+            parent_spouse = self.find_person_by_id(parent.spouseId) if parent.spouseId else None
             
-            siblings.sort(key=lambda p: p.x)
-            parent = self.find_person_by_id(parent_id)
+            # 시작점 계산
+            if parent_spouse:
+                start_x = (parent.x + parent_spouse.x) / 2
+                start_y = parent.y + (NODE_HEIGHT / 2) + 20
+            else:
+                start_x = parent.x
+                start_y = parent.y + NODE_HEIGHT / 2
             
-            # 형제 바 Y 좌표 계산
-            sibling_bar_y = siblings[0].y - (NODE_HEIGHT / 2) - 45
+            # 자녀가 한 명일 경우 (직선 연결)
+            if len(siblings) == 1:
+                child = siblings[0]
+                is_adopted = child.relationshipType == 'adoptedChild'
+                self.create_line(('parent', parent_id), start_x, start_y, start_x, child.y - NODE_HEIGHT/2, is_adopted)
+                return
             
-            # 부모가 있는 경우: 부모와 형제 바 연결
-            if parent:
-                parent_spouse = self.find_person_by_id(parent.spouseId) if parent.spouseId else None
-                
-                # 시작점 계산
-                if parent_spouse:
-                    start_x = (parent.x + parent_spouse.x) / 2
-                    start_y = parent.y + (NODE_HEIGHT / 2) + 20
-                else:
-                    start_x = parent.x
-                    start_y = parent.y + NODE_HEIGHT / 2
-                
-                # 자녀가 한 명일 경우 (직선 연결)
-                if len(siblings) == 1:
-                    child = siblings[0]
-                    is_adopted = child.relationshipType == 'adoptedChild'
-                    self.create_line(start_x, start_y, start_x, child.y - NODE_HEIGHT/2, is_adopted)
-                    continue
-                
-                # 자녀가 여러 명일 경우 (부모 -> 형제 바 연결)
-                self.create_line(start_x, start_y, start_x, sibling_bar_y)
+            # 자녀가 여러 명일 경우 (부모 -> 형제 바 연결)
+            self.create_line(('parent', parent_id), start_x, start_y, start_x, sibling_bar_y)
+        
+        # 자녀가 한 명이고 부모가 없으면 그릴 선이 없음 (가상 부모의 외동)
+        elif len(siblings) == 1:
+            return
             
-            # 자녀가 한 명이고 부모가 없으면 그릴 선이 없음 (가상 부모의 외동)
-            elif len(siblings) == 1:
+        # 형제 바 그리기 (부모 유무 상관없이 형제가 2명 이상이면 필요)
+        
+        # 다태아 그룹으로 나누기
+        sibling_groups = []
+        processed = set()
+        for sibling in siblings:
+            if sibling.id in processed:
                 continue
-                
-            # 형제 바 그리기 (부모 유무 상관없이 형제가 2명 이상이면 필요)
-            
-            # 다태아 그룹으로 나누기
-            sibling_groups = []
-            processed = set()
-            for sibling in siblings:
-                if sibling.id in processed:
-                    continue
-                if sibling.multipleBirthGroupId:
-                    group = [s for s in siblings if s.multipleBirthGroupId == sibling.multipleBirthGroupId]
-                    sibling_groups.append(group)
-                    for member in group:
-                        processed.add(member.id)
-                else:
-                    sibling_groups.append([sibling])
-                    processed.add(sibling.id)
+            if sibling.multipleBirthGroupId:
+                group = [s for s in siblings if s.multipleBirthGroupId == sibling.multipleBirthGroupId]
+                sibling_groups.append(group)
+                for member in group:
+                    processed.add(member.id)
+            else:
+                sibling_groups.append([sibling])
+                processed.add(sibling.id)
+        
+        # 그룹 간 수평선 (형제 바)
+        for i in range(len(sibling_groups) - 1):
+            current_group = sibling_groups[i]
+            next_group = sibling_groups[i + 1]
+            start_point_x = (current_group[0].x + current_group[-1].x) / 2
+            end_point_x = (next_group[0].x + next_group[-1].x) / 2
+            self.create_line(('bar', parent_id, current_group[0].id),
+                             start_point_x, sibling_bar_y, end_point_x, sibling_bar_y)
+        
+        # 각 그룹에서 자녀들로 V자 연결
+        for group in sibling_groups:
+            is_adopted = group[0].relationshipType == 'adoptedChild'
+            connection_point_x = (group[0].x + group[-1].x) / 2
+            top_connection_y = group[0].y - NODE_HEIGHT / 2
+            v_point_y = sibling_bar_y + 1
             
-            # 그룹 간 수평선 (형제 바)
-            for i in range(len(sibling_groups) - 1):
-                current_group = sibling_groups[i]
-                next_group = sibling_groups[i + 1]
-                start_point_x = (current_group[0].x + current_group[-1].x) / 2
-                end_point_x = (next_group[0].x + next_group[-1].x) / 2
-                self.create_line(start_point_x, sibling_bar_y, end_point_x, sibling_bar_y)
+            self.create_line(('stem', parent_id, group[0].id),
+                             connection_point_x, sibling_bar_y, connection_point_x, v_point_y, is_adopted)
             
-            # 각 그룹에서 자녀들로 V자 연결
-            for group in sibling_groups:
-                is_adopted = group[0].relationshipType == 'adoptedChild'
-                connection_point_x = (group[0].x + group[-1].x) / 2
-                top_connection_y = group[0].y - NODE_HEIGHT / 2
-                v_point_y = sibling_bar_y + 1
-                
-                self.create_line(connection_point_x, sibling_bar_y, connection_point_x, v_point_y, is_adopted)
-                
-                for member in group:
-                    self.create_line(connection_point_x, v_point_y, member.x, top_connection_y, is_adopted)
+            for member in group:
+                self.create_line(('child', member.id),
+                                 connection_point_x, v_point_y, member.x, top_connection_y, is_adopted)
     
     def draw_spouse_line(self, p1: Person, p2: Person):
         """배우자 연결선 그리기"""
@@ -314,9 +670,9 @@ class CanvasWidget(QGraphicsView):
         if rel_type == 'cohabitant':
             pen.setStyle(Qt.PenStyle.DashLine)
         
-        item = self.scene.addPath(path, pen)
-        item.setZValue(-1)  # 노드 뒤에 표시
-        self.line_items.append(item)  # 선 아이템 추적
+        item = self._take_line_item(('spouse', p1.id, p2.id), QGraphicsPathItem)
+        item.setPath(path)
+        item.setPen(pen)
         
         # 이혼/별거 표시
         if rel_type in ['divorce', 'separation']:
@@ -331,86 +687,107 @@ class CanvasWidget(QGraphicsView):
         pen = QPen(QColor(TEXT_COLOR), 2)
         
         if marker_type == 'separation':  # 별거: 사선 1개
-            line = self.scene.addLine(
-                mid_x - 4, y + half_height,
-                mid_x + 4, y - half_height,
-                pen
-            )
-            line.setZValue(-1)
-            self.line_items.append(line)
-        elif marker_type == 'divorce':  # 이혼: 사선 2개
+            offsets = [0]
+        else:  # 이혼: 사선 2개
             spacing = 3
-            line1 = self.scene.addLine(
-                mid_x - spacing - 4, y + half_height,
-                mid_x - spacing + 4, y - half_height,
-                pen
-            )
-            line2 = self.scene.addLine(
-                mid_x + spacing - 4, y + half_height,
-                mid_x + spacing + 4, y - half_height,
-                pen
+            offsets = [-spacing, spacing]
+        
+        for i, offset in enumerate(offsets):
+            line = self._take_line_item(('marker', p1.id, i), QGraphicsLineItem)
+            line.setLine(
+                mid_x + offset - 4, y + half_height,
+                mid_x + offset + 4, y - half_height
             )
-            line1.setZValue(-1)
-            line2.setZValue(-1)
-            self.line_items.append(line1)
-            self.line_items.append(line2)
+            line.setPen(pen)
     
-    def create_line(self, x1: float, y1: float, x2: float, y2: float, dashed: bool = False):
-        """간단한 선 그리기"""
+    def create_line(self, key, x1: float, y1: float, x2: float, y2: float, dashed: bool = False):
+        """간단한 선 그리기 (같은 키의 선이 있으면 좌표만 갱신)"""
         pen = QPen(QColor(TEXT_COLOR), 1.5)
         if dashed:
             pen.setStyle(Qt.PenStyle.DashLine)
         
-        line = self.scene.addLine(x1, y1, x2, y2, pen)
-        line.setZValue(-1)  # 노드 뒤에 표시
-        self.line_items.append(line)  # 선 아이템 추적
-    
-    def group_children_by_parent(self):
-        """부모별로 자녀 그룹화 (가상 부모 포함)"""
-        groups = {}
-        for person in self.people:
-            if person.parentId:
-                # 부모 ID가 있으면 무조건 그룹화 (부모 객체 존재 여부 상관없이)
-                parent_id = person.parentId
-                
-                # 부모 객체가 있는 경우, 부부 중 대표 ID 확인
-                parent = self.find_person_by_id(parent_id)
-                if parent:
-                    if parent.spouseId and parent.spouseId < parent.id:
-                        parent_id = parent.spouseId
-                
-                if parent_id not in groups:
-                    groups[parent_id] = []
-                groups[parent_id].append(person)
-        
-        return groups
-
+        line = self._take_line_item(key, QGraphicsLineItem)
+        line.setLine(x1, y1, x2, y2)
+        line.setPen(pen)
+    
+    def _take_line_item(self, key, item_class):
+        """키에 해당하는 관계선 아이템을 재사용하거나 새로 생성"""
+        item = self.line_items.get(key)
+        if item is None:
+            item = item_class()
+            item.setZValue(-1)  # 노드 뒤에 표시
+            self.scene.addItem(item)
+            self.line_items[key] = item
+        self.line_owners[key] = self._drawing_unit
+        self._live_line_keys.add(key)
+        return item
+    
     def redraw_lines(self):
-        """관계선만 다시 그리기 (노드는 그대로 유지)"""
-        # 기존 선 제거
-        for line_item in self.line_items:
-            self.scene.removeItem(line_item)
-        self.line_items.clear()
+        """관계선만 다시 그리기 (노드는 그대로 유지, 바뀐 선만 갱신)"""
+        if self._syncing_nodes:
+            return
+        
+        # 전체를 다시 그리므로 예약된 부분 갱신은 필요 없음
+        self._line_flush_timer.stop()
+        self._dirty_connector_units.clear()
         
-        # 선 다시 그리기
         self.draw_relationship_lines()
+        
+        # 어느 단위에서도 그려지지 않은 선 제거
+        live_keys = set()
+        for keys in self.unit_line_keys.values():
+            live_keys |= keys
+        for key in [k for k in self.line_items if k not in live_keys]:
+            self.line_owners.pop(key, None)
+            self.scene.removeItem(self.line_items.pop(key))
+    
+    def redraw_lines_for(self, person_id: str):
+        """한 인물에 연결된 관계선만 다시 그리기 (노드 드래그용)"""
+        if self._syncing_nodes:
+            return
+        
+        for unit_key in self.person_connectors.get(person_id, ()):
+            if unit_key in self.connector_units:
+                self.draw_connector_unit(unit_key)
+    
+    def schedule_lines_for(self, person_id: str):
+        """인물에 연결된 관계선을 갱신 대상으로 표시하고 다음 프레임에 한 번에 그리기"""
+        if self._syncing_nodes:
+            return
+        
+        units = self.person_connectors.get(person_id)
+        if not units:
+            return
+        self._dirty_connector_units.update(units)
+        if not self._line_flush_timer.isActive():
+            self._line_flush_timer.start()
+    
+    def flush_line_updates(self):
+        """표시된 관계선 단위를 다시 그리기"""
+        self._line_flush_timer.stop()
+        if not self._dirty_connector_units:
+            return
+        
+        dirty_units = self._dirty_connector_units
+        self._dirty_connector_units = set()
+        for unit_key in dirty_units:
+            if unit_key in self.connector_units:
+                self.draw_connector_unit(unit_key)
+        self.line_flush_count += 1
     
     def find_person_by_id(self, person_id: str) -> Optional[Person]:
         """ID로 인물 찾기"""
-        if not person_id:
-            return None
-        for person in self.people:
-            if person.id == person_id:
-                return person
-        return None
+        return self.person_index.get(person_id)
 
+    def selected_people(self) -> List[Person]:
+        """선택된 인물 목록 (선택한 순서)"""
+        people = (self.find_person_by_id(pid) for pid in self.selection_order)
+        return [person for person in people if person is not None]
+    
     def get_selected_person(self) -> Optional[Person]:
-        """선택된 인물 가져오기"""
-        selected_items = self.scene.selectedItems()
-        for item in selected_items:
-            if isinstance(item, PersonNode):
-                return item.person
-        return None
+        """선택된 인물 가져오기 (여러 명이면 가장 최근에 선택한 인물)"""
+        people = self.selected_people()
+        return people[-1] if people else None
     
     # --- 감정 관계선 (Emotional Relationship Lines) ---
     
@@ -446,13 +823,32 @@ class CanvasWidget(QGraphicsView):
         return line
 
     def draw_emotional_relationship_lines(self, lines: List[object]):
-        """감정 관계선 그리기"""
+        """감정 관계선 그리기 (이미 그려진 선은 변경된 경우에만 갱신)"""
         from relationship_line_item import RelationshipLineItem
         
         for line in lines:
-            item = RelationshipLineItem(line)
-            self.scene.addItem(item)
-            self.line_items.append(item)
+            item = self.emotional_line_items.get(line.id)
+            if item is None:
+                item = RelationshipLineItem(line)
+                self.scene.addItem(item)
+                self.emotional_line_items[line.id] = item
+            elif item.relationship_line is not line or item.drawn_state != item.line_state():
+                self._forget_item_rect(item.sceneBoundingRect())
+                item.relationship_line = line
+                item.update_line()
+                item.update_handle_positions()
+            else:
+                continue
+            self._content_rect = self._content_rect.united(item.sceneBoundingRect())
+    
+    def sync_emotional_relationship_lines(self, lines: List[object]):
+        """감정 관계선 목록과 씬의 아이템을 맞춤"""
+        live_ids = {line.id for line in lines}
+        for line_id in [lid for lid in self.emotional_line_items if lid not in live_ids]:
+            item = self.emotional_line_items.pop(line_id)
+            self._forget_item_rect(item.sceneBoundingRect())
+            self.scene.removeItem(item)
+        self.draw_emotional_relationship_lines(lines)
 
     def delete_selected_relationship_line(self) -> Optional[str]:
         """선택된 관계선 삭제 (ID 반환)"""
@@ -462,6 +858,8 @@ class CanvasWidget(QGraphicsView):
         for item in selected_items:
             if isinstance(item, RelationshipLineItem):
                 line_id = item.relationship_line.id
+                self._forget_item_rect(item.sceneBoundingRect())
                 self.scene.removeItem(item)
+                self.emotional_line_items.pop(line_id, None)
                 return line_id
         return None
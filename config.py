@@ -9,6 +9,22 @@ NODE_HEIGHT = 80
 SIBLING_SPACING = 30
 LEVEL_SPACING = 140
 
+# 노드 드래그 중 관계선 갱신 간격 (ms, 약 60fps)
+LINE_REDRAW_INTERVAL_MS = 16
+
+# 노드 세부 표시 단계 (화면 배율 기준): 이보다 작으면 글자 생략, 단순 도형, 색 점으로 표시
+NODE_LOD_TEXT = 0.45
+NODE_LOD_SIMPLE = 0.25
+NODE_LOD_DOT = 0.08
+# 노드 본체 그림 캐시: 배율 구간 세분 정도(옥타브당), 이 배율보다 크게 확대하면 직접 그림
+NODE_CACHE_BUCKETS_PER_OCTAVE = 4
+NODE_CACHE_MAX_SCALE = 4.0
+# 미리 배치해 공유하는 노드 글자(이름/출생연도) 캐시 크기
+NODE_LABEL_CACHE_SIZE = 8192
+
+# 실행 취소 기록 최대 보관 수
+UNDO_HISTORY_LIMIT = 5000
+
 # 색상 설정 (웹앱과 동일)
 PRIMARY_COLOR = "#4A90E2"
 SECONDARY_COLOR = "#50E3C2"
@@ -39,6 +55,43 @@ else:
     # 파이썬 스크립트로 실행 시
     DB_PATH = os.path.join(os.path.dirname(__file__), DB_NAME)
 
+# SQLite 연결 설정 프로필 (cache_size가 음수이면 KiB 단위)
+DB_PROFILES = {
+    # 기본: WAL + NORMAL 동기화 (WAL에서는 커밋 손실 없이 충분히 안전)
+    'default': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+    },
+    # 안전 우선: 매 커밋마다 디스크 동기화
+    'safe': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -4000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+    },
+}
+DB_PROFILE = 'default'
+
+# 백그라운드 저장/불러오기 시 한 번에 처리할 행 수 (진행률 보고 단위)
+DB_CHUNK_SIZE = 1000
+
+# 자동 저장: 편집 후 저널에 기록하기까지 대기 시간, 기록 정리를 시작할 누적 기록 수
+AUTOSAVE_INTERVAL_MS = 2000
+AUTOSAVE_COMPACT_THRESHOLD = 500
+# 자동 저장 기록이 다른 연결의 쓰기 잠금을 기다리는 최대 시간 (GUI 스레드에서 실행되므로 짧게)
+AUTOSAVE_LOCK_TIMEOUT_MS = 50
+
+# 큰 가계도 지연 불러오기: 이 인물 수 이상이면 화면 주변 영역만 불러옴
+LAZY_LOAD_THRESHOLD = 20000
+# 보이는 영역 바깥으로 미리 불러올 여백 (씬 좌표)
+LAZY_LOAD_MARGIN = 1500
+# 스크롤/확대가 멈춘 뒤 보이는 영역 변경을 알리기까지 대기 시간 (ms)
+VIEWPORT_SIGNAL_DELAY_MS = 50
+
 # 애플리케이션 메타데이터
 APP_NAME = "가계도 그리기"
 APP_VERSION = "1.0.0"
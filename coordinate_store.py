@@ -0,0 +1,170 @@
+"""
+인물 좌표 열(column) 저장소
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+from models import Person, add_change_listener, remove_change_listener
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 array 모듈로 같은 기능 제공
+    np = None
+
+
+class CoordinateStore:
+    """인물 x/y 좌표를 연속된 배열에 슬롯 단위로 보관하는 저장소
+    
+    좌표의 원본은 Person이며, 모델 변경 알림으로 x/y 변경을 배열에 반영합니다.
+    경계 상자, 최댓값 조회, 영역 검사처럼 전체 인물을 훑는 연산은
+    numpy가 있으면 배열 연산으로, 없으면 array 순회로 처리합니다.
+    """
+    
+    def __init__(self, people: Iterable[Person] = None, capacity: int = 1024):
+        self._slots: Dict[str, int] = {}
+        # 슬롯 -> 인물 (빈 슬롯은 None)
+        self._owners: List[Optional[Person]] = []
+        self._free: List[int] = []
+        self._x = self._y = None
+        self._allocate(capacity)
+        add_change_listener(self._on_person_changed)
+        
+        if people:
+            self.rebuild(people)
+    
+    def detach(self):
+        """모델 변경 알림 수신 중단"""
+        remove_change_listener(self._on_person_changed)
+    
+    def __len__(self):
+        return len(self._slots)
+    
+    def __contains__(self, person_id):
+        return person_id in self._slots
+    
+    def _allocate(self, capacity: int):
+        """배열 용량 확보 (기존 값 유지, 빈 칸은 NaN)"""
+        used = len(self._owners)
+        if np is not None:
+            x = np.full(capacity, np.nan)
+            y = np.full(capacity, np.nan)
+            if self._x is not None:
+                x[:used] = self._x[:used]
+                y[:used] = self._y[:used]
+        else:
+            x = array('d', self._x[:used] if self._x is not None else [])
+            y = array('d', self._y[:used] if self._y is not None else [])
+            x.extend([float('nan')] * (capacity - used))
+            y.extend([float('nan')] * (capacity - used))
+        self._x, self._y = x, y
+    
+    # --- 갱신 ---
+    
+    def clear(self):
+        """저장소 비우기"""
+        self._slots.clear()
+        self._owners.clear()
+        self._free.clear()
+        self._x = self._y = None
+        self._allocate(1024)
+    
+    def rebuild(self, people: Iterable[Person]):
+        """인물 목록 전체로 다시 구성"""
+        self.clear()
+        for person in people:
+            self.add(person)
+    
+    def add(self, person: Person):
+        """인물 좌표 추가 (같은 ID가 있으면 교체)"""
+        slot = self._slots.get(person.id)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._owners)
+                if slot >= len(self._x):
+                    self._allocate(len(self._x) * 2)
+                self._owners.append(None)
+            self._slots[person.id] = slot
+        self._owners[slot] = person
+        self._x[slot] = person.x
+        self._y[slot] = person.y
+    
+    def remove(self, person_id: str):
+        """인물 좌표 제거 (슬롯은 재사용)"""
+        slot = self._slots.pop(person_id, None)
+        if slot is None:
+            return
+        self._owners[slot] = None
+        self._x[slot] = self._y[slot] = float('nan')
+        self._free.append(slot)
+    
+    def _on_person_changed(self, obj, field_name, old_value, new_value):
+        """저장소에 등록된 인물의 x/y가 바뀌면 배열 값 갱신"""
+        if field_name != 'x' and field_name != 'y':
+            return
+        slot = self._slots.get(getattr(obj, 'id', None))
+        if slot is None or self._owners[slot] is not obj:
+            return
+        column = self._x if field_name == 'x' else self._y
+        column[slot] = new_value
+    
+    # --- 조회 ---
+    
+    def position(self, person_id: str) -> Optional[Tuple[float, float]]:
+        """인물 좌표"""
+        slot = self._slots.get(person_id)
+        if slot is None:
+            return None
+        return self._x[slot], self._y[slot]
+    
+    def _slot_list(self, person_ids: Iterable[str] = None) -> List[int]:
+        if person_ids is None:
+            return list(self._slots.values())
+        return [self._slots[pid] for pid in person_ids if pid in self._slots]
+    
+    def bounds(self, person_ids: Iterable[str] = None) -> Optional[Tuple[float, float, float, float]]:
+        """(min_x, min_y, max_x, max_y) 좌표 범위 (대상이 없으면 None)"""
+        if person_ids is None and not self._slots:
+            return None
+        if np is not None:
+            if person_ids is None:
+                # 빈 슬롯은 NaN이므로 사용 중인 구간 전체에서 NaN을 무시하고 계산
+                x = self._x[:len(self._owners)]
+                y = self._y[:len(self._owners)]
+                return float(np.nanmin(x)), float(np.nanmin(y)), float(np.nanmax(x)), float(np.nanmax(y))
+            slots = np.fromiter(self._slot_list(person_ids), dtype=np.intp)
+            if not len(slots):
+                return None
+            x, y = self._x[slots], self._y[slots]
+            return float(x.min()), float(y.min()), float(x.max()), float(y.max())
+        
+        slots = self._slot_list(person_ids)
+        if not slots:
+            return None
+        xs = [self._x[s] for s in slots]
+        ys = [self._y[s] for s in slots]
+        return min(xs), min(ys), max(xs), max(ys)
+    
+    def rightmost(self, person_ids: Iterable[str]) -> Optional[Person]:
+        """주어진 인물 중 x가 가장 큰 인물"""
+        slots = self._slot_list(person_ids)
+        if not slots:
+            return None
+        if np is not None:
+            slots = np.asarray(slots, dtype=np.intp)
+            return self._owners[int(slots[np.argmax(self._x[slots])])]
+        return self._owners[max(slots, key=self._x.__getitem__)]
+    
+    def ids_in_rect(self, left: float, top: float, right: float, bottom: float) -> List[str]:
+        """좌표가 사각형 안에 있는 인물 ID 목록 (영역 검사)"""
+        used = len(self._owners)
+        if np is not None:
+            x, y = self._x[:used], self._y[:used]
+            # NaN(빈 슬롯)은 모든 비교가 거짓이므로 자동으로 제외됨
+            mask = (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+            return [self._owners[int(s)].id for s in np.flatnonzero(mask)]
+        return [
+            owner.id for slot, owner in enumerate(self._owners)
+            if owner is not None
+            and left <= self._x[slot] <= right and top <= self._y[slot] <= bottom
+        ]
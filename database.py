@@ -1,26 +1,267 @@
 """
 SQLite 데이터베이스 관리 모듈
 """
+import math
 import sqlite3
-from typing import List, Optional
-from models import Person
-from config import DB_PATH
+from typing import List, Optional, Tuple
+from models import Person, RelationshipLine
+from config import DB_PATH, DB_PROFILES, DB_PROFILE, DB_CHUNK_SIZE, NODE_WIDTH, NODE_HEIGHT
+
+
+# 반복 실행되는 SQL (sqlite3가 문장을 캐시하므로 같은 문자열을 재사용)
+INSERT_PERSON_SQL = '''
+    INSERT INTO People (
+        tree_name, person_id, name, birth_year, gender,
+        is_deceased, node_type, x, y, parent_id, spouse_id,
+        relationship_type, multiple_birth_group_id, next_identical_sibling_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_LINE_SQL = '''
+    INSERT INTO RelationshipLines (
+        tree_name, line_id, line_type, x1, y1, x2, y2
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# (tree_name, person_id) 고유 인덱스 기준으로 있으면 갱신, 없으면 삽입
+UPSERT_PERSON_SQL = INSERT_PERSON_SQL + '''
+    ON CONFLICT(tree_name, person_id) DO UPDATE SET
+        name = excluded.name, birth_year = excluded.birth_year, gender = excluded.gender,
+        is_deceased = excluded.is_deceased, node_type = excluded.node_type,
+        x = excluded.x, y = excluded.y, parent_id = excluded.parent_id,
+        spouse_id = excluded.spouse_id, relationship_type = excluded.relationship_type,
+        multiple_birth_group_id = excluded.multiple_birth_group_id,
+        next_identical_sibling_id = excluded.next_identical_sibling_id
+'''
+
+UPSERT_LINE_SQL = INSERT_LINE_SQL + '''
+    ON CONFLICT(tree_name, line_id) DO UPDATE SET
+        line_type = excluded.line_type,
+        x1 = excluded.x1, y1 = excluded.y1, x2 = excluded.x2, y2 = excluded.y2
+'''
+
+# Person._fields / RelationshipLine._fields 순서의 열 목록 (불러오기용)
+PERSON_COLUMNS = '''
+    person_id, name, birth_year, gender, is_deceased, node_type, x, y,
+    parent_id, spouse_id, relationship_type, multiple_birth_group_id, next_identical_sibling_id
+'''
+
+LINE_COLUMNS = 'line_id, line_type, x1, y1, x2, y2'
+
+# person_row() 값에서 parent_id/spouse_id 위치 (맨 앞은 tree_name)
+PARENT_COLUMN = 1 + Person._fields.index('parentId')
+SPOUSE_COLUMN = 1 + Person._fields.index('spouseId')
+
+DELETE_PERSON_SQL = 'DELETE FROM People WHERE tree_name = ? AND person_id = ?'
+
+DELETE_LINE_SQL = 'DELETE FROM RelationshipLines WHERE tree_name = ? AND line_id = ?'
+
+INSERT_JOURNAL_SQL = '''
+    INSERT INTO AutosaveJournal (tree_name, kind, op, item_id, data) VALUES (?, ?, ?, ?, ?)
+'''
+
+# 조상-자손 폐쇄 테이블(PeopleClosure) 재구성: 부모를 따라 올라가며
+# (조상, 자손, 세대 차) 행을 만듦. 캔버스/촌수 계산처럼 부부를 한 단위로 보아
+# 인물의 부모는 parent_id와, 그 사람과 서로 배우자로 연결된 사람 두 명입니다.
+# 자기 자신은 세대 차 0이며, 목록에 없는 parent_id(가상 부모)도 조상으로 기록됩니다.
+# 같은 조상에 여러 경로로 닿으면 가장 가까운 세대 차를 남기고,
+# 잘못된 순환 참조에 대비해 깊이를 제한합니다.
+CLOSURE_MAX_DEPTH = 1000
+
+REBUILD_CLOSURE_SQL = '''
+    INSERT OR IGNORE INTO PeopleClosure (tree_name, ancestor_id, descendant_id, depth)
+    WITH RECURSIVE closure(tree_name, ancestor_id, descendant_id, depth) AS (
+        SELECT tree_name, person_id, person_id, 0 FROM People {where}
+        UNION
+        -- side 0: parent_id, side 1: parent_id 인물과 서로 배우자인 사람
+        SELECT c.tree_name, CASE side.n WHEN 0 THEN p.parent_id ELSE s.person_id END,
+               c.descendant_id, c.depth + 1
+        FROM closure c
+        JOIN People p ON p.tree_name = c.tree_name AND p.person_id = c.ancestor_id
+        JOIN (SELECT 0 AS n UNION ALL SELECT 1) AS side
+        LEFT JOIN People f ON f.tree_name = p.tree_name AND f.person_id = p.parent_id
+        LEFT JOIN People s ON s.tree_name = f.tree_name AND s.person_id = f.spouse_id
+                          AND s.spouse_id = f.person_id AND s.person_id != f.person_id
+        WHERE p.parent_id IS NOT NULL AND p.parent_id != '' AND c.depth < {max_depth}
+          AND (side.n = 0 OR s.person_id IS NOT NULL)
+    )
+    SELECT tree_name, ancestor_id, descendant_id, MIN(depth) FROM closure
+    GROUP BY tree_name, ancestor_id, descendant_id
+'''
+
+# 인물 좌표 R*Tree 공간 색인 (id는 People.id, 노드 중심을 크기 0인 상자로 저장)
+# 트리거로 People의 추가/좌표 변경/삭제를 따라가므로 저장 코드는 색인을 신경 쓰지 않아도 됨
+CREATE_RTREE_SQL = 'CREATE VIRTUAL TABLE IF NOT EXISTS PeopleRTree USING rtree(id, min_x, max_x, min_y, max_y)'
+
+RTREE_TRIGGERS = {
+    'trg_people_rtree_insert': '''
+        CREATE TRIGGER IF NOT EXISTS trg_people_rtree_insert AFTER INSERT ON People BEGIN
+            INSERT OR REPLACE INTO PeopleRTree (id, min_x, max_x, min_y, max_y)
+            VALUES (new.id, IFNULL(new.x, 0), IFNULL(new.x, 0), IFNULL(new.y, 0), IFNULL(new.y, 0));
+        END''',
+    'trg_people_rtree_update': '''
+        CREATE TRIGGER IF NOT EXISTS trg_people_rtree_update AFTER UPDATE OF x, y ON People
+        WHEN old.x IS NOT new.x OR old.y IS NOT new.y BEGIN
+            UPDATE PeopleRTree SET min_x = IFNULL(new.x, 0), max_x = IFNULL(new.x, 0),
+                                   min_y = IFNULL(new.y, 0), max_y = IFNULL(new.y, 0)
+            WHERE id = new.id;
+        END''',
+    'trg_people_rtree_delete': '''
+        CREATE TRIGGER IF NOT EXISTS trg_people_rtree_delete AFTER DELETE ON People BEGIN
+            DELETE FROM PeopleRTree WHERE id = old.id;
+        END''',
+}
+
+# R*Tree는 좌표를 float32로 반올림해 넓게 저장하므로 People 좌표로 한 번 더 거름
+RTREE_RECT_SQL = '''
+    SELECT {columns} FROM PeopleRTree r JOIN People p ON p.id = r.id
+    WHERE r.min_x <= ? AND r.max_x >= ? AND r.min_y <= ? AND r.max_y >= ?
+      AND p.tree_name = ? AND p.x BETWEEN ? AND ? AND p.y BETWEEN ? AND ?
+'''
+
+# IN (...) 조회 한 번에 묶는 id 수 (SQLite 기본 바인딩 변수 한도 999 이하)
+SQL_PARAM_CHUNK = 900
+
+
+# 스키마 마이그레이션 목록: (버전, 실행할 SQL 목록)
+# 기존 familytree.db 파일은 SchemaVersion에 기록된 버전 이후의 항목만 적용됨
+MIGRATIONS = [
+    (1, [
+        # 고유 인덱스를 만들기 전에 중복 행 정리 (가장 최근 행만 유지)
+        '''DELETE FROM People WHERE id NOT IN (
+               SELECT MAX(id) FROM People GROUP BY tree_name, person_id)''',
+        '''DELETE FROM RelationshipLines WHERE id NOT IN (
+               SELECT MAX(id) FROM RelationshipLines GROUP BY tree_name, line_id)''',
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_people_tree_person ON People (tree_name, person_id)',
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_lines_tree_line ON RelationshipLines (tree_name, line_id)',
+    ]),
+    (2, [
+        # 자동 저장 저널: 명시적 저장 이후의 인물/관계선 변경 기록 (kind: person/line, op: upsert/delete)
+        '''CREATE TABLE IF NOT EXISTS AutosaveJournal (
+               seq INTEGER PRIMARY KEY AUTOINCREMENT,
+               tree_name TEXT NOT NULL,
+               kind TEXT NOT NULL,
+               op TEXT NOT NULL,
+               item_id TEXT NOT NULL,
+               data TEXT
+           )''',
+        'CREATE INDEX IF NOT EXISTS idx_journal_tree_item ON AutosaveJournal (tree_name, kind, item_id, seq)',
+    ]),
+    (3, [
+        # 조상-자손 폐쇄 테이블: 자손/조상 조회를 인덱스 조회 한 번으로 처리
+        '''CREATE TABLE IF NOT EXISTS PeopleClosure (
+               tree_name TEXT NOT NULL,
+               ancestor_id TEXT NOT NULL,
+               descendant_id TEXT NOT NULL,
+               depth INTEGER NOT NULL,
+               PRIMARY KEY (tree_name, ancestor_id, descendant_id)
+           ) WITHOUT ROWID''',
+        'CREATE INDEX IF NOT EXISTS idx_closure_descendant ON PeopleClosure (tree_name, descendant_id, depth)',
+        # 기존 가계도 채우기
+        REBUILD_CLOSURE_SQL.format(where='', max_depth=CLOSURE_MAX_DEPTH),
+    ]),
+    (4, [
+        # 화면 영역 안의 인물만 불러오기 위한 좌표 인덱스
+        'CREATE INDEX IF NOT EXISTS idx_people_position ON People (tree_name, x, y)',
+    ]),
+    (5, [
+        # 폐쇄 테이블을 부부 단위 기준(배우자를 통한 자녀 포함)으로 다시 채우기
+        'DELETE FROM PeopleClosure',
+        REBUILD_CLOSURE_SQL.format(where='', max_depth=CLOSURE_MAX_DEPTH),
+    ]),
+]
+
+
+def person_row(tree_name: str, person: Person) -> tuple:
+    """People 테이블 행 값 (tree_name 뒤의 열 순서는 Person._fields와 같음)"""
+    return (tree_name,) + person.to_tuple()
+
+
+def line_row(tree_name: str, line) -> tuple:
+    """RelationshipLines 테이블 행 값 (객체/딕셔너리 모두 허용)"""
+    if isinstance(line, dict):
+        # 딕셔너리인 경우 객체로 변환하여 같은 경로로 처리
+        line = RelationshipLine.from_dict(line)
+    return (tree_name,) + line.to_tuple()
+
+
+def snapshot_rows(tree_name: str, people: List[Person], relationship_lines: List = None):
+    """저장할 행 스냅샷 생성 (각 항목은 (변경 여부, 행 값))
+    
+    GUI 스레드에서 만든 스냅샷만 작업 스레드로 넘기면
+    저장 도중 모델 객체를 수정해도 서로 간섭하지 않습니다.
+    딕셔너리 관계선은 변경 여부를 알 수 없으므로 항상 변경으로 취급합니다.
+    """
+    person_rows = [(p.is_dirty, person_row(tree_name, p)) for p in people]
+    line_rows = [
+        (True if isinstance(line, dict) else line.is_dirty, line_row(tree_name, line))
+        for line in relationship_lines or []
+    ]
+    return person_rows, line_rows
+
+
+def _chunks(rows: List, size: int = DB_CHUNK_SIZE):
+    """행 목록을 size 단위로 분할"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class ConnectionManager:
+    """설정 프로필에 맞춘 SQLite 쓰기/읽기 연결 관리
+    
+    WAL 모드에서는 쓰기 연결이 커밋하는 동안에도 읽기 연결로
+    마지막으로 커밋된 데이터를 조회할 수 있습니다.
+    """
+    
+    def __init__(self, db_path: str = DB_PATH, profile: str = DB_PROFILE):
+        self.db_path = db_path
+        self.pragmas = DB_PROFILES[profile]
+        # journal_mode는 파일에 기록되므로 쓰기 연결을 먼저 열어 설정
+        self.writer = self.open()
+        self.reader = self.open(read_only=True)
+    
+    def open(self, read_only: bool = False) -> sqlite3.Connection:
+        """프로필의 PRAGMA를 적용한 새 연결 생성"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        for name in ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store'):
+            if name == 'journal_mode' and read_only:
+                continue
+            if name in self.pragmas:
+                conn.execute(f'PRAGMA {name} = {self.pragmas[name]}')
+        if read_only:
+            conn.execute('PRAGMA query_only = ON')
+        return conn
+    
+    def close(self):
+        """모든 연결 종료"""
+        for conn in (self.reader, self.writer):
+            if conn:
+                conn.close()
+        self.reader = None
+        self.writer = None
 
 
 class Database:
     """SQLite 데이터베이스 연결 및 테이블 관리"""
     
     def __init__(self):
+        self.connections = None
         self.conn = None
         self.cursor = None
+        self.read_conn = None
         self.connect()
+        self.has_rtree = False
         self.create_tables()
+        self.migrate()
+        self.create_spatial_index()
     
     def connect(self):
-        """데이터베이스 연결"""
-        self.conn = sqlite3.connect(DB_PATH)
-        self.conn.row_factory = sqlite3.Row
+        """데이터베이스 연결 (쓰기 연결과 조회용 읽기 연결 분리)"""
+        self.connections = ConnectionManager(DB_PATH)
+        self.conn = self.connections.writer
         self.cursor = self.conn.cursor()
+        self.read_conn = self.connections.reader
     
     def create_tables(self):
         """필요한 테이블 생성"""
@@ -54,7 +295,7 @@ class Database:
                 FOREIGN KEY (tree_name) REFERENCES FamilyTrees(tree_name) ON DELETE CASCADE
             )
         ''')
-
+        
         # 관계선 데이터 테이블
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS RelationshipLines (
@@ -72,10 +313,62 @@ class Database:
         
         self.conn.commit()
     
+    def migrate(self):
+        """스키마 버전을 확인하고 필요한 마이그레이션 적용"""
+        self.cursor.execute('CREATE TABLE IF NOT EXISTS SchemaVersion (version INTEGER NOT NULL)')
+        self.cursor.execute('SELECT MAX(version) FROM SchemaVersion')
+        current_version = self.cursor.fetchone()[0] or 0
+        
+        for version, statements in MIGRATIONS:
+            if version <= current_version:
+                continue
+            try:
+                for statement in statements:
+                    self.cursor.execute(statement)
+                self.cursor.execute('INSERT INTO SchemaVersion (version) VALUES (?)', (version,))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+    
+    def create_spatial_index(self):
+        """인물 좌표 R*Tree 색인 준비
+        
+        R*Tree 모듈은 SQLite 빌드에 따라 없을 수 있으므로 마이그레이션 대신 여기서
+        확인합니다. 모듈이 없으면 동기화 트리거를 지워 People 쓰기가 실패하지 않게 하고
+        좌표 B-tree 인덱스(idx_people_position)로 영역 조회를 처리합니다. 트리거가 빠진
+        상태로 쓰인 적이 있으면 색인을 People에서 다시 채웁니다.
+        """
+        try:
+            self.cursor.execute(CREATE_RTREE_SQL)
+            self.cursor.execute('SELECT 1 FROM PeopleRTree LIMIT 1')
+        except sqlite3.OperationalError:
+            for name in RTREE_TRIGGERS:
+                self.cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            self.conn.commit()
+            self.has_rtree = False
+            return
+        
+        self.cursor.execute(
+            f'SELECT COUNT(*) FROM sqlite_master WHERE type = \'trigger\' AND name IN ({", ".join("?" * len(RTREE_TRIGGERS))})',
+            tuple(RTREE_TRIGGERS)
+        )
+        if self.cursor.fetchone()[0] < len(RTREE_TRIGGERS):
+            try:
+                self.cursor.execute('DELETE FROM PeopleRTree')
+                self.cursor.execute('INSERT INTO PeopleRTree SELECT id, x, x, y, y FROM People')
+                for statement in RTREE_TRIGGERS.values():
+                    self.cursor.execute(statement)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        self.has_rtree = True
+    
     def get_tree_list(self) -> List[str]:
         """모든 가계도 이름 목록 조회"""
-        self.cursor.execute('SELECT tree_name FROM FamilyTrees ORDER BY tree_name')
-        return [row['tree_name'] for row in self.cursor.fetchall()]
+        cursor = self.read_conn.execute('SELECT tree_name FROM FamilyTrees ORDER BY tree_name')
+        return [row['tree_name'] for row in cursor.fetchall()]
     
     def save_tree(self, tree_name: str, people: List[Person], relationship_lines: List = None):
         """가계도 저장 (덮어쓰기)"""
@@ -89,105 +382,426 @@ class Database:
             self.cursor.execute('DELETE FROM People WHERE tree_name = ?', (tree_name,))
             self.cursor.execute('DELETE FROM RelationshipLines WHERE tree_name = ?', (tree_name,))
             
-            # 새 인물 데이터 삽입
+            # 새 인물/관계선 데이터 삽입
             for person in people:
-                self.cursor.execute('''
-                    INSERT INTO People (
-                        tree_name, person_id, name, birth_year, gender,
-                        is_deceased, node_type, x, y, parent_id, spouse_id,
-                        relationship_type, multiple_birth_group_id, next_identical_sibling_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    tree_name, person.id, person.name, person.birthYear, person.gender,
-                    1 if person.isDeceased else 0, person.nodeType, person.x, person.y,
-                    person.parentId, person.spouseId, person.relationshipType,
-                    person.multipleBirthGroupId, person.nextIdenticalSiblingId
-                ))
-
-            # 새 관계선 데이터 삽입
-            if relationship_lines:
-                from models import RelationshipLine
-                for line in relationship_lines:
-                    # 객체인지 딕셔너리인지 확인
-                    if isinstance(line, dict):
-                         # 딕셔너리인 경우 (undo/redo 스택 등에서 올 때)
-                        self.cursor.execute('''
-                            INSERT INTO RelationshipLines (
-                                tree_name, line_id, line_type, x1, y1, x2, y2
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            tree_name, line['id'], line['lineType'],
-                            line['x1'], line['y1'], line['x2'], line['y2']
-                        ))
-                    else:
-                        # 객체인 경우
-                        self.cursor.execute('''
-                            INSERT INTO RelationshipLines (
-                                tree_name, line_id, line_type, x1, y1, x2, y2
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            tree_name, line.id, line.lineType,
-                            line.x1, line.y1, line.x2, line.y2
-                        ))
+                self.cursor.execute(INSERT_PERSON_SQL, person_row(tree_name, person))
+            for line in relationship_lines or []:
+                self.cursor.execute(INSERT_LINE_SQL, line_row(tree_name, line))
+            self.rebuild_closure(tree_name)
             
             self.conn.commit()
+            self._mark_clean(people, relationship_lines)
             return f'"{tree_name}" 가계도가 성공적으로 저장되었습니다.'
         except Exception as e:
             self.conn.rollback()
             return f'저장 중 오류가 발생했습니다: {str(e)}'
     
-    def load_tree(self, tree_name: str):
-        """가계도 불러오기 (인물 목록, 관계선 목록 반환)"""
-        # 인물 로드
-        self.cursor.execute('''
-            SELECT * FROM People WHERE tree_name = ?
-        ''', (tree_name,))
+    def save_tree_delta(self, tree_name: str, people: List[Person], relationship_lines: List = None):
+        """가계도 저장 (마지막 저장 이후 변경/추가/삭제된 행만 기록)"""
+        person_rows, line_rows = snapshot_rows(tree_name, people, relationship_lines)
+        try:
+            self.write_snapshot(tree_name, person_rows, line_rows)
+        except Exception as e:
+            return f'저장 중 오류가 발생했습니다: {str(e)}'
+        self._mark_clean(people, relationship_lines)
+        return f'"{tree_name}" 가계도가 성공적으로 저장되었습니다.'
+    
+    def write_snapshot(self, tree_name: str, person_rows: List, line_rows: List,
+                       scope_ids=None, progress_callback=None):
+        """snapshot_rows() 결과를 하나의 트랜잭션으로 기록 (실패 시 롤백 후 예외 전달)
         
-        people = []
-        for row in self.cursor.fetchall():
-            person = Person(
-                id=row['person_id'],
-                name=row['name'],
-                birthYear=row['birth_year'],
-                gender=row['gender'],
-                isDeceased=bool(row['is_deceased']),
-                nodeType=row['node_type'],
-                x=row['x'],
-                y=row['y'],
-                parentId=row['parent_id'],
-                spouseId=row['spouse_id'],
-                relationshipType=row['relationship_type'],
-                multipleBirthGroupId=row['multiple_birth_group_id'],
-                nextIdenticalSiblingId=row['next_identical_sibling_id']
+        변경되었거나 아직 저장되지 않은 행은 upsert, 스냅샷에 없는 행은 삭제합니다.
+        일부만 불러온 가계도는 scope_ids(불러온 인물 ID)를 넘겨 그 안에서만 삭제를 판단합니다.
+        progress_callback(처리한 행 수, 전체 행 수)는 청크마다 호출됩니다.
+        """
+        try:
+            self.cursor.execute('''
+                INSERT OR IGNORE INTO FamilyTrees (tree_name) VALUES (?)
+            ''', (tree_name,))
+            
+            # 인물/관계선 각각 저장된 id와 비교하여 기록할 행과 삭제할 id 결정
+            self.cursor.execute(
+                'SELECT person_id, parent_id, spouse_id FROM People WHERE tree_name = ?', (tree_name,)
             )
-            people.append(person)
-
+            persisted_links = {row[0]: (row[1] or None, row[2] or None) for row in self.cursor.fetchall()}
+            persisted_ids = persisted_links.keys()
+            changed_people = [row for dirty, row in person_rows if dirty or row[1] not in persisted_ids]
+            removed_ids = persisted_ids - {row[1] for _, row in person_rows}
+            if scope_ids is not None:
+                removed_ids &= set(scope_ids)
+            
+            # 폐쇄 테이블 갱신 대상
+            # moved_ids: 새로 추가되었거나 parent_id가 바뀐 인물 (자신의 부모가 바뀜)
+            # couple_ids: 추가/삭제되었거나 spouse_id가 바뀐 인물과 그 전후 배우자 (자녀의 부모 구성이 바뀜)
+            moved_ids = []
+            couple_ids = set()
+            for row in changed_people:
+                old_parent, old_spouse = persisted_links.get(row[1], (None, None))
+                is_new = row[1] not in persisted_ids
+                if is_new or old_parent != (row[PARENT_COLUMN] or None):
+                    moved_ids.append(row[1])
+                if is_new or old_spouse != (row[SPOUSE_COLUMN] or None):
+                    couple_ids.update(pid for pid in (row[1], old_spouse, row[SPOUSE_COLUMN]) if pid)
+            for person_id in removed_ids:
+                couple_ids.update(pid for pid in (person_id, persisted_links[person_id][1]) if pid)
+            
+            self.cursor.execute('SELECT line_id FROM RelationshipLines WHERE tree_name = ?', (tree_name,))
+            persisted_line_ids = {row[0] for row in self.cursor.fetchall()}
+            changed_lines = [row for dirty, row in line_rows if dirty or row[1] not in persisted_line_ids]
+            removed_line_ids = persisted_line_ids - {row[1] for _, row in line_rows}
+            
+            self.cursor.executemany(DELETE_PERSON_SQL, [(tree_name, pid) for pid in removed_ids])
+            self.cursor.executemany(DELETE_LINE_SQL, [(tree_name, lid) for lid in removed_line_ids])
+            
+            total = len(changed_people) + len(changed_lines)
+            done = 0
+            for sql, rows in ((UPSERT_PERSON_SQL, changed_people), (UPSERT_LINE_SQL, changed_lines)):
+                for chunk in _chunks(rows):
+                    self.cursor.executemany(sql, chunk)
+                    done += len(chunk)
+                    if progress_callback:
+                        progress_callback(done, total)
+            
+            self._update_closure(tree_name, moved_ids, couple_ids, removed_ids)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+    
+    # --- 조상-자손 폐쇄 테이블 ---
+    
+    def rebuild_closure(self, tree_name: str):
+        """가계도의 폐쇄 테이블을 People의 부모(parent_id와 그 배우자)로부터 다시 구성 (커밋은 호출자가 처리)"""
+        self.cursor.execute('DELETE FROM PeopleClosure WHERE tree_name = ?', (tree_name,))
+        self.cursor.execute(
+            REBUILD_CLOSURE_SQL.format(where='WHERE tree_name = ?', max_depth=CLOSURE_MAX_DEPTH), (tree_name,)
+        )
+    
+    def _update_closure(self, tree_name: str, moved_ids: List[str], couple_ids, removed_ids):
+        """저장된 변경만큼 폐쇄 테이블 갱신 (People 행을 기록한 뒤 같은 트랜잭션에서 호출)
+        
+        부모 구성이 바뀐 인물이 있으면 조상이 달라지는 사람은 그 인물과 자손뿐입니다.
+        바뀌기 전 폐쇄 테이블로 이 사람들을 모은 뒤, 이들의 조상 행만 지우고 전체 재구성과
+        같은 재귀 쿼리로 다시 만듭니다. 한 사람이 두 부모를 통해 같은 조상에 닿을 수
+        있으므로 서브트리를 떼었다 붙이는 방식 대신 다시 계산합니다.
+        바뀐 인물이 많으면(처음 저장 등) 전체를 다시 구성합니다.
+        """
+        if len(moved_ids) + len(couple_ids) > DB_CHUNK_SIZE:
+            self.rebuild_closure(tree_name)
+            return
+        
+        # moved_ids는 자신과 자손, couple_ids는 자녀와 그 자손의 조상이 바뀜
+        affected = set(moved_ids)
+        for chunk in _chunks(list(affected | set(couple_ids)), SQL_PARAM_CHUNK):
+            cursor = self.cursor.execute(
+                f'''SELECT DISTINCT descendant_id FROM PeopleClosure
+                    WHERE tree_name = ? AND depth >= 1 AND ancestor_id IN ({", ".join("?" * len(chunk))})''',
+                (tree_name, *chunk)
+            )
+            affected.update(row[0] for row in cursor.fetchall())
+        
+        # 삭제된 인물은 자기 조상 행만 지움 (남은 자녀에게는 가상 부모로 남음)
+        for chunk in _chunks(list(affected | set(removed_ids)), SQL_PARAM_CHUNK):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(
+                f'DELETE FROM PeopleClosure WHERE tree_name = ? AND descendant_id IN ({placeholders})',
+                (tree_name, *chunk)
+            )
+            self.cursor.execute(
+                REBUILD_CLOSURE_SQL.format(
+                    where=f'WHERE tree_name = ? AND person_id IN ({placeholders})', max_depth=CLOSURE_MAX_DEPTH
+                ),
+                (tree_name, *chunk)
+            )
+    
+    def get_descendants(self, tree_name: str, person_id: str, max_depth: Optional[int] = None) -> List[Person]:
+        """인물의 자손 목록 (가까운 세대 순, max_depth가 있으면 그 세대까지)"""
+        return self._query_closure(tree_name, person_id, max_depth, ancestors=False)
+    
+    def get_ancestors(self, tree_name: str, person_id: str, max_depth: Optional[int] = None) -> List[Person]:
+        """인물의 조상 목록 (가까운 세대 순, 가상 부모는 제외)"""
+        return self._query_closure(tree_name, person_id, max_depth, ancestors=True)
+    
+    def load_subtree(self, tree_name: str, person_id: str, max_depth: Optional[int] = None) -> List[Person]:
+        """인물과 그 자손, 그리고 그들의 배우자만 불러오기 (부분 불러오기/내보내기용)"""
+        people = self._query_closure(tree_name, person_id, max_depth, ancestors=False, include_self=True)
+        loaded_ids = {p.id for p in people}
+        spouse_ids = list({p.spouseId for p in people if p.spouseId and p.spouseId not in loaded_ids})
+        for chunk in _chunks(spouse_ids, SQL_PARAM_CHUNK):
+            cursor = self.read_conn.execute(
+                f'SELECT {PERSON_COLUMNS} FROM People WHERE tree_name = ? AND person_id IN ({", ".join("?" * len(chunk))})',
+                (tree_name, *chunk)
+            )
+            people.extend(self._person_from_row(row) for row in cursor.fetchall())
+        return people
+    
+    def _query_closure(self, tree_name: str, person_id: str, max_depth: Optional[int],
+                       ancestors: bool, include_self: bool = False) -> List[Person]:
+        """폐쇄 테이블 인덱스로 조상 또는 자손 행 조회"""
+        key, target = ('descendant_id', 'ancestor_id') if ancestors else ('ancestor_id', 'descendant_id')
+        cursor = self.read_conn.execute(f'''
+            SELECT {PERSON_COLUMNS} FROM PeopleClosure c
+            JOIN People p ON p.tree_name = c.tree_name AND p.person_id = c.{target}
+            WHERE c.tree_name = ? AND c.{key} = ? AND c.depth >= ? AND (? IS NULL OR c.depth <= ?)
+            ORDER BY c.depth
+        ''', (tree_name, person_id, 0 if include_self else 1, max_depth, max_depth))
+        return [self._person_from_row(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def _mark_clean(people, relationship_lines=None):
+        """저장된 객체의 변경 표시 해제"""
+        for person in people:
+            person.mark_clean()
+        for line in relationship_lines or []:
+            if not isinstance(line, dict):
+                line.mark_clean()
+    
+    def load_tree(self, tree_name: str, progress_callback=None):
+        """가계도 불러오기 (인물 목록, 관계선 목록 반환)
+        
+        progress_callback(읽은 행 수, 전체 행 수)는 청크마다 호출됩니다.
+        """
+        total = 0
+        if progress_callback:
+            total = self.read_conn.execute('''
+                SELECT (SELECT COUNT(*) FROM People WHERE tree_name = ?)
+                     + (SELECT COUNT(*) FROM RelationshipLines WHERE tree_name = ?)
+            ''', (tree_name, tree_name)).fetchone()[0]
+        
+        # 인물 로드
+        cursor = self.read_conn.execute(
+            f'SELECT {PERSON_COLUMNS} FROM People WHERE tree_name = ?', (tree_name,)
+        )
+        
+        people = [self._person_from_row(row) for row in self._fetch_chunks(cursor, progress_callback, 0, total)]
+        
         # 관계선 로드
-        self.cursor.execute('''
-            SELECT * FROM RelationshipLines WHERE tree_name = ?
-        ''', (tree_name,))
+        cursor = self.read_conn.execute(
+            f'SELECT {LINE_COLUMNS} FROM RelationshipLines WHERE tree_name = ?', (tree_name,)
+        )
         
         relationship_lines = []
-        from models import RelationshipLine
-        for row in self.cursor.fetchall():
-            line = RelationshipLine(
-                id=row['line_id'],
-                lineType=row['line_type'],
-                x1=row['x1'],
-                y1=row['y1'],
-                x2=row['x2'],
-                y2=row['y2']
-            )
+        for row in self._fetch_chunks(cursor, progress_callback, len(people), total):
+            line = RelationshipLine.from_tuple(tuple(row))
+            line.mark_clean()
             relationship_lines.append(line)
         
         return people, relationship_lines
     
+    # --- 영역 단위 불러오기 ---
+    
+    def count_people(self, tree_name: str) -> int:
+        """가계도의 인물 수"""
+        return self.read_conn.execute(
+            'SELECT COUNT(*) FROM People WHERE tree_name = ?', (tree_name,)
+        ).fetchone()[0]
+    
+    def get_tree_bounds(self, tree_name: str) -> Optional[Tuple[float, float, float, float]]:
+        """저장된 인물 좌표의 (min_x, min_y, max_x, max_y) 범위 (인물이 없으면 None)"""
+        row = self.read_conn.execute(
+            'SELECT MIN(x), MIN(y), MAX(x), MAX(y) FROM People WHERE tree_name = ?', (tree_name,)
+        ).fetchone()
+        return None if row[0] is None else tuple(row)
+    
+    def find_root_person(self, tree_name: str) -> Optional[Person]:
+        """처음 입력한 인물(부모도 배우자도 없는 사람, 없으면 첫 인물) 조회"""
+        row = self.read_conn.execute(f'''
+            SELECT {PERSON_COLUMNS} FROM People WHERE tree_name = ?
+            ORDER BY (IFNULL(parent_id, '') = '' AND IFNULL(spouse_id, '') = '') DESC, id
+            LIMIT 1
+        ''', (tree_name,)).fetchone()
+        return self._person_from_row(row) if row else None
+    
+    def load_people_in_rect(self, tree_name: str, left: float, top: float,
+                            right: float, bottom: float) -> List[Person]:
+        """좌표(노드 중심)가 사각형 안에 있는 인물만 불러오기"""
+        cursor = self._query_rect(PERSON_COLUMNS, tree_name, left, top, right, bottom)
+        return [self._person_from_row(row) for row in cursor.fetchall()]
+    
+    def find_people_in_rect(self, tree_name: str, left: float, top: float,
+                            right: float, bottom: float) -> List[str]:
+        """좌표가 사각형 안에 있는 인물 ID 목록"""
+        cursor = self._query_rect('p.person_id', tree_name, left, top, right, bottom)
+        return [row[0] for row in cursor.fetchall()]
+    
+    def _query_rect(self, columns: str, tree_name: str, left: float, top: float, right: float, bottom: float):
+        """사각형 영역 조회 (R*Tree가 있으면 공간 색인, 없으면 좌표 인덱스 사용)"""
+        if self.has_rtree:
+            return self.read_conn.execute(
+                RTREE_RECT_SQL.format(columns=columns),
+                (right, left, bottom, top, tree_name, left, right, top, bottom)
+            )
+        return self.read_conn.execute(f'''
+            SELECT {columns} FROM People p
+            WHERE p.tree_name = ? AND p.x BETWEEN ? AND ? AND p.y BETWEEN ? AND ?
+        ''', (tree_name, left, right, top, bottom))
+    
+    def find_nearest_person(self, tree_name: str, x: float, y: float,
+                            max_distance: Optional[float] = None) -> Optional[str]:
+        """(x, y)에 가장 가까운 인물 ID (max_distance 안에 없으면 None)
+        
+        정사각형 검색 범위를 두 배씩 넓히며 영역 조회를 반복합니다. 반지름 r 범위에서
+        거리 r 이내의 인물을 찾으면, 더 가까운 인물은 반드시 그 범위 안에 있으므로
+        조회 횟수는 가장 가까운 인물까지 거리의 로그에 비례합니다.
+        """
+        if self.read_conn.execute('SELECT 1 FROM People WHERE tree_name = ? LIMIT 1', (tree_name,)).fetchone() is None:
+            return None
+        
+        radius = max(NODE_WIDTH, NODE_HEIGHT)
+        while True:
+            if max_distance is not None:
+                radius = min(radius, max_distance)
+            cursor = self._query_rect(
+                'p.person_id, p.x, p.y', tree_name, x - radius, y - radius, x + radius, y + radius
+            )
+            best = min(
+                (((px - x) ** 2 + (py - y) ** 2, person_id) for person_id, px, py in cursor.fetchall()),
+                default=None
+            )
+            if best is not None and best[0] <= radius ** 2:
+                return best[1]
+            if max_distance is not None and radius >= max_distance:
+                return None
+            # 범위 모서리에서 찾은 인물까지 넓히면 더 가까운 인물은 반드시 그 안에 있음
+            radius = math.sqrt(best[0]) + 1 if best is not None else radius * 2
+    
+    def find_overlapping_people(self, tree_name: str, width: float = NODE_WIDTH,
+                                height: float = NODE_HEIGHT) -> List[Tuple[str, str]]:
+        """노드(중심 기준 width x height)가 서로 겹치는 인물 ID 쌍 목록
+        
+        인물마다 주변 영역만 공간 색인으로 조회하므로 전체 비교 없이 O(n log n)에 찾습니다.
+        """
+        if self.has_rtree:
+            # CROSS JOIN으로 순서를 고정해 인물마다 R*Tree 영역 조회가 되도록 함
+            cursor = self.read_conn.execute('''
+                SELECT a.person_id, b.person_id FROM People a
+                CROSS JOIN PeopleRTree r CROSS JOIN People b
+                WHERE a.tree_name = ?3
+                  AND r.min_x < a.x + ?1 AND r.max_x > a.x - ?1
+                  AND r.min_y < a.y + ?2 AND r.max_y > a.y - ?2
+                  AND b.id = r.id AND b.tree_name = ?3 AND a.id < b.id
+                  AND ABS(a.x - b.x) < ?1 AND ABS(a.y - b.y) < ?2
+            ''', (width, height, tree_name))
+        else:
+            cursor = self.read_conn.execute('''
+                SELECT a.person_id, b.person_id FROM People a
+                CROSS JOIN People b
+                WHERE a.tree_name = ?3
+                  AND b.tree_name = ?3 AND b.x > a.x - ?1 AND b.x < a.x + ?1
+                  AND a.id < b.id AND ABS(a.y - b.y) < ?2
+            ''', (width, height, tree_name))
+        return [tuple(row) for row in cursor.fetchall()]
+    
+    def load_relationship_lines(self, tree_name: str) -> List[RelationshipLine]:
+        """가계도의 감정 관계선만 불러오기"""
+        cursor = self.read_conn.execute(
+            f'SELECT {LINE_COLUMNS} FROM RelationshipLines WHERE tree_name = ?', (tree_name,)
+        )
+        relationship_lines = []
+        for row in cursor.fetchall():
+            line = RelationshipLine.from_tuple(tuple(row))
+            line.mark_clean()
+            relationship_lines.append(line)
+        return relationship_lines
+    
+    @staticmethod
+    def _person_from_row(row) -> Person:
+        """PERSON_COLUMNS 순서의 행을 저장된 상태의 Person으로 변환"""
+        # is_deceased는 정수로 저장되므로 bool로 변환
+        values = tuple(row)
+        person = Person.from_tuple(values[:4] + (bool(values[4]),) + values[5:])
+        person.mark_clean()
+        return person
+    
+    @staticmethod
+    def _fetch_chunks(cursor, progress_callback, done: int, total: int):
+        """커서 결과를 청크 단위로 읽으며 진행률 보고"""
+        while True:
+            rows = cursor.fetchmany(DB_CHUNK_SIZE)
+            if not rows:
+                return
+            done += len(rows)
+            if progress_callback:
+                progress_callback(done, total)
+            yield from rows
+    
+    # --- 자동 저장 저널 ---
+    
+    def append_journal(self, tree_name: str, records: List, lock_timeout_ms: Optional[int] = None):
+        """저널에 (kind, op, item_id, data) 기록 추가
+        
+        lock_timeout_ms가 있으면 다른 연결이 쓰기 잠금을 잡고 있을 때 기본 대기 시간
+        대신 그만큼만 기다린 뒤 'database is locked' 예외를 냅니다.
+        """
+        busy_timeout = None
+        if lock_timeout_ms is not None:
+            busy_timeout = self.conn.execute('PRAGMA busy_timeout').fetchone()[0]
+            self.conn.execute(f'PRAGMA busy_timeout = {int(lock_timeout_ms)}')
+        try:
+            self.cursor.executemany(INSERT_JOURNAL_SQL, [(tree_name, *record) for record in records])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            if busy_timeout is not None:
+                self.conn.execute(f'PRAGMA busy_timeout = {busy_timeout}')
+    
+    def get_journal_seq(self, tree_name: str) -> int:
+        """가계도의 마지막 저널 순번 (없으면 0)"""
+        cursor = self.read_conn.execute(
+            'SELECT MAX(seq) FROM AutosaveJournal WHERE tree_name = ?', (tree_name,)
+        )
+        return cursor.fetchone()[0] or 0
+    
+    def get_journal_trees(self) -> List[str]:
+        """저널이 남아 있는 가계도 이름 목록 (최근에 기록된 순)"""
+        cursor = self.read_conn.execute('''
+            SELECT tree_name FROM AutosaveJournal GROUP BY tree_name ORDER BY MAX(seq) DESC
+        ''')
+        return [row['tree_name'] for row in cursor.fetchall()]
+    
+    def load_journal(self, tree_name: str) -> List:
+        """가계도의 저널 기록 (kind, op, item_id, data)을 순서대로 조회"""
+        cursor = self.read_conn.execute('''
+            SELECT kind, op, item_id, data FROM AutosaveJournal WHERE tree_name = ? ORDER BY seq
+        ''', (tree_name,))
+        return [tuple(row) for row in cursor.fetchall()]
+    
+    def clear_journal(self, tree_name: str, up_to_seq: Optional[int] = None):
+        """가계도의 저널 삭제 (up_to_seq가 있으면 그 순번까지만)"""
+        if up_to_seq is None:
+            self.cursor.execute('DELETE FROM AutosaveJournal WHERE tree_name = ?', (tree_name,))
+        else:
+            self.cursor.execute(
+                'DELETE FROM AutosaveJournal WHERE tree_name = ? AND seq <= ?', (tree_name, up_to_seq)
+            )
+        self.conn.commit()
+    
+    def compact_journal(self, tree_name: str, progress_callback=None) -> int:
+        """항목별 마지막 기록만 남기고 이전 기록 삭제 (삭제한 행 수 반환)"""
+        try:
+            self.cursor.execute('''
+                DELETE FROM AutosaveJournal
+                WHERE tree_name = ? AND seq NOT IN (
+                    SELECT MAX(seq) FROM AutosaveJournal WHERE tree_name = ? GROUP BY kind, item_id
+                )
+            ''', (tree_name, tree_name))
+            removed = self.cursor.rowcount
+            self.conn.commit()
+            return removed
+        except Exception:
+            self.conn.rollback()
+            raise
+    
     def delete_tree(self, tree_name: str) -> str:
         """가계도 삭제"""
         try:
             # People 테이블에서 먼저 삭제 (외래키 제약조건)
             self.cursor.execute('DELETE FROM People WHERE tree_name = ?', (tree_name,))
             self.cursor.execute('DELETE FROM RelationshipLines WHERE tree_name = ?', (tree_name,))
+            self.cursor.execute('DELETE FROM AutosaveJournal WHERE tree_name = ?', (tree_name,))
+            self.cursor.execute('DELETE FROM PeopleClosure WHERE tree_name = ?', (tree_name,))
             
             # FamilyTrees 테이블에서 삭제
             self.cursor.execute('DELETE FROM FamilyTrees WHERE tree_name = ?', (tree_name,))
@@ -204,5 +818,7 @@ class Database:
     
     def close(self):
         """데이터베이스 연결 종료"""
-        if self.conn:
-            self.conn.close()
+        if self.connections:
+            self.connections.close()
+        self.conn = None
+        self.read_conn = None
@@ -0,0 +1,40 @@
+"""
+백그라운드 데이터베이스 작업 (저장/불러오기)
+"""
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from database import Database
+
+
+class DatabaseTaskSignals(QObject):
+    """작업 스레드에서 GUI 스레드로 결과를 전달하는 시그널"""
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    failed = pyqtSignal(str)
+
+
+class DatabaseTask(QRunnable):
+    """자체 연결을 열어 func(db, *args, progress_callback=...)를 실행하는 작업
+    
+    SQLite 연결은 스레드 간에 공유할 수 없으므로 작업마다 새 Database를 열고,
+    모델 객체 대신 GUI 스레드에서 만든 스냅샷만 넘겨받습니다.
+    """
+    
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = DatabaseTaskSignals()
+    
+    def run(self):
+        """작업 실행 (작업 스레드)"""
+        db = None
+        try:
+            db = Database()
+            result = self.func(db, *self.args, progress_callback=self.signals.progress.emit)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            if db:
+                db.close()
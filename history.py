@@ -0,0 +1,148 @@
+"""
+실행 취소/다시 실행 기록 관리
+"""
+from collections import deque
+from config import UNDO_HISTORY_LIMIT
+from models import add_change_listener, remove_change_listener
+
+
+class EditRecord:
+    """한 작업 구간 동안의 변경 내역
+    
+    전체 상태 대신 바뀐 필드(이전 값/새 값)와 목록 추가/삭제만 저장합니다.
+    같은 객체의 같은 필드가 여러 번 바뀌면(드래그 등) 하나로 합칩니다.
+    """
+    
+    __slots__ = ('changes', '_field_positions')
+    
+    def __init__(self):
+        # ['set', obj, field, old, new] / ['insert' | 'remove', list_name, index, obj]
+        self.changes = []
+        self._field_positions = {}  # (id(obj), field) -> changes 내 위치
+    
+    def __len__(self):
+        return len(self.changes)
+    
+    def record_field(self, obj, field_name, old_value, new_value):
+        key = (id(obj), field_name)
+        position = self._field_positions.get(key)
+        if position is None:
+            self._field_positions[key] = len(self.changes)
+            self.changes.append(['set', obj, field_name, old_value, new_value])
+        else:
+            self.changes[position][4] = new_value
+    
+    def record_list_change(self, kind, list_name, index, obj):
+        self.changes.append([kind, list_name, index, obj])
+
+
+class EditHistory:
+    """변경 내역(패치) 기반 실행 취소/다시 실행 스택
+    
+    checkpoint()로 작업 구간을 나누고, 그 사이의 모델 필드 변경은
+    모델 변경 알림으로 자동 기록됩니다. 목록 추가/삭제는
+    record_insert()/record_remove()로 직접 기록합니다.
+    
+    Args:
+        target: 복원할 목록을 속성으로 가진 객체 (예: MainWindow.people)
+        on_list_change: 실행 취소/다시 실행으로 목록이 바뀔 때 호출
+            on_list_change(list_name, obj, inserted)
+        limit: 보관할 최대 작업 수
+    """
+    
+    def __init__(self, target, on_list_change=None, limit: int = UNDO_HISTORY_LIMIT):
+        self.target = target
+        self.on_list_change = on_list_change
+        self.records = deque(maxlen=limit)
+        self.redo_records = []
+        self._applying = False
+        add_change_listener(self._on_model_changed)
+    
+    def detach(self):
+        """모델 변경 알림 수신 중단"""
+        remove_change_listener(self._on_model_changed)
+    
+    def clear(self):
+        """기록 전체 삭제"""
+        self.records.clear()
+        self.redo_records.clear()
+    
+    def checkpoint(self):
+        """새 작업 구간 시작 (새로운 작업이 발생하면 redo 기록 초기화)"""
+        self.redo_records.clear()
+        self.records.append(EditRecord())
+    
+    def can_undo(self) -> bool:
+        return len(self.records) > 1
+    
+    def can_redo(self) -> bool:
+        return bool(self.redo_records)
+    
+    # --- 기록 ---
+    
+    def _on_model_changed(self, obj, field_name, old_value, new_value):
+        if self._applying or not self.records:
+            return
+        self.records[-1].record_field(obj, field_name, old_value, new_value)
+    
+    def record_insert(self, list_name: str, index: int, obj):
+        """목록에 객체가 추가되었음을 기록"""
+        if self.records and not self._applying:
+            self.records[-1].record_list_change('insert', list_name, index, obj)
+    
+    def record_remove(self, list_name: str, index: int, obj):
+        """목록에서 객체가 삭제되었음을 기록"""
+        if self.records and not self._applying:
+            self.records[-1].record_list_change('remove', list_name, index, obj)
+    
+    # --- 복원 ---
+    
+    def undo(self) -> bool:
+        """마지막 작업 구간의 변경을 역순으로 되돌림"""
+        if not self.can_undo():
+            return False
+        record = self.records.pop()
+        self._apply(record, reverse=True)
+        self.redo_records.append(record)
+        return True
+    
+    def redo(self) -> bool:
+        """취소한 작업 구간의 변경을 다시 적용"""
+        if not self.redo_records:
+            return False
+        record = self.redo_records.pop()
+        self._apply(record, reverse=False)
+        self.records.append(record)
+        return True
+    
+    def _apply(self, record: EditRecord, reverse: bool):
+        self._applying = True
+        try:
+            changes = reversed(record.changes) if reverse else record.changes
+            for change in changes:
+                kind = change[0]
+                if kind == 'set':
+                    _, obj, field_name, old_value, new_value = change
+                    setattr(obj, field_name, old_value if reverse else new_value)
+                else:
+                    _, list_name, index, obj = change
+                    inserting = (kind == 'insert') != reverse
+                    self._apply_list_change(list_name, index, obj, inserting)
+        finally:
+            self._applying = False
+    
+    def _apply_list_change(self, list_name, index, obj, inserting):
+        items = getattr(self.target, list_name)
+        if inserting:
+            items.insert(min(index, len(items)), obj)
+        else:
+            # 기록된 위치를 먼저 확인하고, 어긋났으면 객체로 찾음
+            if index < len(items) and items[index] is obj:
+                del items[index]
+            else:
+                for i, item in enumerate(items):
+                    if item is obj:
+                        del items[i]
+                        break
+        if self.on_list_change:
+            self.on_list_change(list_name, obj, inserting)
@@ -6,6 +6,7 @@ from PyQt6.QtGui import QImage, QPainter
 from PyQt6.QtCore import QRectF
 from typing import List
 from models import Person
+from coordinate_store import CoordinateStore
 from config import NODE_WIDTH, NODE_HEIGHT
 
 
@@ -13,7 +14,8 @@ class ImageExporter:
     """캔버스를 이미지로 내보내기"""
     
     @staticmethod
-    def export_to_image(scene: QGraphicsScene, people: List[Person], format: str = 'png') -> QImage:
+    def export_to_image(scene: QGraphicsScene, people: List[Person], format: str = 'png',
+                        coordinates: CoordinateStore = None) -> QImage:
         """
         씬을 이미지로 변환
         
@@ -21,6 +23,7 @@ class ImageExporter:
             scene: 그래픽 씬
             people: 인물 목록 (bounding box 계산용)
             format: 'png' 또는 'jpeg'
+            coordinates: 인물 좌표 저장소 (있으면 배열 연산으로 범위 계산)
         
         Returns:
             QImage 객체
@@ -30,10 +33,18 @@ class ImageExporter:
         
         # 모든 노드를 포함하는 영역 계산
         padding = 20
-        min_x = min(p.x - NODE_WIDTH for p in people)
-        min_y = min(p.y - NODE_HEIGHT for p in people)
-        max_x = max(p.x + NODE_WIDTH for p in people)
-        max_y = max(p.y + NODE_HEIGHT for p in people)
+        bounds = coordinates.bounds() if coordinates is not None else None
+        if bounds:
+            min_x, min_y, max_x, max_y = bounds
+        else:
+            min_x = min(p.x for p in people)
+            min_y = min(p.y for p in people)
+            max_x = max(p.x for p in people)
+            max_y = max(p.y for p in people)
+        min_x -= NODE_WIDTH
+        min_y -= NODE_HEIGHT
+        max_x += NODE_WIDTH
+        max_y += NODE_HEIGHT
         
         content_width = max_x - min_x
         content_height = max_y - min_y
@@ -0,0 +1,270 @@
+"""
+촌수 및 친족 호칭 계산
+"""
+from typing import Dict, List, Optional, Tuple
+from models import Person
+
+
+# (윗세대로 올라간 수, 아랫세대로 내려간 수) -> (남자, 여자, 성별 미상) 호칭
+KINSHIP_TERMS = {
+    (1, 0): ('아버지', '어머니', '부모'),
+    (2, 0): ('할아버지', '할머니', '조부모'),
+    (3, 0): ('증조할아버지', '증조할머니', '증조부모'),
+    (0, 1): ('아들', '딸', '자녀'),
+    (0, 2): ('손자', '손녀', '손주'),
+    (0, 3): ('증손자', '증손녀', '증손주'),
+    (1, 1): ('형제', '자매', '형제자매'),
+    (2, 1): ('삼촌', '고모', '부모의 형제자매'),
+    (1, 2): ('조카', '조카딸', '조카'),
+    (2, 2): ('사촌', '사촌', '사촌'),
+    (3, 1): ('종조할아버지', '종조할머니', '조부모의 형제자매'),
+    (1, 3): ('종손자', '종손녀', '종손주'),
+    (3, 2): ('당숙', '당고모', '오촌'),
+    (2, 3): ('당질', '당질녀', '당질'),
+    (3, 3): ('육촌', '육촌', '육촌'),
+}
+
+# 어머니 쪽(외가) 호칭이 따로 있는 경우
+MATERNAL_TERMS = {
+    (2, 0): ('외할아버지', '외할머니', '외조부모'),
+    (3, 0): ('외증조할아버지', '외증조할머니', '외증조부모'),
+    (2, 1): ('외삼촌', '이모', '부모의 형제자매'),
+    (2, 2): ('외사촌', '외사촌', '외사촌'),
+    (3, 1): ('외종조할아버지', '외종조할머니', '조부모의 형제자매'),
+}
+
+# 기준 인물 성별 -> 배우자의 부모 호칭
+SPOUSE_PARENT_TERMS = {
+    'male': ('장인', '장모', '배우자의 부모'),
+    'female': ('시아버지', '시어머니', '배우자의 부모'),
+}
+
+
+def _by_gender(terms: Tuple[str, str, str], gender: str) -> str:
+    if gender == 'male':
+        return terms[0]
+    if gender == 'female':
+        return terms[1]
+    return terms[2]
+
+
+def kinship_term(up: int, down: int, gender: str, maternal: bool = False) -> str:
+    """공통 조상까지 up세대 올라가 down세대 내려간 혈족의 호칭 (gender는 상대방 성별)"""
+    terms = (MATERNAL_TERMS.get((up, down)) if maternal else None) or KINSHIP_TERMS.get((up, down))
+    if terms:
+        return _by_gender(terms, gender)
+    if down == 0:
+        return f"{up}대 조상"
+    if up == 0:
+        return f"{down}대 후손"
+    return f"{'외가 ' if maternal else ''}{up + down}촌"
+
+
+class KinshipIndex:
+    """parentId/spouseId로 이어진 친족 관계의 촌수와 호칭을 계산하는 색인
+    
+    부부를 한 단위로 묶고, 단위마다 두 구성원 각자의 부모 가족(목록에 없는 parentId는
+    가상 부모 단위)으로 올라가는 간선을 둔 부모 가족 DAG를 만듭니다. 아버지 쪽과
+    어머니 쪽 부모 가족이 모두 실제 조상이므로 외할머니의 친정처럼 세대마다 다른
+    쪽으로 갈아타는 관계도 찾습니다.
+    
+    가장 가까운 공통 조상은 두 사람에게서 덜 올라간 쪽부터 한 세대씩 번갈아 올라가며
+    찾고, 남은 조상으로 더 가까운 촌수가 나올 수 없으면 멈춥니다. 따라서 조회 비용은
+    가계도 크기가 아니라 찾은 촌수 안에 있는 두 사람의 조상 수에 비례하며, 이어지지
+    않은 집안끼리는 미리 구한 연결 요소로 바로 판단합니다. 배우자 쪽 친족과 친족의
+    배우자는 인척으로 표시합니다.
+    
+    조회는 O(log n)이 아닙니다. 한 줄로 깊게 이어진 가계도의 먼 두 사람은 공통 조상까지의
+    세대 수만큼 올라가야 하므로 최악의 경우 O(n)입니다. 세대마다 양쪽 부모 가족으로
+    갈아탈 수 있어 조상을 한 줄로 놓는 건너뛰기 표를 쓸 수 없기 때문입니다.
+    
+    PersonIndex.version이 바뀐 뒤(인물 추가/삭제, parentId/spouseId 변경) 처음 조회할 때
+    색인 전체를 O(n)으로 다시 만듭니다. 이름이나 좌표만 바뀌면 다시 만들지 않습니다.
+    """
+    
+    def __init__(self, person_index):
+        self.person_index = person_index
+        self._version = None
+    
+    def _ensure(self):
+        if self._version != self.person_index.version:
+            self._build()
+            self._version = self.person_index.version
+    
+    # --- 색인 구성 ---
+    
+    def _unit_key(self, person: Person):
+        spouse = self.person_index.get(person.spouseId)
+        if spouse is not None and spouse is not person and spouse.spouseId == person.id:
+            return ('unit', min(person.id, spouse.id))
+        return ('unit', person.id)
+    
+    def _parent_key(self, person: Person):
+        parent = self.person_index.get(person.parentId)
+        if parent is not None:
+            return self._unit_key(parent)
+        return ('virtual', person.parentId)
+    
+    def _build(self):
+        index: Dict[object, int] = {}
+        # 노드 -> [(부모 가족 노드, 그쪽으로 이어지는 구성원)] (구성원마다 하나, 가상 부모는 빈 목록)
+        self._parents: List[List[Tuple[int, Person]]] = []
+        # 노드 -> 구성원 (가상 부모는 빈 목록)
+        self._members: List[List[Person]] = []
+        # 인물 id -> 단위 노드, 자신의 부모 가족 노드 (없으면 -1)
+        self._unit_of: Dict[str, int] = {}
+        self._parent_of: Dict[str, int] = {}
+        
+        def node(key):
+            if key not in index:
+                index[key] = len(self._parents)
+                self._parents.append([])
+                self._members.append([])
+            return index[key]
+        
+        for person in self.person_index:
+            unit = node(self._unit_key(person))
+            self._members[unit].append(person)
+            self._unit_of[person.id] = unit
+        
+        for person in self.person_index:
+            unit = self._unit_of[person.id]
+            parent = node(self._parent_key(person)) if person.parentId else -1
+            # 자기 단위를 부모로 가리키는 잘못된 참조는 무시
+            if parent == unit:
+                parent = -1
+            self._parent_of[person.id] = parent
+            if parent >= 0:
+                self._parents[unit].append((parent, person))
+        for members in self._members:
+            members.sort(key=lambda p: p.id)
+        
+        # 연결 요소 (서로 이어지지 않은 집안은 조상을 찾지 않고 바로 판단)
+        component = list(range(len(self._parents)))
+        
+        def find(v):
+            while component[v] != v:
+                component[v] = component[component[v]]
+                v = component[v]
+            return v
+        
+        for unit, parents in enumerate(self._parents):
+            for parent, _ in parents:
+                component[find(parent)] = find(unit)
+        self._component = [find(v) for v in range(len(component))]
+    
+    # --- 조회 ---
+    
+    def _spouse(self, person: Person) -> Optional[Person]:
+        """같은 단위의 배우자"""
+        members = self._members[self._unit_of[person.id]]
+        return next((m for m in members if m is not person), None)
+    
+    def _climb(self, person: Person):
+        """person의 혈족 조상을 세대별로 생성: [(노드, 경유한 부모)] (0세대는 자기 단위)
+        
+        자기 단위에서는 자신의 부모 가족으로만 올라가고(배우자의 부모는 인척), 그 위로는
+        부모 가족마다 두 구성원의 부모 가족으로 모두 올라갑니다. 경유한 부모는 2세대
+        이상 위의 조상이 person의 부모 중 누구 쪽인지 나타냅니다.
+        """
+        unit = self._unit_of[person.id]
+        yield [(unit, None)]
+        parent = self._parent_of[person.id]
+        if parent < 0:
+            return
+        seen = {unit, parent}
+        level = [(parent, None)]
+        while level:
+            yield level
+            next_level = []
+            for node, side in level:
+                for ancestor, member in self._parents[node]:
+                    if ancestor not in seen:
+                        seen.add(ancestor)
+                        next_level.append((ancestor, side or member))
+            level = next_level
+    
+    def _nearest_common(self, a: Person, b: Person) -> Optional[Tuple[int, int, Optional[Person]]]:
+        """a와 b의 가장 가까운 공통 혈족 조상까지 (올라간 세대 수, 내려간 세대 수, a 쪽 경유 부모)"""
+        climbs = (self._climb(a), self._climb(b))
+        # 쪽마다 노드 -> (세대, 경유한 부모), 지금까지 펼친 세대, 다 펼쳤는지
+        seen: Tuple[Dict[int, Tuple[int, Optional[Person]]], ...] = ({}, {})
+        depth = [-1, -1]
+        done = [False, False]
+        best = None
+        while True:
+            open_sides = [i for i in (0, 1) if not done[i]]
+            if not open_sides:
+                break
+            # 아직 찾지 못한 공통 조상은 펼치지 않은 세대에 있으므로 그보다 가까울 수 없음
+            if best is not None and best[0] + best[1] <= min(depth[i] for i in open_sides) + 1:
+                break
+            side = min(open_sides, key=lambda i: depth[i])
+            level = next(climbs[side], None)
+            if level is None:
+                done[side] = True
+                continue
+            depth[side] += 1
+            other = seen[1 - side]
+            for node, via in level:
+                seen[side][node] = (depth[side], via)
+                if node in other:
+                    steps = (depth[side], other[node][0]) if side == 0 else (other[node][0], depth[side])
+                    if best is None or sum(steps) < best[0] + best[1]:
+                        best = (steps[0], steps[1], seen[0][node][1])
+        return best
+    
+    def relation(self, a_id: str, b_id: str) -> Optional[Tuple[Optional[int], str]]:
+        """a 기준으로 본 b의 (촌수, 호칭)
+        
+        배우자는 촌수 0(무촌), 인척끼리처럼 촌수를 정하지 않는 관계는 촌수 None,
+        이어진 관계가 없으면 None을 반환합니다.
+        """
+        a = self.person_index.get(a_id)
+        b = self.person_index.get(b_id)
+        if a is None or b is None:
+            return None
+        if a is b:
+            return 0, '본인'
+        self._ensure()
+        
+        unit_a, unit_b = self._unit_of[a.id], self._unit_of[b.id]
+        if unit_a == unit_b:
+            return 0, _by_gender(('남편', '아내', '배우자'), b.gender)
+        if self._component[unit_a] != self._component[unit_b]:
+            return None
+        
+        # 혈족끼리 -> 한쪽이 인척 -> 둘 다 인척 순서로, 먼저 이어지는 쪽의 가장 가까운 관계
+        spouse_a, spouse_b = self._spouse(a), self._spouse(b)
+        starts_a = [(a, False)] + ([(spouse_a, True)] if spouse_a else [])
+        starts_b = [(b, False)] + ([(spouse_b, True)] if spouse_b else [])
+        best = None
+        for in_laws in range(3):
+            for start_a, a_in_law in starts_a:
+                for start_b, b_in_law in starts_b:
+                    if a_in_law + b_in_law != in_laws:
+                        continue
+                    common = self._nearest_common(start_a, start_b)
+                    if common is not None and (best is None or sum(common[:2]) < sum(best[0][:2])):
+                        best = (common, a_in_law, b_in_law)
+            if best is not None:
+                break
+        if best is None:
+            return None
+        
+        (up, down, first_a), a_in_law, b_in_law = best
+        maternal = first_a is not None and first_a.gender == 'female'
+        if b_in_law:
+            # b는 혈족의 배우자이므로 호칭은 그 혈족 기준
+            if (up, down) == (0, 1) and not a_in_law:
+                term = _by_gender(('사위', '며느리', '자녀의 배우자'), b.gender)
+            else:
+                term = kinship_term(up, down, spouse_b.gender, maternal) + '의 배우자'
+        else:
+            term = kinship_term(up, down, b.gender, maternal)
+        if a_in_law:
+            if (up, down) == (1, 0) and not b_in_law and a.gender in SPOUSE_PARENT_TERMS:
+                term = _by_gender(SPOUSE_PARENT_TERMS[a.gender], b.gender)
+            else:
+                term = '배우자의 ' + term
+        return (up + down if a_in_law + b_in_law < 2 else None), term
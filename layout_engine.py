@@ -0,0 +1,595 @@
+"""
+자동 정렬 (세대별 정돈된 트리 배치)
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from models import Person, add_change_listener, remove_change_listener
+from config import NODE_WIDTH, SIBLING_SPACING, LEVEL_SPACING
+
+
+# 한 단위 안에서 배우자 두 사람의 중심 간격
+COUPLE_STEP = NODE_WIDTH + SIBLING_SPACING
+
+# 값이 바뀌면 배치 단위 구조(부부/부모 가족/다태아 순서)가 달라지는 인물 필드
+STRUCTURE_FIELDS = ('parentId', 'spouseId', 'multipleBirthGroupId')
+
+
+class LayoutUnit:
+    """배치 단위: 한 사람 또는 부부 (가상 부모는 구성원이 없는 폭 0의 단위)"""
+    
+    __slots__ = ('key', 'members', 'parent', 'children', 'link', 'rel_x', 'contour', 'x', 'generation', 'placed')
+    
+    def __init__(self, key, members: List[Person]):
+        self.key = key
+        self.members = members
+        self.parent: Optional['LayoutUnit'] = None
+        self.children: List['LayoutUnit'] = []
+        # 부모 단위와 연결되는 구성원 (자녀 정렬 기준)
+        self.link: Optional[Person] = None
+        # 부모 단위 중심 기준 x 오프셋 (루트는 배치된 x)
+        self.rel_x = 0.0
+        self.contour: Optional[Contour] = None
+        # 마지막으로 배치된 중심 x와 세대 (placed가 False면 아직 배치 전)
+        self.x = 0.0
+        self.generation = 0
+        self.placed = False
+    
+    @property
+    def width(self) -> float:
+        if not self.members:
+            return 0.0
+        return len(self.members) * NODE_WIDTH + (len(self.members) - 1) * SIBLING_SPACING
+
+
+class Contour:
+    """서브트리의 세대별 왼쪽/오른쪽 경계 (단위 중심 기준)
+    
+    경계마다 맨 위 세대부터 (값, 다음 노드) 튜플을 이은 불변 연결 목록으로 저장하며,
+    첫 노드는 중심 기준 값, 나머지는 바로 위 세대 값과의 차이입니다. 두 경계를 합칠
+    때는 얕은 쪽 세대 수만큼만 새 노드를 만들고 더 깊은 쪽의 아래 세대는 공유하므로,
+    전체 배치 비용이 인물 수에 비례하고 자녀의 경계는 그대로 남아 증분 배치에서
+    다시 쓸 수 있습니다.
+    """
+    
+    __slots__ = ('left', 'right', 'depth', '_edges')
+    
+    def __init__(self, left: tuple, right: tuple, depth: int = 1):
+        self.left = left
+        self.right = right
+        self.depth = depth
+        self._edges = None
+    
+    def __len__(self):
+        return self.depth
+    
+    def edges(self) -> Tuple[List[float], List[float]]:
+        """세대별 (왼쪽 경계, 오른쪽 경계) 값 목록 (맨 위 세대부터)"""
+        if self._edges is None:
+            self._edges = (_values(self.left), _values(self.right))
+        return self._edges
+
+
+def _values(node: Optional[tuple]) -> List[float]:
+    values = []
+    x = 0.0
+    while node is not None:
+        x += node[0]
+        values.append(x)
+        node = node[1]
+    return values
+
+
+def _separation(left: Contour, right: Contour) -> float:
+    """right 서브트리를 left 오른쪽에 겹치지 않게 놓기 위한 최소 중심 거리"""
+    need = float('-inf')
+    a, b = left.right, right.left
+    ax = bx = 0.0
+    while a is not None and b is not None:
+        ax += a[0]
+        bx += b[0]
+        if ax - bx > need:
+            need = ax - bx
+        a, b = a[1], b[1]
+    return need + SIBLING_SPACING
+
+
+def _splice(head: tuple, head_shift: float, tail: tuple, tail_shift: float, count: int) -> tuple:
+    """head의 위 count개 세대 뒤에 tail의 count번째 세대부터를 이어 붙인 목록
+    
+    head와 tail은 각각 head_shift, tail_shift만큼 평행 이동한 값으로 합치며,
+    새로 만드는 노드는 count개뿐이고 tail의 나머지 노드는 공유합니다.
+    """
+    values = []
+    x = head_shift
+    for _ in range(count):
+        x += head[0]
+        values.append(x)
+        head = head[1]
+    y = tail_shift
+    for _ in range(count):
+        y += tail[0]
+        tail = tail[1]
+    node = (y + tail[0] - x, tail[1])
+    for i in range(count - 1, 0, -1):
+        node = (values[i] - values[i - 1], node)
+    return (values[0], node)
+
+
+def _merge(left: Contour, right: Contour, offset: float) -> Contour:
+    """left 오른쪽에 offset만큼 떨어져 놓인 right를 합친 경계 (left 좌표 기준, 두 경계는 그대로)"""
+    la, lb = left.depth, right.depth
+    if la >= lb:
+        lefts = left.left
+    else:
+        lefts = _splice(left.left, 0.0, right.left, offset, la)
+    if lb >= la:
+        rights = (right.right[0] + offset, right.right[1])
+    else:
+        rights = _splice(right.right, offset, left.right, 0.0, lb)
+    return Contour(lefts, rights, max(la, lb))
+
+
+def _layout_unit(unit: LayoutUnit):
+    """자녀 서브트리 경계로 단위의 경계와 자녀 오프셋(rel_x) 계산
+    
+    자녀의 경계는 바꾸지 않으므로 나중에 이 단위만 다시 계산할 수 있습니다.
+    """
+    half = unit.width / 2
+    if not unit.children:
+        unit.contour = Contour((-half, None), (half, None))
+        return
+    
+    # 자녀 서브트리를 왼쪽부터 겹치지 않게 붙임 (첫 자녀 중심 기준 좌표)
+    merged = unit.children[0].contour
+    positions = [0.0]
+    for child in unit.children[1:]:
+        offset = _separation(merged, child.contour)
+        positions.append(offset)
+        merged = _merge(merged, child.contour, offset)
+    
+    # 부모는 첫/마지막 자녀 중심의 가운데 위
+    mid = (positions[0] + positions[-1]) / 2
+    for child, position in zip(unit.children, positions):
+        child.rel_x = position - mid
+    # 부모 세대를 맨 위에 붙이고 기준을 부모 중심으로 옮김
+    unit.contour = Contour(
+        (-half, (merged.left[0] - mid + half, merged.left[1])),
+        (half, (merged.right[0] - mid - half, merged.right[1])),
+        merged.depth + 1
+    )
+
+
+def _sort_children(unit: LayoutUnit):
+    """자녀 순서: 현재 x 순서를 유지하되 다태아 그룹은 붙여서 배치"""
+    if len(unit.children) < 2:
+        return
+    group_min_x: Dict[str, float] = {}
+    for child in unit.children:
+        group_id = child.link.multipleBirthGroupId
+        if group_id:
+            group_min_x[group_id] = min(group_min_x.get(group_id, child.link.x), child.link.x)
+    unit.children.sort(key=lambda child: (
+        group_min_x.get(child.link.multipleBirthGroupId, child.link.x), child.link.x
+    ))
+
+
+def _depth(unit: LayoutUnit) -> int:
+    depth = 0
+    while unit.parent is not None:
+        unit = unit.parent
+        depth += 1
+    return depth
+
+
+def _is_ancestor(unit: LayoutUnit, candidate: LayoutUnit) -> bool:
+    """unit이 candidate 자신이거나 그 조상인지 여부"""
+    node = candidate
+    while node is not None:
+        if node is unit:
+            return True
+        node = node.parent
+    return False
+
+
+class TidyLayout:
+    """배치 상태를 유지하며 인물 추가/삭제 때 영향받는 부분만 다시 배치하는 자동 정렬
+    
+    build()로 전체를 한 번 배치한 뒤에는 update()가 바뀐 인물이 속한 단위만 다시 만들고,
+    그 단위에서 루트까지의 경로에 있는 단위의 경계만 다시 계산합니다. 좌표는 위치가
+    바뀐 단위의 서브트리에만 다시 전파하므로 비용은 가계도 크기가 아니라 깊이와
+    실제로 움직이는 인물 수에 비례합니다.
+    
+    배치 좌표는 origin만큼 평행 이동해서 화면 좌표가 됩니다.
+    """
+    
+    def __init__(self):
+        self.unit_of: Dict[str, LayoutUnit] = {}
+        # 목록에 없는 parentId -> 가상 부모 단위
+        self.virtual_units: Dict[str, LayoutUnit] = {}
+        self.roots: List[LayoutUnit] = []
+        self.origin = (0.0, 0.0)
+        self.valid = False
+        # 마지막 배치 이후 구조 필드가 바뀐 인물 id
+        self.pending = set()
+        add_change_listener(self._on_person_changed)
+    
+    def detach(self):
+        """모델 변경 알림 수신 중단"""
+        remove_change_listener(self._on_person_changed)
+    
+    def invalidate(self):
+        """배치 상태 폐기 (다음 배치는 전체 배치)"""
+        self.unit_of.clear()
+        self.virtual_units.clear()
+        self.roots = []
+        self.pending.clear()
+        self.valid = False
+    
+    def _on_person_changed(self, obj, field_name, old_value, new_value):
+        if self.valid and field_name in STRUCTURE_FIELDS and isinstance(obj, Person):
+            self.pending.add(obj.id)
+    
+    # --- 전체 배치 ---
+    
+    def build(self, people: Iterable[Person], anchor_id: Optional[str] = None) -> Dict[str, Tuple[float, float]]:
+        """전체 배치 후 {인물 id: (x, y)} 반환 (anchor_id 인물은 현재 위치 유지)"""
+        self.invalidate()
+        people = sorted(people, key=lambda p: p.x)
+        if not people:
+            return {}
+        by_id = {p.id: p for p in people}
+        
+        units = self._pair(people, by_id.get)
+        for unit in units:
+            self._attach(unit, by_id.get, check_cycle=False)
+        self._break_cycles(units)
+        for unit in units + list(self.virtual_units.values()):
+            _sort_children(unit)
+        
+        # 각 트리의 맨 위 세대는 현재 y에서 추정
+        self.roots = [u for u in units if u.parent is None] + list(self.virtual_units.values())
+        self.roots.sort(key=self._root_x)
+        for root in self.roots:
+            root.generation = round(self._unit_y(root) / LEVEL_SPACING)
+            self._layout_tree(root)
+        self._place_roots()
+        
+        positions: Dict[str, Tuple[float, float]] = {}
+        for root in self.roots:
+            self._apply(root, positions)
+        
+        # 기준 인물이 제자리에 남도록 평행 이동
+        anchor = by_id.get(anchor_id) or people[0]
+        ax, ay = positions[anchor.id]
+        dx, dy = anchor.x - ax, anchor.y - ay
+        self.origin = (dx, dy)
+        self.valid = True
+        return {pid: (x + dx, y + dy) for pid, (x, y) in positions.items()}
+    
+    # --- 증분 배치 ---
+    
+    def update(self, get_person: Callable[[str], Optional[Person]],
+               changed_ids: Iterable[str] = ()) -> Dict[str, Tuple[float, float]]:
+        """추가/삭제되거나 관계가 바뀐 인물만 반영하여 다시 배치하고 위치가 바뀐 인물의 {id: (x, y)} 반환
+        
+        Args:
+            get_person: 인물 id -> Person (삭제된 인물은 None)
+            changed_ids: 추가/삭제된 인물 id (관계 필드 변경은 변경 알림으로 자동 수집)
+        """
+        changed = set(changed_ids) | self.pending
+        self.pending.clear()
+        if not changed:
+            return {}
+        old_roots = {id(root) for root in self.roots}
+        
+        # 1. 바뀐 인물, 그 배우자와 기존 단위 구성원이 속한 단위 해체
+        dissolved: Dict[int, LayoutUnit] = {}
+        people: Dict[str, Person] = {}
+        
+        def collect(person_id):
+            unit = self.unit_of.get(person_id)
+            if unit is not None and id(unit) not in dissolved:
+                dissolved[id(unit)] = unit
+                for member in unit.members:
+                    collect(member.id)
+            person = get_person(person_id)
+            if person is not None and person.id not in people:
+                people[person.id] = person
+                if person.spouseId:
+                    collect(person.spouseId)
+        
+        for person_id in changed:
+            collect(person_id)
+        
+        dirty: List[LayoutUnit] = []
+        orphans: List[LayoutUnit] = []
+        for unit in dissolved.values():
+            parent = self._detach(unit)
+            if parent is not None:
+                dirty.append(parent)
+            elif unit in self.roots:
+                self.roots.remove(unit)
+            for child in unit.children:
+                child.parent = None
+                orphans.append(child)
+            unit.children = []
+            for member in unit.members:
+                if self.unit_of.get(member.id) is unit:
+                    del self.unit_of[member.id]
+        
+        # 2. 다시 짝을 지어 단위를 만들고 부모 가족에 연결
+        new_units = self._pair(sorted(people.values(), key=lambda p: p.x), get_person)
+        for unit in new_units:
+            unit.generation = round((min(m.y for m in unit.members) - self.origin[1]) / LEVEL_SPACING)
+            for member in unit.members:
+                # 가상 부모였던 id로 실제 인물이 생기면 그 자녀를 넘겨받음
+                virtual = self.virtual_units.pop(member.id, None)
+                if virtual is not None:
+                    if virtual in self.roots:
+                        self.roots.remove(virtual)
+                    for child in virtual.children:
+                        child.parent = None
+                        orphans.append(child)
+        
+        orphans = [u for u in orphans if id(u) not in dissolved]
+        for unit in new_units + orphans:
+            parent = self._attach(unit, get_person, check_cycle=True)
+            if parent is None:
+                self.roots.append(unit)
+                continue
+            dirty.append(parent)
+            if not parent.members and parent not in self.roots:
+                # 새로 생긴 가상 부모
+                parent.generation = unit.generation - 1
+                self.roots.append(parent)
+        
+        # 자녀가 모두 떠난 가상 부모 제거
+        for parent_id, unit in list(self.virtual_units.items()):
+            if not unit.children:
+                del self.virtual_units[parent_id]
+                if unit in self.roots:
+                    self.roots.remove(unit)
+        
+        # 3. 바뀐 단위에서 루트까지의 경로만 깊은 쪽부터 경계 재계산
+        path: Dict[int, LayoutUnit] = {}
+        for unit in dirty + new_units:
+            while unit is not None and id(unit) not in path:
+                path[id(unit)] = unit
+                unit = unit.parent
+        for unit in path.values():
+            _sort_children(unit)
+        for unit in sorted(path.values(), key=_depth, reverse=True):
+            _layout_unit(unit)
+        
+        # 4. 경계가 바뀌었거나 새로 루트가 된 트리와 그 때문에 밀리는 트리만 재배치하고
+        #    위치가 바뀐 서브트리에만 좌표 전파
+        added_roots = [r for r in self.roots if id(r) not in old_roots]
+        changed_roots = [r for r in self.roots if id(r) in path] + added_roots
+        ox, oy = self.origin
+        positions: Dict[str, Tuple[float, float]] = {}
+        for root in self._place_changed_roots(changed_roots, added_roots):
+            self._apply(root, positions, path)
+        return {pid: (x + ox, y + oy) for pid, (x, y) in positions.items()}
+    
+    # --- 단위 구성 ---
+    
+    def _pair(self, people: List[Person], get_person) -> List[LayoutUnit]:
+        """x 순서대로 부부 단위 생성 (배우자가 이미 다른 단위에 속하면 혼자 단위)"""
+        units = []
+        for person in people:
+            if person.id in self.unit_of:
+                continue
+            spouse = get_person(person.spouseId) if person.spouseId else None
+            members = [person]
+            if spouse is not None and spouse is not person and spouse.id not in self.unit_of:
+                members.append(spouse)
+            unit = LayoutUnit(person.id, members)
+            for member in members:
+                self.unit_of[member.id] = unit
+            units.append(unit)
+        return units
+    
+    def _attach(self, unit: LayoutUnit, get_person, check_cycle: bool) -> Optional[LayoutUnit]:
+        """구성원 중 부모가 있는 첫 사람 기준으로 부모 단위에 연결 (목록에 없는 부모는 가상 부모)"""
+        for member in unit.members:
+            if not member.parentId:
+                continue
+            parent = self.unit_of.get(member.parentId)
+            if parent is None:
+                if get_person(member.parentId) is not None:
+                    continue
+                parent = self.virtual_units.get(member.parentId)
+                if parent is None:
+                    parent = LayoutUnit(('virtual', member.parentId), [])
+                    self.virtual_units[member.parentId] = parent
+            # 잘못된 부모 참조로 순환이 생기면 다음 구성원 기준으로 연결
+            if parent is unit or (check_cycle and _is_ancestor(unit, parent)):
+                continue
+            unit.parent = parent
+            unit.link = member
+            parent.children.append(unit)
+            return parent
+        unit.link = None
+        return None
+    
+    @staticmethod
+    def _detach(unit: LayoutUnit) -> Optional[LayoutUnit]:
+        parent = unit.parent
+        if parent is not None:
+            parent.children.remove(unit)
+            unit.parent = None
+        return parent
+    
+    def _break_cycles(self, units: List[LayoutUnit]):
+        """잘못된 부모 참조로 생긴 순환을 끊어 모든 단위가 루트에서 닿도록 함"""
+        reached = set()
+        stack = [u for u in units if u.parent is None] + list(self.virtual_units.values())
+        while stack:
+            unit = stack.pop()
+            if id(unit) in reached:
+                continue
+            reached.add(id(unit))
+            stack.extend(unit.children)
+        
+        for unit in units:
+            if id(unit) in reached:
+                continue
+            # 순환 안의 단위 하나를 부모에서 떼어 루트로 만들고 그 아래를 도달 처리
+            self._detach(unit)
+            unit.link = None
+            stack = [unit]
+            while stack:
+                node = stack.pop()
+                if id(node) not in reached:
+                    reached.add(id(node))
+                    stack.extend(node.children)
+    
+    # --- 배치 ---
+    
+    @staticmethod
+    def _layout_tree(root: LayoutUnit):
+        """서브트리 전체의 경계 계산 (자녀가 부모보다 먼저 오도록 재귀 없이 순회)"""
+        order = []
+        stack = [root]
+        while stack:
+            unit = stack.pop()
+            order.append(unit)
+            stack.extend(unit.children)
+        for unit in reversed(order):
+            _layout_unit(unit)
+    
+    def _root_x(self, unit: LayoutUnit) -> float:
+        """트리 순서/위치 기준 x (배치된 단위는 기존 위치, 새 단위는 현재 좌표)"""
+        if unit.placed:
+            return unit.x
+        if unit.members:
+            return sum(m.x for m in unit.members) / len(unit.members) - self.origin[0]
+        if not unit.children:
+            return 0.0
+        # 가상 부모는 첫 자녀 위치 기준
+        child = unit.children[0]
+        return self._root_x(child) - child.rel_x
+    
+    def _unit_y(self, unit: LayoutUnit) -> float:
+        if unit.members:
+            return min(m.y for m in unit.members)
+        return min((self._unit_y(child) for child in unit.children), default=0.0) - LEVEL_SPACING
+    
+    def _place_roots(self):
+        """트리들을 세대를 맞춰 왼쪽부터 빈틈없이 붙여 배치"""
+        # 세대 -> 지금까지 놓인 오른쪽 끝
+        placed_right: Dict[int, float] = {}
+        for root in self.roots:
+            lefts, rights = root.contour.edges()
+            need = float('-inf')
+            for depth, left in enumerate(lefts):
+                right_edge = placed_right.get(root.generation + depth)
+                if right_edge is not None:
+                    need = max(need, right_edge - left + SIBLING_SPACING)
+            x = need if need != float('-inf') else 0.0
+            for depth, right in enumerate(rights):
+                generation = root.generation + depth
+                placed_right[generation] = max(placed_right.get(generation, x + right), x + right)
+            root.rel_x = x
+    
+    def _place_changed_roots(self, changed: List[LayoutUnit], added: List[LayoutUnit]) -> List[LayoutUnit]:
+        """새로 루트가 된 트리(added)를 x 순서 자리에 넣고, 바뀐 트리를 겹치지 않는 한 기존 위치에 배치
+        
+        트리는 self.roots 순서대로 앞의 트리 오른쪽에 놓이며 기존 트리의 순서는 바꾸지 않습니다.
+        바뀐 트리와 겹쳐 오른쪽으로 밀려나는 트리까지만 다시 배치하고, 다시 배치한
+        루트 목록을 반환합니다. 어떤 세대에서 밀림이 전해지는지는 그 세대를 차지한
+        트리가 제자리에 남으면 끝나므로, 나머지 트리는 살펴보지 않습니다.
+        """
+        if not changed:
+            return []
+        changed_ids = {id(root) for root in changed}
+        added_ids = {id(root) for root in added}
+        self.roots = [root for root in self.roots if id(root) not in added_ids]
+        for root in added:
+            x = self._root_x(root)
+            index = next((i for i, other in enumerate(self.roots) if self._root_x(other) > x), len(self.roots))
+            self.roots.insert(index, root)
+        
+        placed = []
+        remaining = len(changed)
+        # 위치나 경계가 바뀌어 오른쪽 트리가 밀릴 수 있는 세대
+        open_generations = set()
+        start = min(self.roots.index(root) for root in changed)
+        for index in range(start, len(self.roots)):
+            root = self.roots[index]
+            generations = range(root.generation, root.generation + len(root.contour))
+            is_changed = id(root) in changed_ids
+            if not is_changed and open_generations.isdisjoint(generations):
+                if not remaining and not open_generations:
+                    break
+                continue
+            x = max(self._root_x(root), self._root_need(index))
+            if is_changed:
+                remaining -= 1
+            if is_changed or x != root.x:
+                open_generations.update(generations)
+                root.rel_x = x
+                placed.append(root)
+            else:
+                open_generations.difference_update(generations)
+        return placed
+    
+    def _root_need(self, index: int) -> float:
+        """index번째 트리를 앞 트리들과 겹치지 않게 놓을 수 있는 최소 중심 x
+        
+        트리는 self.roots 순서대로 앞의 트리 오른쪽에 놓이므로, 세대마다 그 세대를
+        차지한 가장 가까운 앞 트리만 보면 됩니다.
+        """
+        root = self.roots[index]
+        lefts, _ = root.contour.edges()
+        pending = set(range(len(lefts)))
+        need = float('-inf')
+        for other_index in range(index - 1, -1, -1):
+            if not pending:
+                break
+            other = self.roots[other_index]
+            _, rights = other.contour.edges()
+            for depth in list(pending):
+                other_depth = root.generation + depth - other.generation
+                if 0 <= other_depth < len(rights):
+                    need = max(need, other.rel_x + rights[other_depth] - lefts[depth] + SIBLING_SPACING)
+                    pending.discard(depth)
+        return need
+    
+    @staticmethod
+    def _apply(root: LayoutUnit, positions: Dict[str, Tuple[float, float]], dirty: Dict[int, LayoutUnit] = None):
+        """단위 중심 x/세대를 부모에서 자녀 방향으로 전파하고 인물 배치 좌표 기록
+        
+        dirty가 주어지면 위치가 그대로이고 경계도 다시 계산하지 않은 단위의
+        서브트리는 건너뜁니다.
+        """
+        stack = [root]
+        while stack:
+            unit = stack.pop()
+            if unit.parent is None:
+                x, generation = unit.rel_x, unit.generation
+            else:
+                x, generation = unit.parent.x + unit.rel_x, unit.parent.generation + 1
+            if (dirty is not None and unit.placed and id(unit) not in dirty
+                    and x == unit.x and generation == unit.generation):
+                continue
+            unit.x, unit.generation, unit.placed = x, generation, True
+            y = generation * LEVEL_SPACING
+            left = x - (len(unit.members) - 1) * COUPLE_STEP / 2
+            for i, member in enumerate(unit.members):
+                positions[member.id] = (left + i * COUPLE_STEP, y)
+            stack.extend(unit.children)
+
+
+def compute_layout(people: Iterable[Person], anchor_id: Optional[str] = None) -> Dict[str, Tuple[float, float]]:
+    """겹치지 않는 세대별 배치 좌표 {인물 id: (x, y)} 계산 (인물 객체는 수정하지 않음)
+    
+    부부는 한 단위로 나란히, 자녀는 부모 단위 중심 아래에 모이고, 다태아 그룹은
+    붙여서 배치합니다. 가상 부모(목록에 없는 parentId)로 묶인 형제도 한 가족으로
+    취급합니다. 부모 가족이 없는 트리들은 현재 x 순서대로 좌우에 나란히 놓이며,
+    anchor_id 인물은 현재 위치에 그대로 남도록 전체를 평행 이동합니다.
+    """
+    layout = TidyLayout()
+    try:
+        return layout.build(people, anchor_id)
+    finally:
+        layout.detach()
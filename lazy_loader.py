@@ -0,0 +1,58 @@
+"""
+큰 가계도의 화면 영역 단위 지연 불러오기
+"""
+from typing import List, Set, Tuple
+from models import Person
+from config import LAZY_LOAD_MARGIN
+
+
+class ViewportLoader:
+    """보이는 영역 주변의 인물만 데이터베이스에서 불러오는 로더
+    
+    좌표 인덱스로 사각형 안의 인물만 조회하고, 이미 불러온 영역 안에서
+    움직이면 다시 조회하지 않습니다. 한 번 불러온 인물은 다시 불러오지 않으므로
+    편집 중 삭제한 인물이 되살아나지 않으며, loaded_ids는 저장할 때 삭제 판단
+    범위(write_snapshot의 scope_ids)로 사용합니다.
+    
+    Args:
+        db: GUI 스레드에서 사용하는 Database
+        tree_name: 불러올 가계도 이름
+        margin: 보이는 영역 바깥으로 미리 불러올 여백
+    """
+    
+    def __init__(self, db, tree_name: str, margin: float = LAZY_LOAD_MARGIN):
+        self.db = db
+        self.tree_name = tree_name
+        self.margin = margin
+        self.loaded_ids: Set[str] = set()
+        # 조회를 마친 사각형 (left, top, right, bottom)
+        self.loaded_rects: List[Tuple[float, float, float, float]] = []
+    
+    def covers(self, left: float, top: float, right: float, bottom: float) -> bool:
+        """사각형 전체가 이미 불러온 영역 하나에 들어가는지 여부"""
+        return any(
+            l <= left and t <= top and right <= r and bottom <= b
+            for l, t, r, b in self.loaded_rects
+        )
+    
+    def mark_loaded(self, people):
+        """다른 경로로 불러온 인물을 불러온 것으로 표시"""
+        self.loaded_ids.update(person.id for person in people)
+    
+    def load(self, left: float, top: float, right: float, bottom: float) -> List[Person]:
+        """보이는 사각형에 여백을 더한 영역에서 아직 불러오지 않은 인물 반환"""
+        if self.covers(left, top, right, bottom):
+            return []
+        rect = (left - self.margin, top - self.margin, right + self.margin, bottom + self.margin)
+        people = [
+            person for person in self.db.load_people_in_rect(self.tree_name, *rect)
+            if person.id not in self.loaded_ids
+        ]
+        self.mark_loaded(people)
+        # 큰 영역이 작은 영역을 포함하면 작은 영역 기록은 필요 없음
+        self.loaded_rects = [
+            r for r in self.loaded_rects
+            if not (rect[0] <= r[0] and rect[1] <= r[1] and r[2] <= rect[2] and r[3] <= rect[3])
+        ]
+        self.loaded_rects.append(rect)
+        return people
@@ -7,18 +7,25 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QComboBox, QCheckBox, QListWidget,
     QMessageBox, QFileDialog, QFrame, QScrollArea, QGroupBox, QRadioButton,
-    QButtonGroup, QStatusBar
+    QButtonGroup, QStatusBar, QProgressBar
 )
 from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtCore import Qt, QTimer, QPointF
+from PyQt6.QtCore import Qt, QTimer, QPointF, QRectF, QThreadPool
 from models import Person
-from database import Database
+from person_index import PersonIndex
+from history import EditHistory
+from database import Database, snapshot_rows
+from db_worker import DatabaseTask
+from autosave import AutosaveJournal, replay_journal
 from canvas_widget import CanvasWidget
 from image_export import ImageExporter
+from layout_engine import TidyLayout, compute_layout
+from kinship import KinshipIndex
+from lazy_loader import ViewportLoader
 from config import (
     NODE_WIDTH, NODE_HEIGHT, SIBLING_SPACING, LEVEL_SPACING,
     PRIMARY_COLOR, BACKGROUND_COLOR, APP_NAME, TEXT_COLOR, DANGER_COLOR,
-    APP_VERSION, RELEASE_DATE
+    APP_VERSION, RELEASE_DATE, LAZY_LOAD_THRESHOLD
 )
 
 
@@ -32,10 +39,23 @@ class MainWindow(QMainWindow):
         
         # 데이터
         self.db = Database()
+        # 저장/불러오기는 한 번에 하나씩 작업 스레드에서 실행
+        self.db_pool = QThreadPool(self)
+        self.db_pool.setMaxThreadCount(1)
+        self.db_task = None
         self.people = []
+        self.person_index = PersonIndex()
+        self.kinship = KinshipIndex(self.person_index)
         self.relationship_lines = []
-        self.history_stack = []
-        self.redo_stack = []
+        self.history = EditHistory(self, on_list_change=self.on_history_list_change)
+        self.autosave = AutosaveJournal(
+            self.db, self.db_pool, self.is_current_item, lambda: self.db_task is not None, self
+        )
+        self.autosave.failed.connect(self.on_autosave_failed)
+        # 정렬 유지 모드에서 추가/삭제 시 영향받는 부분만 다시 배치
+        self.tidy_layout = TidyLayout()
+        # 큰 가계도를 화면 영역 단위로 불러오는 중이면 ViewportLoader
+        self.lazy_loader = None
         self.current_tree_name = None
         self.initial_client = None
         
@@ -44,6 +64,9 @@ class MainWindow(QMainWindow):
         
         # 저장된 가계도 목록 불러오기
         self.load_tree_list()
+        
+        # 창이 뜬 뒤 자동 저장 기록 복구 여부 확인
+        QTimer.singleShot(0, self.offer_autosave_recovery)
     
     def init_ui(self):
         """UI 구성"""
@@ -67,6 +90,12 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.update_status("정보를 입력하여 가계도를 그려보세요.")
         
+        # 저장/불러오기 진행률 표시
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setVisible(False)
+        self.status_bar.addPermanentWidget(self.progress_bar)
+        
         # 푸터 레이블 추가
         footer_label = QLabel(f"Version {APP_VERSION} ({RELEASE_DATE}) | welfareact.net에서 제작·배포합니다.")
         footer_label.setStyleSheet("color: #666; padding: 0 10px;")
@@ -237,6 +266,12 @@ class MainWindow(QMainWindow):
         self.edit_deceased_checkbox = QCheckBox("사망 여부")
         layout.addWidget(self.edit_deceased_checkbox)
         
+        # 두 사람을 선택하면 촌수/호칭 표시
+        self.kinship_label = QLabel()
+        self.kinship_label.setWordWrap(True)
+        self.kinship_label.setVisible(False)
+        layout.addWidget(self.kinship_label)
+        
         # 버튼들
         btn_layout = QHBoxLayout()
         
@@ -318,6 +353,21 @@ class MainWindow(QMainWindow):
         redo_btn.clicked.connect(self.redo_last_action)
         controls_layout.addWidget(redo_btn)
         
+        layout_btn = QPushButton("⊞ 자동 정렬")
+        layout_btn.setObjectName("secondaryButton")
+        layout_btn.setMinimumHeight(30)
+        layout_btn.setToolTip("겹치지 않도록 세대별로 인물 자동 배치")
+        layout_btn.clicked.connect(self.auto_layout)
+        controls_layout.addWidget(layout_btn)
+        
+        self.keep_layout_btn = QPushButton("📌 정렬 유지")
+        self.keep_layout_btn.setObjectName("secondaryButton")
+        self.keep_layout_btn.setMinimumHeight(30)
+        self.keep_layout_btn.setCheckable(True)
+        self.keep_layout_btn.setToolTip("인물 추가/삭제 시 영향받는 가족만 다시 정렬")
+        self.keep_layout_btn.toggled.connect(self.on_keep_layout_toggled)
+        controls_layout.addWidget(self.keep_layout_btn)
+        
         reset_btn = QPushButton("🗑 초기화")
         reset_btn.setObjectName("secondaryButton")
         reset_btn.setMinimumHeight(30)
@@ -374,8 +424,9 @@ class MainWindow(QMainWindow):
         # 캔버스
         # 캔버스
         # 캔버스
-        self.canvas = CanvasWidget()
+        self.canvas = CanvasWidget(person_index=self.person_index)
         self.canvas.person_selected.connect(self.on_person_selected)
+        self.canvas.viewport_changed.connect(self.on_viewport_changed)
         canvas_layout.addWidget(self.canvas)
         
         parent_layout.addWidget(canvas_container)
@@ -458,6 +509,7 @@ class MainWindow(QMainWindow):
             # 상태 초기화
             self.reset_state()
             self.current_tree_name = tree_name
+            self.autosave.start(tree_name)
             self.update_status(f'새 가계도 "{self.current_tree_name}" 작업을 시작합니다.')
             
             # 중심 인물 생성 (화면 중앙)
@@ -473,7 +525,7 @@ class MainWindow(QMainWindow):
             )
             
             self.initial_client = person
-            self.people.append(person)
+            self.insert_person(person)
             self.save_state_for_undo()
             
             # UI 업데이트
@@ -481,7 +533,7 @@ class MainWindow(QMainWindow):
             self.update_center_person_select()
             
             center_id = self.initial_client.id if self.initial_client else None
-            self.canvas.draw_tree(self.people, center_id)
+            self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
             
         except Exception as e:
             import traceback
@@ -499,14 +551,14 @@ class MainWindow(QMainWindow):
             )
             
             self.initial_client = person
-            self.people.append(person)
+            self.insert_person(person)
             self.save_state_for_undo()
             
             # UI 업데이트
             self.add_person_group.setVisible(True)
             self.update_center_person_select()
             center_id = self.initial_client.id if self.initial_client else None
-            self.canvas.draw_tree(self.people, center_id)
+            self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
             
         except Exception as e:
             import traceback
@@ -543,9 +595,10 @@ class MainWindow(QMainWindow):
         # 관계에 따른 위치 및 관계 설정
         self.setup_relationship(new_person, center_person, relationship_type)
         
-        self.people.append(new_person)
+        self.insert_person(new_person)
+        self.relayout_affected([new_person.id])
         center_id = self.initial_client.id if self.initial_client else None
-        self.canvas.draw_tree(self.people, center_id)
+        self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
         self.update_center_person_select()
         
         # 입력 필드 초기화
@@ -570,6 +623,28 @@ class MainWindow(QMainWindow):
         self.edit_birthyear_input.setText(person.birthYear or "")
         self.edit_gender_select.setCurrentText("남자" if person.gender == "male" else "여자")
         self.edit_deceased_checkbox.setChecked(person.isDeceased)
+        self.update_kinship_info()
+    
+    def update_kinship_info(self):
+        """두 사람이 선택되어 있으면 먼저 선택한 사람 기준의 촌수와 호칭 표시"""
+        selected = self.canvas.selected_people()
+        if len(selected) != 2:
+            self.kinship_label.setVisible(False)
+            return
+        
+        a, b = selected
+        result = self.kinship.relation(a.id, b.id)
+        if result is None:
+            text = f"{a.name}님과 {b.name}님은 이어진 친족 관계가 없습니다."
+        else:
+            degree, term = result
+            if degree is None:
+                degree_text = "촌수 없음"
+            else:
+                degree_text = "무촌" if degree == 0 else f"{degree}촌"
+            text = f"{b.name}님은 {a.name}님의 {term}입니다. ({degree_text})"
+        self.kinship_label.setText(text)
+        self.kinship_label.setVisible(True)
     
     def update_person_info(self):
         """인물 정보 수정 적용"""
@@ -593,7 +668,7 @@ class MainWindow(QMainWindow):
         person.isDeceased = self.edit_deceased_checkbox.isChecked()
         
         center_id = self.initial_client.id if self.initial_client else None
-        self.canvas.draw_tree(self.people, center_id)
+        self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
         self.update_center_person_select()
         self.update_status(f"{name}님의 정보를 수정했습니다.")
         
@@ -615,23 +690,23 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             # 삭제 로직을 메인 윈도우에서 직접 처리
             person_id = self.selected_person_id
+            self.save_state_for_undo()
             
             # 1. 다른 노드들의 참조 정리
-            for p in self.people:
-                if p.nextIdenticalSiblingId == person_id:
-                    p.nextIdenticalSiblingId = None
-                if p.parentId == person_id:
-                    p.parentId = None
-                if p.spouseId == person_id:
-                    p.spouseId = None
+            for p in self.person_index.identical_predecessors(person_id):
+                p.nextIdenticalSiblingId = None
+            for p in self.person_index.children_of(person_id):
+                p.parentId = None
+            for p in self.person_index.partners_of(person_id):
+                p.spouseId = None
             
             # 2. 리스트에서 제거
-            self.people = [p for p in self.people if p.id != person_id]
+            self.remove_person(person_id)
+            self.relayout_affected([person_id])
             
-            # 3. 상태 저장 및 UI 업데이트
-            self.save_state_for_undo()
+            # 3. UI 업데이트
             center_id = self.initial_client.id if self.initial_client else None
-            self.canvas.draw_tree(self.people, center_id)
+            self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
             self.update_center_person_select()
             self.edit_person_group.setVisible(False)
             self.add_person_group.setVisible(True)
@@ -665,15 +740,14 @@ class MainWindow(QMainWindow):
             elif current_parent_id:
                 # 부모 ID는 있지만 실존하지 않는 경우 -> 가상 부모였음
                 # 가상 부모를 공유하던 모든 형제들의 부모를 새 부모로 업데이트
-                siblings = [p for p in self.people if p.parentId == current_parent_id]
+                siblings = self.person_index.children_of(current_parent_id)
                 for sibling in siblings:
                     sibling.parentId = new_person.id
                 
                 # 새 부모 위치 설정 (형제들 중앙 상단)
                 if siblings:
-                    siblings.sort(key=lambda p: p.x)
-                    center_x = (siblings[0].x + siblings[-1].x) / 2
-                    new_person.x = center_x
+                    min_x, _, max_x, _ = self.person_index.coords.bounds(p.id for p in siblings)
+                    new_person.x = (min_x + max_x) / 2
                 else:
                     new_person.x = center_person.x
                 new_person.y = center_person.y - LEVEL_SPACING
@@ -690,13 +764,13 @@ class MainWindow(QMainWindow):
             new_person.y = center_person.y + LEVEL_SPACING
             
             # 같은 부모의 자녀들 찾기
-            children = [p for p in self.people if p.parentId == center_person.id or 
-                       (p.parentId and self.find_person_by_id(p.parentId) and 
-                        self.find_person_by_id(p.parentId).spouseId == center_person.id)]
+            children = self.person_index.children_of(center_person.id)
+            for partner in self.person_index.partners_of(center_person.id):
+                children.extend(self.person_index.children_of(partner.id))
             
             if children:
-                children.sort(key=lambda p: p.x)
-                new_person.x = children[-1].x + NODE_WIDTH + SIBLING_SPACING
+                rightmost = self.person_index.coords.rightmost(p.id for p in children)
+                new_person.x = rightmost.x + NODE_WIDTH + SIBLING_SPACING
             else:
                 # 첫 자녀는 부모(들) 중앙 아래
                 spouse = self.find_person_by_id(center_person.spouseId) if center_person.spouseId else None
@@ -730,17 +804,17 @@ class MainWindow(QMainWindow):
                 center_person.nextIdenticalSiblingId = new_person.id
             
             # 그룹 내 마지막 멤버 찾기
-            group_members = [p for p in self.people if p.multipleBirthGroupId == group_id]
+            group_members = self.person_index.multiple_birth_group(group_id)
             if group_members:
-                group_members.sort(key=lambda p: p.x)
-                new_person.x = group_members[-1].x + NODE_WIDTH + SIBLING_SPACING
+                rightmost = self.person_index.coords.rightmost(p.id for p in group_members)
+                new_person.x = rightmost.x + NODE_WIDTH + SIBLING_SPACING
             else:
                 new_person.x = center_person.x + NODE_WIDTH + SIBLING_SPACING
             
             new_person.y = center_person.y
     
-    def save_current_tree(self):
-        """현재 가계도 저장"""
+    def save_current_tree(self, blocking: bool = False):
+        """현재 가계도 저장 (기본은 작업 스레드에서 실행, blocking이면 즉시 저장)"""
         if not self.current_tree_name:
             QMessageBox.warning(self, "저장 오류", "저장할 가계도의 이름이 없습니다. 새로 시작하거나 기존 가계도를 불러오세요.")
             return
@@ -749,24 +823,120 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "저장 오류", "저장할 내용이 없습니다.")
             return
         
-        result = self.db.save_tree(self.current_tree_name, self.people, self.relationship_lines)
-        QMessageBox.information(self, "저장", result)
-        self.load_tree_list()
+        if blocking:
+            self.db_pool.waitForDone()
+        elif self.is_db_busy():
+            return
+        
+        # 스냅샷을 뜬 시점에 변경 표시를 지워, 저장 중 수정된 항목은 다시 변경 상태가 되도록 함
+        tree_name = self.current_tree_name
+        journal_seq = self.autosave.checkpoint()
+        saved_objects = list(self.people) + [l for l in self.relationship_lines if not isinstance(l, dict)]
+        person_rows, line_rows = snapshot_rows(tree_name, self.people, self.relationship_lines)
+        # 일부만 불러온 가계도는 불러온 인물 안에서만 삭제 여부를 판단
+        scope_ids = set(self.lazy_loader.loaded_ids) if self.lazy_loader else None
+        for obj in saved_objects:
+            obj.mark_clean()
+        
+        def on_finished(_):
+            # 저장된 시점까지의 자동 저장 기록은 더 이상 필요 없음
+            self.autosave.clear_until(journal_seq)
+            QMessageBox.information(self, "저장", f'"{tree_name}" 가계도가 성공적으로 저장되었습니다.')
+            self.load_tree_list()
+        
+        def on_failed(error):
+            for obj in saved_objects:
+                obj.mark_dirty()
+            QMessageBox.warning(self, "저장 오류", f'저장 중 오류가 발생했습니다: {error}')
+        
+        if blocking:
+            try:
+                self.db.write_snapshot(tree_name, person_rows, line_rows, scope_ids)
+            except Exception as e:
+                on_failed(str(e))
+            else:
+                on_finished(None)
+            return
+        
+        self.start_db_task(
+            DatabaseTask(Database.write_snapshot, tree_name, person_rows, line_rows, scope_ids),
+            f'"{tree_name}" 가계도를 저장하는 중...', on_finished, on_failed
+        )
     
     def load_selected_tree(self):
-        """선택된 가계도 불러오기"""
+        """선택된 가계도 불러오기 (작업 스레드에서 읽은 뒤 화면에 반영)"""
         current_item = self.tree_list_widget.currentItem()
         if not current_item:
             QMessageBox.warning(self, "선택 오류", "불러올 가계도를 목록에서 선택해주세요.")
             return
         
+        if self.is_db_busy():
+            return
+        
         tree_name = current_item.text()
-        people, relationship_lines = self.db.load_tree(tree_name)
+        if self.db.count_people(tree_name) >= LAZY_LOAD_THRESHOLD:
+            self.load_tree_lazily(tree_name)
+            return
+        
+        def on_finished(result):
+            people, relationship_lines = result
+            self.apply_loaded_tree(tree_name, people, relationship_lines)
+        
+        def on_failed(error):
+            QMessageBox.warning(self, "불러오기 오류", f'불러오는 중 오류가 발생했습니다: {error}')
         
+        self.start_db_task(
+            DatabaseTask(Database.load_tree, tree_name),
+            f'"{tree_name}" 가계도를 불러오는 중...', on_finished, on_failed
+        )
+    
+    def load_tree_lazily(self, tree_name: str):
+        """큰 가계도는 처음 인물 주변만 불러오고, 나머지는 화면을 옮길 때 불러오기"""
+        root = self.db.find_root_person(tree_name)
+        if root is None:
+            return
+        loader = ViewportLoader(self.db, tree_name)
+        loader.mark_loaded([root])
+        
+        # 처음 인물이 화면 가운데에 오도록 보이는 영역 크기만큼 주변 조회
+        view_rect = self.canvas.visible_scene_rect()
+        view_rect.moveCenter(QPointF(root.x, root.y))
+        people = [root] + loader.load(view_rect.left(), view_rect.top(), view_rect.right(), view_rect.bottom())
+        
+        self.apply_loaded_tree(tree_name, people, self.db.load_relationship_lines(tree_name))
+        self.lazy_loader = loader
+        min_x, min_y, max_x, max_y = self.db.get_tree_bounds(tree_name)
+        self.canvas.include_scene_rect(QRectF(min_x, min_y, max_x - min_x, max_y - min_y).adjusted(
+            -NODE_WIDTH / 2, -NODE_HEIGHT / 2, NODE_WIDTH / 2, NODE_HEIGHT / 2
+        ))
+        self.canvas.centerOn(root.x, root.y)
+        self.update_status(
+            f'"{tree_name}" 가계도가 커서 화면 주변만 불러왔습니다. 화면을 옮기면 나머지를 불러옵니다.'
+        )
+    
+    def on_viewport_changed(self, rect: QRectF):
+        """지연 불러오기 중이면 새로 보이는 영역의 인물을 불러와 그리기"""
+        if self.lazy_loader is None:
+            return
+        people = self.lazy_loader.load(rect.left(), rect.top(), rect.right(), rect.bottom())
+        if not people:
+            return
+        # 불러온 인물은 편집이 아니므로 실행 취소/자동 저장 기록 없이 추가
+        self.people.extend(people)
+        for person in people:
+            self.person_index.add(person)
+        center_id = self.initial_client.id if self.initial_client else None
+        self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
+        self.update_center_person_select()
+    
+    def apply_loaded_tree(self, tree_name: str, people, relationship_lines):
+        """불러온 가계도를 현재 상태로 설정하고 다시 그리기"""
         self.reset_state()
         self.people = people
+        self.person_index.rebuild(people)
         self.relationship_lines = relationship_lines
         self.current_tree_name = tree_name
+        self.autosave.start(tree_name)
         self.tree_name_input.setText(tree_name)
         
         if self.people:
@@ -781,6 +951,66 @@ class MainWindow(QMainWindow):
         self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
         self.update_status(f'"{self.current_tree_name}" 가계도를 불러왔습니다.')
     
+    def on_autosave_failed(self, error: str):
+        """자동 저장 실패 표시 (기록하지 못한 변경은 다음 주기에 다시 기록)"""
+        self.update_status(f"자동 저장 실패, 잠시 후 다시 시도합니다: {error}")
+    
+    def offer_autosave_recovery(self):
+        """비정상 종료로 남은 자동 저장 기록이 있으면 복구 여부 확인"""
+        tree_names = self.db.get_journal_trees()
+        if not tree_names:
+            return
+        
+        # 가장 최근에 편집하던 가계도만 복구 대상으로 하고 나머지 오래된 기록은 정리
+        tree_name = tree_names[0]
+        for old_name in tree_names[1:]:
+            self.db.clear_journal(old_name)
+        
+        reply = QMessageBox.question(
+            self, '자동 저장 복구',
+            f'"{tree_name}" 가계도에 저장되지 않은 변경사항이 있습니다.\n복구하시겠습니까?',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            self.db.clear_journal(tree_name)
+            return
+        
+        # 마지막으로 저장된 상태에 저널을 다시 적용 (저널은 다음 저장 때까지 유지)
+        people, relationship_lines = self.db.load_tree(tree_name)
+        people, relationship_lines = replay_journal(people, relationship_lines, self.db.load_journal(tree_name))
+        self.apply_loaded_tree(tree_name, people, relationship_lines)
+        self.update_status(f'"{tree_name}" 가계도의 저장되지 않은 변경사항을 복구했습니다. 저장하여 반영하세요.')
+    
+    def is_db_busy(self) -> bool:
+        """진행 중인 저장/불러오기 작업이 있으면 알리고 True 반환"""
+        if self.db_task is None:
+            return False
+        self.update_status("이전 저장/불러오기 작업이 진행 중입니다. 잠시 후 다시 시도하세요.")
+        return True
+    
+    def start_db_task(self, task: DatabaseTask, message: str, on_finished, on_failed):
+        """데이터베이스 작업을 작업 스레드에서 실행하고 진행률 표시"""
+        def on_progress(done, total):
+            self.progress_bar.setMaximum(max(total, 1))
+            self.progress_bar.setValue(done)
+        
+        def on_done():
+            self.db_task = None
+            self.progress_bar.setVisible(False)
+        
+        task.signals.progress.connect(on_progress)
+        task.signals.finished.connect(on_done)
+        task.signals.failed.connect(on_done)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        
+        # 작업이 끝날 때까지 시그널 객체가 사라지지 않도록 참조 유지
+        self.db_task = task
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.update_status(message)
+        self.db_pool.start(task)
+    
     def delete_selected_tree(self):
         """선택된 가계도 삭제"""
         current_item = self.tree_list_widget.currentItem()
@@ -796,6 +1026,8 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            if self.is_db_busy():
+                return
             result = self.db.delete_tree(tree_name)
             QMessageBox.information(self, "삭제", result)
             self.load_tree_list()
@@ -825,29 +1057,8 @@ class MainWindow(QMainWindow):
     
     def undo_last_action(self):
         """마지막 작업 취소"""
-        if len(self.history_stack) > 1:
-            # 1. 현재 화면의 상태(Live)를 Redo 스택에 저장
-            current_live_state = {
-                'people': [p.to_dict() for p in self.people],
-                'lines': [l.to_dict() for l in self.relationship_lines]
-            }
-            self.redo_stack.append(current_live_state)
-            
-            # 2. History 스택에서 가장 최근 상태(방금 취소하려는 작업의 시작 전 상태)를 가져옴
-            previous_state = self.history_stack.pop()
-            
-            # 3. 상태 복원
-            self.people = [Person.from_dict(p) for p in previous_state['people']]
-            from models import RelationshipLine
-            self.relationship_lines = [RelationshipLine.from_dict(l) for l in previous_state['lines']]
-            
-            # initial_client 복구 시도 (ID 기반)
-            if self.initial_client:
-                # 현재 initial_client ID와 일치하는 새 객체 찾기
-                found = next((p for p in self.people if p.id == self.initial_client.id), None)
-                if found:
-                    self.initial_client = found
-            
+        if self.history.undo():
+            self.tidy_layout.invalidate()
             center_id = self.initial_client.id if self.initial_client else None
             self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
             self.update_center_person_select()
@@ -857,26 +1068,8 @@ class MainWindow(QMainWindow):
             
     def redo_last_action(self):
         """취소한 작업 다시 실행"""
-        if self.redo_stack:
-            # 1. 현재 상태(Undo된 상태)를 History 스택에 다시 저장
-            current_live_state = {
-                'people': [p.to_dict() for p in self.people],
-                'lines': [l.to_dict() for l in self.relationship_lines]
-            }
-            self.history_stack.append(current_live_state)
-            
-            # 2. Redo 스택에서 다음 상태 가져와서 적용
-            next_state = self.redo_stack.pop()
-            self.people = [Person.from_dict(p) for p in next_state['people']]
-            from models import RelationshipLine
-            self.relationship_lines = [RelationshipLine.from_dict(l) for l in next_state['lines']]
-            
-            # initial_client 복구 시도
-            if self.initial_client:
-                 found = next((p for p in self.people if p.id == self.initial_client.id), None)
-                 if found:
-                     self.initial_client = found
-            
+        if self.history.redo():
+            self.tidy_layout.invalidate()
             center_id = self.initial_client.id if self.initial_client else None
             self.canvas.draw_tree(self.people, center_id, self.relationship_lines)
             self.update_center_person_select()
@@ -884,6 +1077,63 @@ class MainWindow(QMainWindow):
         else:
             self.update_status("다시 실행할 작업이 없습니다.")
     
+    def on_history_list_change(self, list_name: str, obj, inserted: bool):
+        """실행 취소/다시 실행으로 인물/관계선이 추가/삭제되면 자동 저장 기록과 인덱스 갱신"""
+        self.autosave.on_list_change(list_name, obj, inserted)
+        if list_name != 'people':
+            return
+        if inserted:
+            self.person_index.add(obj)
+        else:
+            self.person_index.remove(obj.id)
+    
+    def auto_layout(self):
+        """전체 가계도 자동 정렬 (중심 인물 위치는 유지, 실행 취소 가능)"""
+        if not self.people:
+            QMessageBox.warning(self, "정렬 오류", "정렬할 인물이 없습니다.")
+            return
+        if self.lazy_loader:
+            # 불러온 일부만 정렬하면 아직 불러오지 않은 인물과 겹치게 됨
+            QMessageBox.warning(self, "정렬 오류", "화면 주변만 불러온 큰 가계도는 자동 정렬할 수 없습니다.")
+            self.keep_layout_btn.setChecked(False)
+            return
+        
+        self.save_state_for_undo()
+        anchor_id = self.initial_client.id if self.initial_client else None
+        if self.keep_layout_btn.isChecked():
+            # 이후 증분 배치의 기준이 되도록 배치 상태 유지
+            positions = self.tidy_layout.build(self.people, anchor_id)
+        else:
+            positions = compute_layout(self.people, anchor_id)
+        for person in self.people:
+            person.x, person.y = positions[person.id]
+        
+        self.canvas.draw_tree(self.people, anchor_id, self.relationship_lines)
+        self.update_status("가계도를 자동 정렬했습니다.")
+    
+    def on_keep_layout_toggled(self, checked: bool):
+        """정렬 유지 모드 전환 (켜면 전체를 한 번 정렬)"""
+        if not checked:
+            self.tidy_layout.invalidate()
+        elif self.people:
+            self.auto_layout()
+    
+    def relayout_affected(self, person_ids):
+        """정렬 유지 모드에서 추가/삭제된 인물의 가족과 루트까지의 경로만 다시 배치
+        
+        배치 상태가 없으면(불러오기, 실행 취소 직후 등) 전체를 다시 배치합니다.
+        """
+        if not self.keep_layout_btn.isChecked() or self.lazy_loader:
+            return
+        if self.tidy_layout.valid:
+            positions = self.tidy_layout.update(self.find_person_by_id, person_ids)
+        else:
+            anchor_id = self.initial_client.id if self.initial_client else None
+            positions = self.tidy_layout.build(self.people, anchor_id)
+        for person_id, (x, y) in positions.items():
+            person = self.find_person_by_id(person_id)
+            person.x, person.y = x, y
+    
     def save_image(self, format: str):
         """이미지로 저장"""
         if not self.people:
@@ -898,7 +1148,9 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            image = ImageExporter.export_to_image(self.canvas.scene, self.people, format)
+            image = ImageExporter.export_to_image(
+                self.canvas.scene, self.people, format, coordinates=self.person_index.coords
+            )
             if image:
                 image.save(file_path)
                 QMessageBox.information(self, "저장 완료", f"이미지가 저장되었습니다:\n{file_path}")
@@ -920,34 +1172,46 @@ class MainWindow(QMainWindow):
     
     def find_person_by_id(self, person_id: str) -> Person:
         """ID로 인물 찾기"""
-        if not person_id:
-            return None
-        for person in self.people:
+        return self.person_index.get(person_id)
+    
+    def insert_person(self, person: Person):
+        """인물을 목록과 인덱스에 추가 (실행 취소 기록 포함)"""
+        self.people.append(person)
+        self.person_index.add(person)
+        self.history.record_insert('people', len(self.people) - 1, person)
+        self.autosave.touch('person', person)
+    
+    def remove_person(self, person_id: str):
+        """인물을 목록과 인덱스에서 제거 (실행 취소 기록 포함)"""
+        for index, person in enumerate(self.people):
             if person.id == person_id:
-                return person
-        return None
+                del self.people[index]
+                self.person_index.remove(person_id)
+                self.history.record_remove('people', index, person)
+                self.autosave.forget('person', person)
+                return
+    
+    def is_current_item(self, kind: str, obj) -> bool:
+        """객체가 현재 가계도의 인물/관계선인지 여부 (자동 저장 대상 판별)"""
+        if kind == 'person':
+            return self.person_index.get(obj.id) is obj
+        return any(line is obj for line in self.relationship_lines)
     
     def reset_state(self):
         """상태 초기화"""
+        self.autosave.discard()
+        self.tidy_layout.invalidate()
+        self.lazy_loader = None
         self.people = []
+        self.person_index.clear()
         self.relationship_lines = []
-        self.history_stack = []
-        self.redo_stack = []
+        self.history.clear()
         self.current_tree_name = None
         self.initial_client = None
     
     def save_state_for_undo(self):
-        """실행 취소를 위한 상태 저장"""
-        # 새로운 작업이 발생하면 redo 스택 초기화
-        self.redo_stack.clear()
-        
-        state = {
-            'people': [p.to_dict() for p in self.people],
-            'lines': [l.to_dict() for l in self.relationship_lines]
-        }
-        self.history_stack.append(state)
-        if len(self.history_stack) > 20:
-            self.history_stack.pop(0)
+        """실행 취소를 위한 작업 구간 시작 (이후 변경 내역만 기록)"""
+        self.history.checkpoint()
     
     def update_status(self, message: str):
         """상태 표시줄 업데이트"""
@@ -1039,6 +1303,8 @@ class MainWindow(QMainWindow):
         
         line = self.canvas.create_relationship_line(line_type)
         self.relationship_lines.append(line)
+        self.history.record_insert('relationship_lines', len(self.relationship_lines) - 1, line)
+        self.autosave.touch('line', line)
         self.canvas.draw_emotional_relationship_lines([line])
         self.update_status("감정 관계선을 추가했습니다.")
     
@@ -1054,7 +1320,12 @@ class MainWindow(QMainWindow):
             deleted_line_id = self.canvas.delete_selected_relationship_line()
             if deleted_line_id:
                 self.save_state_for_undo()
-                self.relationship_lines = [l for l in self.relationship_lines if l.id != deleted_line_id]
+                for index, line in enumerate(self.relationship_lines):
+                    if line.id == deleted_line_id:
+                        del self.relationship_lines[index]
+                        self.history.record_remove('relationship_lines', index, line)
+                        self.autosave.forget('line', line)
+                        break
                 self.update_status("감정 관계선을 삭제했습니다.")
                 return
         
@@ -1074,12 +1345,14 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                # 저장 후 종료
-                self.save_current_tree()
+                # 저장 후 종료 (창이 닫히기 전에 끝나도록 동기 저장)
+                self.save_current_tree(blocking=True)
                 self.db.close()
                 event.accept()
             elif reply == QMessageBox.StandardButton.No:
-                # 저장하지 않고 종료
+                # 저장하지 않고 종료 (자동 저장 기록도 폐기)
+                self.db_pool.waitForDone()
+                self.autosave.discard()
                 self.db.close()
                 event.accept()
             else:
@@ -1087,6 +1360,8 @@ class MainWindow(QMainWindow):
                 event.ignore()
         else:
             # 데이터가 없으면 바로 종료
+            self.db_pool.waitForDone()
+            self.autosave.discard()
             self.db.close()
             event.accept()
 
@@ -1,26 +1,129 @@
 """
 데이터 모델 클래스
 """
-from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Optional
 
 
-@dataclass
-class Person:
+# 모델 필드 변경을 통지받는 리스너 목록: listener(obj, field_name, old_value, new_value)
+_change_listeners = []
+_MISSING = object()
+_set = object.__setattr__
+
+
+def add_change_listener(listener):
+    """모델 필드 변경 리스너 등록"""
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+
+def remove_change_listener(listener):
+    """모델 필드 변경 리스너 해제"""
+    if listener in _change_listeners:
+        _change_listeners.remove(listener)
+
+
+class ObservableModel:
+    """필드 값이 바뀌면 변경 표시를 남기고 등록된 리스너에게 알리는 모델 기반 클래스
+    
+    새로 만든 객체는 아직 저장되지 않았으므로 변경(dirty) 상태로 시작하며,
+    저장/불러오기 후 mark_clean()으로 표시를 지웁니다.
+    
+    인스턴스마다 __dict__를 두지 않도록 하위 클래스는 _fields에 필드 이름을
+    순서대로 나열하고 같은 이름으로 __slots__를 선언합니다.
+    """
+    
+    __slots__ = ('_dirty',)
+    _fields = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._tuple_getter = attrgetter(*cls._fields)
+        # 생성 시 __setattr__를 거치지 않도록 슬롯 디스크립터의 setter를 직접 사용
+        cls._slot_setters = tuple(getattr(cls, name).__set__ for name in cls._fields)
+    
+    def _init_fields(self, values):
+        """생성 시 필드 값 설정 (변경 알림 없음)"""
+        for setter, value in zip(self._slot_setters, values):
+            setter(self, value)
+        _set(self, '_dirty', True)
+    
+    def __setattr__(self, name, value):
+        old_value = getattr(self, name, _MISSING)
+        _set(self, name, value)
+        # 생성 중(이전 값 없음)이거나 값이 같으면 알리지 않음
+        if old_value is _MISSING or old_value == value:
+            return
+        _set(self, '_dirty', True)
+        for listener in list(_change_listeners):
+            listener(self, name, old_value, value)
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_tuple() == other.to_tuple()
+    
+    # 값이 바뀌는 객체이므로 해시하지 않음 (dataclass 기본 동작과 동일)
+    __hash__ = None
+    
+    def __repr__(self):
+        values = ', '.join(f'{name}={value!r}' for name, value in zip(self._fields, self.to_tuple()))
+        return f'{self.__class__.__name__}({values})'
+    
+    def to_tuple(self) -> tuple:
+        """_fields 순서의 값 튜플로 변환"""
+        return self._tuple_getter(self)
+    
+    @classmethod
+    def from_tuple(cls, values):
+        """_fields 순서의 값 튜플에서 객체 생성"""
+        obj = cls.__new__(cls)
+        obj._init_fields(values)
+        return obj
+    
+    @property
+    def is_dirty(self) -> bool:
+        """마지막 저장 이후 변경되었는지 여부"""
+        return self._dirty
+    
+    def mark_clean(self):
+        """저장된 상태로 표시"""
+        _set(self, '_dirty', False)
+    
+    def mark_dirty(self):
+        """다시 저장해야 하는 상태로 표시 (저장 실패 시 복구용)"""
+        _set(self, '_dirty', True)
+
+
+class Person(ObservableModel):
     """가계도의 인물을 나타내는 데이터 클래스"""
-    id: str
-    name: str
-    birthYear: Optional[str] = None
-    gender: str = "male"  # male, female, pet
-    isDeceased: bool = False
-    nodeType: str = "person"  # person, pet
-    x: float = 0.0
-    y: float = 0.0
-    parentId: Optional[str] = None
-    spouseId: Optional[str] = None
-    relationshipType: Optional[str] = None  # spouse, divorce, separation, cohabitant, child, adoptedChild, petChild
-    multipleBirthGroupId: Optional[str] = None
-    nextIdenticalSiblingId: Optional[str] = None
+    
+    _fields = (
+        'id', 'name', 'birthYear', 'gender', 'isDeceased', 'nodeType', 'x', 'y',
+        'parentId', 'spouseId', 'relationshipType', 'multipleBirthGroupId', 'nextIdenticalSiblingId'
+    )
+    __slots__ = _fields
+    
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        birthYear: Optional[str] = None,
+        gender: str = "male",  # male, female, pet
+        isDeceased: bool = False,
+        nodeType: str = "person",  # person, pet
+        x: float = 0.0,
+        y: float = 0.0,
+        parentId: Optional[str] = None,
+        spouseId: Optional[str] = None,
+        relationshipType: Optional[str] = None,  # spouse, divorce, separation, cohabitant, child, adoptedChild, petChild
+        multipleBirthGroupId: Optional[str] = None,
+        nextIdenticalSiblingId: Optional[str] = None
+    ):
+        self._init_fields((
+            id, name, birthYear, gender, isDeceased, nodeType, x, y,
+            parentId, spouseId, relationshipType, multipleBirthGroupId, nextIdenticalSiblingId
+        ))
     
     def to_dict(self):
         """딕셔너리로 변환"""
@@ -60,15 +163,22 @@ class Person:
         )
 
 
-@dataclass
-class RelationshipLine:
+class RelationshipLine(ObservableModel):
     """감정 관계선 데이터 클래스"""
-    id: str
-    lineType: str  # intimate-one, intimate-two, distant-one, distant-two, conflict-one, conflict-two
-    x1: float
-    y1: float
-    x2: float
-    y2: float
+    
+    _fields = ('id', 'lineType', 'x1', 'y1', 'x2', 'y2')
+    __slots__ = _fields
+    
+    def __init__(
+        self,
+        id: str,
+        lineType: str,  # intimate-one, intimate-two, distant-one, distant-two, conflict-one, conflict-two
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float
+    ):
+        self._init_fields((id, lineType, x1, y1, x2, y2))
 
     def to_dict(self):
         return {
@@ -0,0 +1,160 @@
+"""
+인물 조회 인덱스
+"""
+from typing import Dict, Iterable, List, Optional
+from models import Person, add_change_listener, remove_change_listener
+from coordinate_store import CoordinateStore
+
+
+class PersonIndex:
+    """ID, 부모, 배우자, 다태아 그룹 기준 인물 조회를 상수 시간에 처리하는 인덱스
+    
+    인물 필드가 바뀌면 모델 변경 알림을 받아 해당 인물의 항목만 갱신합니다.
+    인덱스에 등록된 인물의 좌표는 coords(CoordinateStore)에도 함께 보관됩니다.
+    인물 추가/삭제나 참조 필드 변경마다 version이 증가하므로, 가계도 구조에서
+    파생된 자료는 version을 비교해 필요할 때만 다시 만들 수 있습니다.
+    어떤 인물이 추가/삭제되었는지 알아야 하면 add_listener로 알림을 받습니다.
+    """
+    
+    # 역참조를 유지하는 필드
+    INDEXED_FIELDS = ('parentId', 'spouseId', 'multipleBirthGroupId', 'nextIdenticalSiblingId')
+    
+    def __init__(self, people: Iterable[Person] = None):
+        self._by_id: Dict[str, Person] = {}
+        # 필드 이름 -> {필드 값 -> {person.id -> Person}}
+        self._refs: Dict[str, Dict[str, Dict[str, Person]]] = {
+            field_name: {} for field_name in self.INDEXED_FIELDS
+        }
+        self.coords = CoordinateStore()
+        # 구조 변경 횟수 (추가/삭제/참조 필드 변경)
+        self.version = 0
+        # 인물 추가/삭제 알림 리스너
+        self._listeners = []
+        add_change_listener(self._on_person_changed)
+        
+        if people:
+            self.rebuild(people)
+    
+    def detach(self):
+        """모델 변경 알림 수신 중단"""
+        remove_change_listener(self._on_person_changed)
+        self.coords.detach()
+    
+    def add_listener(self, listener):
+        """인물 추가/삭제 알림 등록 (listener(person_id), 인덱스를 비우면 person_id는 None)"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """인물 추가/삭제 알림 해제"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, person_id):
+        for listener in list(self._listeners):
+            listener(person_id)
+    
+    def __len__(self):
+        return len(self._by_id)
+    
+    def __contains__(self, person_id):
+        return person_id in self._by_id
+    
+    def __iter__(self):
+        return iter(self._by_id.values())
+    
+    # --- 갱신 ---
+    
+    def clear(self):
+        """인덱스 비우기"""
+        self._by_id.clear()
+        for refs in self._refs.values():
+            refs.clear()
+        self.coords.clear()
+        self.version += 1
+        self._notify(None)
+    
+    def rebuild(self, people: Iterable[Person]):
+        """인물 목록 전체로 인덱스 다시 구성"""
+        self.clear()
+        for person in people:
+            self.add(person)
+    
+    def add(self, person: Person):
+        """인물 추가"""
+        if person.id in self._by_id:
+            self.remove(person.id)
+        self._by_id[person.id] = person
+        for field_name in self.INDEXED_FIELDS:
+            self._link(field_name, getattr(person, field_name), person)
+        self.coords.add(person)
+        self.version += 1
+        self._notify(person.id)
+    
+    def remove(self, person_id: str) -> Optional[Person]:
+        """인물 제거 (제거된 인물 반환)"""
+        person = self._by_id.pop(person_id, None)
+        if person is not None:
+            for field_name in self.INDEXED_FIELDS:
+                self._unlink(field_name, getattr(person, field_name), person)
+            self.coords.remove(person_id)
+            self.version += 1
+            self._notify(person_id)
+        return person
+    
+    def _link(self, field_name, value, person):
+        if value:
+            self._refs[field_name].setdefault(value, {})[person.id] = person
+    
+    def _unlink(self, field_name, value, person):
+        if not value:
+            return
+        bucket = self._refs[field_name].get(value)
+        if bucket is not None:
+            bucket.pop(person.id, None)
+            if not bucket:
+                del self._refs[field_name][value]
+    
+    def _on_person_changed(self, obj, field_name, old_value, new_value):
+        """인덱스에 등록된 인물의 참조 필드가 바뀌면 해당 항목만 이동"""
+        if field_name not in self._refs:
+            return
+        if self._by_id.get(getattr(obj, 'id', None)) is not obj:
+            return
+        self._unlink(field_name, old_value, obj)
+        self._link(field_name, new_value, obj)
+        self.version += 1
+    
+    # --- 조회 ---
+    
+    def get(self, person_id: str) -> Optional[Person]:
+        """ID로 인물 찾기"""
+        if not person_id:
+            return None
+        return self._by_id.get(person_id)
+    
+    def children_of(self, parent_id: str) -> List[Person]:
+        """parentId가 주어진 ID인 인물 목록 (가상 부모 포함)"""
+        return list(self._refs['parentId'].get(parent_id, {}).values())
+    
+    def children_by_parent(self):
+        """(parentId, 자녀 목록) 쌍 순회"""
+        for parent_id, children in self._refs['parentId'].items():
+            yield parent_id, list(children.values())
+    
+    def spouse_of(self, person_id: str) -> Optional[Person]:
+        """인물의 배우자"""
+        person = self.get(person_id)
+        return self.get(person.spouseId) if person else None
+    
+    def partners_of(self, person_id: str) -> List[Person]:
+        """spouseId가 주어진 ID를 가리키는 인물 목록"""
+        return list(self._refs['spouseId'].get(person_id, {}).values())
+    
+    def multiple_birth_group(self, group_id: str) -> List[Person]:
+        """다태아 그룹 구성원 목록"""
+        return list(self._refs['multipleBirthGroupId'].get(group_id, {}).values())
+    
+    def identical_predecessors(self, person_id: str) -> List[Person]:
+        """nextIdenticalSiblingId가 주어진 ID를 가리키는 인물 목록"""
+        return list(self._refs['nextIdenticalSiblingId'].get(person_id, {}).values())
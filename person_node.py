@@ -1,11 +1,53 @@
 """
 개별 인물 노드를 표현하는 QGraphicsItem
 """
-from PyQt6.QtWidgets import QGraphicsItem, QGraphicsTextItem
-from PyQt6.QtCore import QRectF, Qt
-from PyQt6.QtGui import QPen, QBrush, QColor, QPainterPath, QFont
+import math
+from functools import lru_cache
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtCore import QRectF, QPointF, Qt
+from PyQt6.QtGui import (
+    QPen, QBrush, QColor, QPainterPath, QFont, QPainter, QPixmap, QPixmapCache, QStaticText, QTransform
+)
 from models import Person
-from config import NODE_WIDTH, NODE_HEIGHT, TEXT_COLOR, PANEL_BG_COLOR, DANGER_COLOR
+from config import (
+    NODE_WIDTH, NODE_HEIGHT, TEXT_COLOR, PANEL_BG_COLOR, DANGER_COLOR,
+    NODE_LOD_TEXT, NODE_LOD_SIMPLE, NODE_LOD_DOT, NODE_CACHE_MAX_SCALE, NODE_CACHE_BUCKETS_PER_OCTAVE,
+    NODE_LABEL_CACHE_SIZE
+)
+
+# 노드 도형 영역 (노드 중심이 원점)
+NODE_RECT = QRectF(-NODE_WIDTH/2, -NODE_HEIGHT/2, NODE_WIDTH, NODE_HEIGHT)
+# 본체 그림 영역: 선택 테두리(3px)가 노드 경계 밖으로 나오는 만큼 여백 포함
+BODY_RECT = NODE_RECT.adjusted(-2, -2, 2, 2)
+
+
+# 노드 글자 윗변 위치 (노드 중심 기준)
+NAME_TOP = -21
+BIRTH_YEAR_TOP = 9
+
+_label_fonts = {}
+
+
+def label_font(kind: str) -> QFont:
+    """노드 글자 폰트 ('name' 또는 'birth_year', 종류별로 하나를 만들어 공유)"""
+    font = _label_fonts.get(kind)
+    if font is None:
+        if kind == 'name':
+            font = QFont("Malgun Gothic", 11, QFont.Weight.Medium)
+        else:
+            font = QFont("Malgun Gothic", 9)
+        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        _label_fonts[kind] = font
+    return font
+
+
+@lru_cache(maxsize=NODE_LABEL_CACHE_SIZE)
+def static_label(text: str, kind: str) -> QStaticText:
+    """글자 배치를 미리 계산해 둔 노드 글자 (같은 글자를 쓰는 노드끼리 공유)"""
+    label = QStaticText(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.prepare(QTransform(), label_font(kind))
+    return label
 
 
 class PersonNode(QGraphicsItem):
@@ -20,124 +62,101 @@ class PersonNode(QGraphicsItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
-        # 텍스트 아이템 생성
-        self.name_text = QGraphicsTextItem(self)
-        self.name_text.setPlainText(person.name)
-        # 폰트 설정 수정: 단일 폰트 이름 사용
-        font = QFont("Malgun Gothic", 11, QFont.Weight.Medium)
-        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
-        self.name_text.setFont(font)
-        self.name_text.setDefaultTextColor(QColor(TEXT_COLOR))
+        # 이름/출생연도 글자: (종류, 글자, 왼쪽 위 위치) 목록, paint에서 직접 그림
+        self.labels = []
+        self._bounds = QRectF(BODY_RECT)
         
-        # 출생연도 텍스트 (반려동물이 아닌 경우)
-        self.birth_year_text = None
+        self._visual_state = None
+        self.update_texts()
+    
+    def visual_state(self):
+        """노드 모양에 영향을 주는 속성 묶음 (변경 감지용)"""
+        person = self.person
+        return (person.name, person.birthYear, person.gender, person.nodeType,
+                person.isDeceased, self.is_center)
+    
+    def sync_person(self, person: Person, is_center: bool = False):
+        """노드를 다시 만들지 않고 인물 데이터 변경 사항만 반영"""
+        self.person = person
+        self.is_center = is_center
+        if self.visual_state() != self._visual_state:
+            self.update_texts()
+            self.update()
+    
+    def update_texts(self):
+        """이름/출생연도 글자와 경계 갱신 (가운데 정렬)"""
+        person = self.person
+        self._visual_state = self.visual_state()
+        texts = [('name', person.name or '', NAME_TOP)]
+        # 출생연도 (반려동물이 아닌 경우)
         if person.nodeType != 'pet' and person.birthYear:
-            self.birth_year_text = QGraphicsTextItem(self)
-            self.birth_year_text.setPlainText(f"({person.birthYear})")
-            birth_font = QFont("Malgun Gothic", 9)
-            birth_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
-            self.birth_year_text.setFont(birth_font)
-            self.birth_year_text.setDefaultTextColor(QColor(TEXT_COLOR))
+            texts.append(('birth_year', f"({person.birthYear})", BIRTH_YEAR_TOP))
         
-        self.update_text_positions()
+        labels = []
+        # 본체 그림(BODY_RECT)은 선택 테두리만큼 노드 밖으로 나오므로 경계에 포함
+        bounds = QRectF(BODY_RECT)
+        for kind, text, top in texts:
+            label = static_label(text, kind)
+            size = label.size()
+            pos = QPointF(-size.width() / 2, top)
+            labels.append((kind, label, pos))
+            # 이름이 노드보다 길면 글자까지 경계에 포함
+            bounds = bounds.united(QRectF(pos, size))
+        
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+        self.labels = labels
     
     def boundingRect(self):
-        """아이템의 경계 사각형"""
-        return QRectF(-NODE_WIDTH/2, -NODE_HEIGHT/2, NODE_WIDTH, NODE_HEIGHT)
+        """아이템의 경계 사각형 (선택 테두리를 포함한 본체와 노드 밖으로 나온 글자)"""
+        return self._bounds
+    
+    def status_color(self) -> QColor:
+        """점으로 표시할 때의 색 (선택 > 사망 > 기본 순)"""
+        if self.isSelected():
+            return QColor("#4A90E2")
+        if self.person.isDeceased:
+            return QColor(DANGER_COLOR)
+        return QColor(TEXT_COLOR)
+    
+    def body_key(self, simple: bool):
+        """노드 본체 그림을 결정하는 값 (도형, 중심인물, 사망, 선택, 단순 표시)"""
+        person = self.person
+        shape = 'pet' if person.nodeType == 'pet' else ('male' if person.gender == 'male' else 'female')
+        return (shape, self.is_center, bool(person.isDeceased), self.isSelected(), simple)
     
     def paint(self, painter, option, widget):
-        """노드 그리기"""
-        from PyQt6.QtGui import QPainter  # QPainter import 추가
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        """노드 그리기 (화면 배율이 낮을수록 단순하게 표시)"""
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < NODE_LOD_DOT:
+            # 몇 픽셀 크기로 보이면 상태 색 점으로만 표시 (긴 이름 글자 영역은 제외)
+            painter.fillRect(NODE_RECT, self.status_color())
+            return
         
-        # 선택 여부에 따른 펜 설정
-        if self.isSelected():
-            pen = QPen(QColor("#4A90E2"), 3)
-        else:
-            pen = QPen(QColor(TEXT_COLOR), 2)
+        # 작게 보이면 안티에일리어싱과 중심인물 내부 도형, 둥근 모서리 생략
+        key = self.body_key(lod < NODE_LOD_SIMPLE)
+        if lod > NODE_CACHE_MAX_SCALE:
+            # 크게 확대하면 그림이 커지므로 캐시하지 않고 직접 그림
+            paint_node_body(painter, *key)
+            self.paint_labels(painter)
+            return
         
-        painter.setPen(pen)
-        painter.setBrush(QBrush(QColor(PANEL_BG_COLOR)))
+        # 같은 모양의 노드는 배율 구간별로 한 번 그린 그림을 공유
+        scale = lod * painter.device().devicePixelRatioF()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        pixmap = node_body_pixmap(key, scale)
+        painter.drawPixmap(BODY_RECT, pixmap, QRectF(pixmap.rect()))
         
-        # 성별/타입에 따라 다른 도형 그리기
-        if self.person.nodeType == 'pet':
-            # 반려동물: 마름모
-            path = QPainterPath()
-            size = NODE_WIDTH / 2
-            path.moveTo(0, -size)
-            path.lineTo(size, 0)
-            path.lineTo(0, size)
-            path.lineTo(-size, 0)
-            path.closeSubpath()
-            painter.drawPath(path)
-            
-            # 중심인물인 경우 내부 도형 그리기 (반려동물이 중심인물일 경우는 드물지만 처리)
-            if self.is_center:
-                inner_path = QPainterPath()
-                inner_size = size - 6  # 6px 안쪽
-                inner_path.moveTo(0, -inner_size)
-                inner_path.lineTo(inner_size, 0)
-                inner_path.lineTo(0, inner_size)
-                inner_path.lineTo(-inner_size, 0)
-                inner_path.closeSubpath()
-                painter.drawPath(inner_path)
-                
-        elif self.person.gender == 'male':
-            # 남성: 둥근 모서리 사각형
-            rect = QRectF(-NODE_WIDTH/2, -NODE_HEIGHT/2, NODE_WIDTH, NODE_HEIGHT)
-            painter.drawRoundedRect(rect, 5, 5)
-            
-            # 중심인물인 경우 내부 사각형 그리기
-            if self.is_center:
-                inset = 6
-                inner_rect = rect.adjusted(inset, inset, -inset, -inset)
-                painter.drawRoundedRect(inner_rect, 3, 3)
-                
-        else:
-            # 여성: 원형
-            rect = QRectF(-NODE_HEIGHT/2, -NODE_HEIGHT/2, NODE_HEIGHT, NODE_HEIGHT)
-            painter.drawEllipse(rect)
-            
-            # 중심인물인 경우 내부 원 그리기
-            if self.is_center:
-                inset = 6
-                inner_rect = rect.adjusted(inset, inset, -inset, -inset)
-                painter.drawEllipse(inner_rect)
-        
-        # 사망한 경우 X 표시
-        if self.person.isDeceased:
-            # 사망 표시를 더 굵게 (3px)
-            painter.setPen(QPen(QColor(DANGER_COLOR), 3))
-            
-            if self.person.gender == 'male' and self.person.nodeType != 'pet':
-                # 남성: 모서리에서 모서리로 꽉 차게 그리기 (둥근 모서리 고려하여 3px 안쪽으로)
-                inset = 3
-                half_w = NODE_WIDTH / 2 - inset
-                half_h = NODE_HEIGHT / 2 - inset
-                painter.drawLine(int(-half_w), int(-half_h), int(half_w), int(half_h))
-                painter.drawLine(int(half_w), int(-half_h), int(-half_w), int(half_h))
-            else:
-                # 여성/반려동물: 기존대로 (70% 크기)
-                size = (NODE_WIDTH if self.person.nodeType == 'pet' else NODE_HEIGHT) * 0.7
-                painter.drawLine(
-                    int(-size/2), int(-size/2),
-                    int(size/2), int(size/2)
-                )
-                painter.drawLine(
-                    int(size/2), int(-size/2),
-                    int(-size/2), int(size/2)
-                )
+        if lod >= NODE_LOD_TEXT:
+            self.paint_labels(painter)
     
-    def update_text_positions(self):
-        """텍스트 위치 업데이트 (중앙 정렬)"""
-        # 이름 텍스트 중앙 정렬
-        name_rect = self.name_text.boundingRect()
-        self.name_text.setPos(-name_rect.width()/2, -25)
-        
-        # 출생연도 텍스트 중앙 정렬
-        if self.birth_year_text:
-            birth_rect = self.birth_year_text.boundingRect()
-            self.birth_year_text.setPos(-birth_rect.width()/2, 5)
+    def paint_labels(self, painter):
+        """미리 배치한 이름/출생연도 글자 그리기"""
+        painter.setPen(QColor(TEXT_COLOR))
+        for kind, label, pos in self.labels:
+            painter.setFont(label_font(kind))
+            painter.drawStaticText(pos, label)
     
     def itemChange(self, change, value):
         """아이템 변경 시 호출"""
@@ -147,9 +166,113 @@ class PersonNode(QGraphicsItem):
             self.person.x = pos.x()
             self.person.y = pos.y()
             
-            # 캔버스에 선 다시 그리기 요청
+            # 캔버스에 이 인물과 연결된 선 갱신 예약 (다음 프레임에 한 번에 그림)
             if self.scene():
                 view = self.scene().views()[0] if self.scene().views() else None
-                if view and hasattr(view, 'redraw_lines'):
-                    view.redraw_lines()
+                if view and hasattr(view, 'schedule_lines_for'):
+                    view.schedule_lines_for(self.person.id)
         return super().itemChange(change, value)
+
+
+def paint_node_body(painter, shape: str, is_center: bool, is_deceased: bool, selected: bool, simple: bool):
+    """노드 본체(도형, 중심인물 표시, 사망 X) 그리기 (노드 중심이 원점)"""
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, not simple)
+    
+    # 선택 여부에 따른 펜 설정
+    if selected:
+        pen = QPen(QColor("#4A90E2"), 3)
+    else:
+        pen = QPen(QColor(TEXT_COLOR), 2)
+    
+    painter.setPen(pen)
+    painter.setBrush(QBrush(QColor(PANEL_BG_COLOR)))
+    
+    # 성별/타입에 따라 다른 도형 그리기
+    if shape == 'pet':
+        # 반려동물: 마름모
+        path = QPainterPath()
+        size = NODE_WIDTH / 2
+        path.moveTo(0, -size)
+        path.lineTo(size, 0)
+        path.lineTo(0, size)
+        path.lineTo(-size, 0)
+        path.closeSubpath()
+        painter.drawPath(path)
+        
+        # 중심인물인 경우 내부 도형 그리기 (반려동물이 중심인물일 경우는 드물지만 처리)
+        if is_center and not simple:
+            inner_path = QPainterPath()
+            inner_size = size - 6  # 6px 안쪽
+            inner_path.moveTo(0, -inner_size)
+            inner_path.lineTo(inner_size, 0)
+            inner_path.lineTo(0, inner_size)
+            inner_path.lineTo(-inner_size, 0)
+            inner_path.closeSubpath()
+            painter.drawPath(inner_path)
+            
+    elif shape == 'male':
+        # 남성: 둥근 모서리 사각형
+        rect = QRectF(-NODE_WIDTH/2, -NODE_HEIGHT/2, NODE_WIDTH, NODE_HEIGHT)
+        if simple:
+            painter.drawRect(rect)
+        else:
+            painter.drawRoundedRect(rect, 5, 5)
+        
+        # 중심인물인 경우 내부 사각형 그리기
+        if is_center and not simple:
+            inset = 6
+            inner_rect = rect.adjusted(inset, inset, -inset, -inset)
+            painter.drawRoundedRect(inner_rect, 3, 3)
+            
+    else:
+        # 여성: 원형
+        rect = QRectF(-NODE_HEIGHT/2, -NODE_HEIGHT/2, NODE_HEIGHT, NODE_HEIGHT)
+        painter.drawEllipse(rect)
+        
+        # 중심인물인 경우 내부 원 그리기
+        if is_center and not simple:
+            inset = 6
+            inner_rect = rect.adjusted(inset, inset, -inset, -inset)
+            painter.drawEllipse(inner_rect)
+    
+    # 사망한 경우 X 표시
+    if is_deceased:
+        # 사망 표시를 더 굵게 (3px)
+        painter.setPen(QPen(QColor(DANGER_COLOR), 3))
+        
+        if shape == 'male':
+            # 남성: 모서리에서 모서리로 꽉 차게 그리기 (둥근 모서리 고려하여 3px 안쪽으로)
+            inset = 3
+            half_w = NODE_WIDTH / 2 - inset
+            half_h = NODE_HEIGHT / 2 - inset
+            painter.drawLine(int(-half_w), int(-half_h), int(half_w), int(half_h))
+            painter.drawLine(int(half_w), int(-half_h), int(-half_w), int(half_h))
+        else:
+            # 여성/반려동물: 기존대로 (70% 크기)
+            size = (NODE_WIDTH if shape == 'pet' else NODE_HEIGHT) * 0.7
+            painter.drawLine(
+                int(-size/2), int(-size/2),
+                int(size/2), int(size/2)
+            )
+            painter.drawLine(
+                int(size/2), int(-size/2),
+                int(-size/2), int(size/2)
+            )
+
+
+def node_body_pixmap(key, scale: float) -> QPixmap:
+    """노드 본체를 배율 구간 해상도로 그린 픽스맵 (QPixmapCache에 공유 보관)"""
+    bucket = round(math.log2(scale) * NODE_CACHE_BUCKETS_PER_OCTAVE)
+    cache_key = f"person_node:{key}:{bucket}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is None:
+        scale = 2 ** (bucket / NODE_CACHE_BUCKETS_PER_OCTAVE)
+        pixmap = QPixmap(math.ceil(BODY_RECT.width() * scale), math.ceil(BODY_RECT.height() * scale))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.scale(scale, scale)
+        painter.translate(-BODY_RECT.left(), -BODY_RECT.top())
+        paint_node_body(painter, *key)
+        painter.end()
+        QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
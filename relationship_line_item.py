@@ -3,10 +3,14 @@
 """
 import math
 from PyQt6.QtWidgets import QGraphicsPathItem, QGraphicsEllipseItem, QGraphicsItem
-from PyQt6.QtCore import Qt, QPointF, QRectF
-from PyQt6.QtGui import QPen, QColor, QPainterPath, QPainter, QBrush
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPen, QColor, QPainterPath, QBrush, QPainterPathStroker
 from models import RelationshipLine
 from config import INTIMATE_COLOR, DISTANT_COLOR, CONFLICT_COLOR
+from zigzag import zigzag_path
+
+# 선택/마우스 오버 판정 영역 너비 (선이 얇거나 점선이어도 선택 잘 되게)
+HIT_WIDTH = 15
 
 
 class RelationshipLineItem(QGraphicsPathItem):
@@ -19,7 +23,12 @@ class RelationshipLineItem(QGraphicsPathItem):
         self.end_handle = None
         self.dragging_state = None  # None, 'start', 'end', 'body'
         self.last_mouse_pos = None
-        self.arrow_items = []  # 화살표 아이템 추적
+        self.arrow_path = QPainterPath()  # 화살표 머리 (paint에서 직접 그림)
+        self.arrow_pen = QPen()
+        self.arrow_brush = QBrush()
+        self._shape = None  # 판정 영역 캐시 (선 모양이 바뀌면 비움)
+        self._bounds = QRectF()
+        self.drawn_state = None  # 마지막으로 그린 선의 상태
         
         # 플래그 설정
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
@@ -68,21 +77,48 @@ class RelationshipLineItem(QGraphicsPathItem):
         if self.end_handle:
             self.end_handle.setPos(self.relationship_line.x2, self.relationship_line.y2)
     
+    def line_state(self):
+        """선 모양을 결정하는 값 묶음 (변경 감지용)"""
+        line = self.relationship_line
+        return (line.lineType, line.x1, line.y1, line.x2, line.y2)
+    
     def update_line(self):
-        """선 스타일에 따라 경로 업데이트"""
-        # 기존 화살표 제거
-        for arrow_item in self.arrow_items:
-            if arrow_item.scene():
-                arrow_item.scene().removeItem(arrow_item)
-        self.arrow_items.clear()
-        
-        path = QPainterPath()
+        """선 스타일에 따라 경로 업데이트 (드래그 중에도 새 아이템을 만들지 않음)"""
+        previous_state = self.drawn_state
+        self.drawn_state = self.line_state()
         
         x1, y1 = self.relationship_line.x1, self.relationship_line.y1
         x2, y2 = self.relationship_line.x2, self.relationship_line.y2
         
         line_type = self.relationship_line.lineType
         
+        # 펜과 화살표 색은 선 종류가 바뀔 때만 다시 설정
+        if previous_state is None or previous_state[0] != line_type:
+            self.update_style(line_type)
+        
+        if 'conflict' in line_type:
+            # 지그재그선 (갈등)
+            path = zigzag_path(x1, y1, x2, y2)
+        else:
+            # 직선 (친밀/소원)
+            path = QPainterPath()
+            path.moveTo(x1, y1)
+            path.lineTo(x2, y2)
+        
+        # 화살표도 경계에 포함되므로 바꾸기 전에 알림
+        self.prepareGeometryChange()
+        self.arrow_path = self.create_arrow_path(x1, y1, x2, y2)
+        self._shape = None
+        # 경계 = 판정 영역(선에서 HIT_WIDTH/2 이내, 곡선 근사 오차 1px 여유) + 화살표(테두리 1px)
+        half = HIT_WIDTH / 2 + 1
+        bounds = path.controlPointRect().adjusted(-half, -half, half, half)
+        if not self.arrow_path.isEmpty():
+            bounds = bounds.united(self.arrow_path.controlPointRect().adjusted(-0.5, -0.5, 0.5, 0.5))
+        self._bounds = bounds
+        self.setPath(path)
+    
+    def update_style(self, line_type: str):
+        """선 종류에 따른 펜과 화살표 색 설정"""
         # 색상 결정
         if 'intimate' in line_type:
             color = QColor(INTIMATE_COLOR)
@@ -101,105 +137,19 @@ class RelationshipLineItem(QGraphicsPathItem):
             # 점선 (소원)
             pen.setStyle(Qt.PenStyle.DashLine)
             pen.setDashPattern([6, 3])
-            path.moveTo(x1, y1)
-            path.lineTo(x2, y2)
-        elif 'conflict' in line_type:
-            # 지그재그선 (갈등)
-            pen.setStyle(Qt.PenStyle.SolidLine)
-            path = self.create_zigzag_path(x1, y1, x2, y2)
         else:
-            # 실선 (친밀)
+            # 실선 (친밀/갈등)
             pen.setStyle(Qt.PenStyle.SolidLine)
-            path.moveTo(x1, y1)
-            path.lineTo(x2, y2)
         
-        self.setPath(path)
         self.setPen(pen)
-        
-        # 화살표 그리기
-        self.draw_arrows(x1, y1, x2, y2, color)
-    
-    def create_zigzag_path(self, x1, y1, x2, y2):
-        """지그재그 경로 생성"""
-        path = QPainterPath()
-        path.moveTo(x1, y1)
-        
-        # 선의 길이와 각도 계산
-        dx = x2 - x1
-        dy = y2 - y1
-        length = math.sqrt(dx*dx + dy*dy)
-        
-        # 최소 길이 확인
-        if length < 10:
-            path.lineTo(x2, y2)
-            return path
-            
-        # 정규화된 방향 벡터
-        ux = dx / length
-        uy = dy / length
-        
-        # 수직 벡터
-        vx = -uy
-        vy = ux
-        
-        # 직선 구간 (padding)
-        padding = 15
-        
-        # 전체 길이가 패딩보다 작으면 그냥 직선
-        if length <= padding * 2:
-            path.lineTo(x2, y2)
-            return path
-            
-        # 시작 직선 구간
-        start_x = x1 + ux * padding
-        start_y = y1 + uy * padding
-        path.lineTo(start_x, start_y)
-        
-        # 지그재그 파라미터
-        amplitude = 6  # 진폭
-        wavelength = 12  # 파장 (조금 더 촘촘하게)
-        
-        # 지그재그 구간 길이
-        zigzag_length = length - (padding * 2)
-        num_waves = int(zigzag_length / wavelength)
-        
-        if num_waves < 1:
-             path.lineTo(x2, y2)
-             return path
-
-        # 실제 파장에 맞춰 재조정 (끊김 방지)
-        actual_wavelength = zigzag_length / num_waves
-        
-        for i in range(num_waves * 2 + 1): # 반파장 단위로 계산
-            t = i * (actual_wavelength / 2)
-            
-            # 현재 위치 (직선 구간 이후부터 시작)
-            current_dist = padding + t
-            
-            px = x1 + ux * current_dist
-            py = y1 + uy * current_dist
-            
-            # 지그재그 오프셋
-            offset = 0
-            if i % 4 == 1: # 위
-                offset = amplitude
-            elif i % 4 == 3: # 아래
-                offset = -amplitude
-                
-            px += vx * offset
-            py += vy * offset
-            
-            path.lineTo(px, py)
-        
-        # 마지막 직선 구간
-        path.lineTo(x2, y2)
-        
-        return path
+        self.arrow_pen = QPen(color, 1)
+        self.arrow_brush = QBrush(color)
     
-    def draw_arrows(self, x1, y1, x2, y2, color):
-        """화살표 그리기"""
+    def create_arrow_path(self, x1, y1, x2, y2):
+        """화살표 머리 경로 생성"""
         line_type = self.relationship_line.lineType
         arrow_size = 10
+        arrow_path = QPainterPath()
         
         # 방향 벡터 계산
         dx = x2 - x1
@@ -207,7 +157,7 @@ class RelationshipLineItem(QGraphicsPathItem):
         length = math.sqrt(dx*dx + dy*dy)
         
         if length < 1:
-            return
+            return arrow_path
         
         # 정규화
         ux = dx / length
@@ -216,14 +166,15 @@ class RelationshipLineItem(QGraphicsPathItem):
         # 화살표 그리기
         if 'two' in line_type:
             # 양쪽 화살표
-            self.draw_arrow_head(x1, y1, -ux, -uy, arrow_size, color)
-            self.draw_arrow_head(x2, y2, ux, uy, arrow_size, color)
+            self.add_arrow_head(arrow_path, x1, y1, -ux, -uy, arrow_size)
+            self.add_arrow_head(arrow_path, x2, y2, ux, uy, arrow_size)
         else:
             # 한쪽 화살표 (끝점)
-            self.draw_arrow_head(x2, y2, ux, uy, arrow_size, color)
+            self.add_arrow_head(arrow_path, x2, y2, ux, uy, arrow_size)
+        return arrow_path
     
-    def draw_arrow_head(self, x, y, ux, uy, size, color):
-        """화살표 머리 그리기 (채워진 삼각형)"""
+    def add_arrow_head(self, arrow_path, x, y, ux, uy, size):
+        """화살표 머리(채워진 삼각형)를 경로에 추가"""
         # 화살표 각도
         angle = 30 * math.pi / 180
         
@@ -236,18 +187,10 @@ class RelationshipLineItem(QGraphicsPathItem):
         right_y = y - size * (uy * math.cos(angle) + ux * math.sin(angle))
         
         # 채워진 삼각형 경로
-        arrow_path = QPainterPath()
         arrow_path.moveTo(x, y)
         arrow_path.lineTo(left_x, left_y)
         arrow_path.lineTo(right_x, right_y)
         arrow_path.closeSubpath()
-        
-        # 화살표 아이템 생성 (채워진 삼각형)
-        arrow_item = QGraphicsPathItem(arrow_path, self)
-        arrow_item.setPen(QPen(color, 1))
-        arrow_item.setBrush(QBrush(color))
-        arrow_item.setZValue(1000)
-        self.arrow_items.append(arrow_item)  # 화살표 추적
     
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
@@ -326,22 +269,20 @@ class RelationshipLineItem(QGraphicsPathItem):
         self.last_mouse_pos = None
         super().mouseReleaseEvent(event)
     
+    def boundingRect(self):
+        """판정 영역과 화살표 머리를 모두 포함하는 경계 사각형 (update_line에서 계산)"""
+        return self._bounds
+    
     def shape(self):
-        """히트 디텍션 영역 재정의 (선이 얇거나 점선이어도 선택 잘 되게)"""
-        path = QPainterPath()
-        path.moveTo(self.relationship_line.x1, self.relationship_line.y1)
-        path.lineTo(self.relationship_line.x2, self.relationship_line.y2)
-        
-        # 스트로커를 사용하여 경로를 넓힘
-        from PyQt6.QtGui import QPainterPathStroker
-        stroker = QPainterPathStroker()
-        stroker.setWidth(15)  # 선택 영역 너비 (충분히 넓게)
-        
-        # 실제 그려지는 선의 경로(직선/지그재그)를 기반으로 확장
-        # 단, create_zigzag_path 로직을 중복 호출하는 대신 현재 path()를 사용할 수도 있으나,
-        # update_line에서 setPath를 하므로 self.path()가 이미 설정되어 있음.
-        
-        return stroker.createStroke(self.path())
+        """히트 디텍션 영역 재정의 (선 모양이 바뀐 뒤 처음 필요할 때 한 번만 계산)"""
+        if self._shape is None:
+            # 실제 그려지는 선의 경로(직선/지그재그)를 스트로커로 넓힘
+            # 둥근 끝 모양이면 판정 영역이 선에서 HIT_WIDTH/2 안에 들어가 경계와 일치
+            stroker = QPainterPathStroker()
+            stroker.setWidth(HIT_WIDTH)
+            stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
+            self._shape = stroker.createStroke(self.path())
+        return self._shape
 
     def itemChange(self, change, value):
         """아이템 변경 이벤트"""
@@ -361,4 +302,10 @@ class RelationshipLineItem(QGraphicsPathItem):
         from PyQt6.QtWidgets import QStyle
         option.state &= ~QStyle.StateFlag.State_Selected
         super().paint(painter, option, widget)
+        
+        # 화살표 머리 (선 위에 채워진 삼각형)
+        if not self.arrow_path.isEmpty():
+            painter.setPen(self.arrow_pen)
+            painter.setBrush(self.arrow_brush)
+            painter.drawPath(self.arrow_path)
 
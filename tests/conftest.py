@@ -0,0 +1,27 @@
+"""
+테스트 공통 설정: 화면 없이 Qt를 실행하고 임시 데이터베이스 파일을 사용
+"""
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """임시 파일을 사용하는 Database (실제 familytree.db는 건드리지 않음)"""
+    import database
+    monkeypatch.setattr(database, 'DB_PATH', str(tmp_path / 'test.db'))
+    db = database.Database()
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """테스트 전체에서 공유하는 QApplication"""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,101 @@
+"""
+자동 저장 저널 테스트 (기록 실패 시 변경 보존 후 재시도)
+"""
+import json
+import sqlite3
+import time
+
+from PyQt6.QtCore import QThreadPool
+
+from autosave import AutosaveJournal
+from models import Person
+
+
+def test_failed_flush_keeps_pending_and_retries(db, qapp, monkeypatch):
+    journal = AutosaveJournal(db, QThreadPool(), lambda kind, obj: True)
+    errors = []
+    journal.failed.connect(errors.append)
+    journal.start('tree')
+    person = Person(id='a', name='A')
+    journal.touch('person', person)
+    
+    # 백그라운드 저장이 쓰기 잠금을 잡고 있는 상황
+    append_journal = db.append_journal
+    
+    def locked(*args):
+        raise sqlite3.OperationalError('database is locked')
+    
+    monkeypatch.setattr(db, 'append_journal', locked)
+    journal.flush()
+    assert errors == ['database is locked']
+    assert list(journal.pending) == [('person', 'a')]
+    assert journal.flush_timer.isActive()
+    
+    # 그 사이 편집은 같은 대기 항목에 합쳐지고, 다음 주기에 현재 값으로 기록됨
+    person.name = 'B'
+    monkeypatch.setattr(db, 'append_journal', append_journal)
+    journal.flush()
+    assert not journal.pending
+    records = db.load_journal('tree')
+    assert [(kind, op, item_id) for kind, op, item_id, _ in records] == [('person', 'upsert', 'a')]
+    assert json.loads(records[0][3])['name'] == 'B'
+    journal.detach()
+
+
+def test_flush_does_not_wait_for_other_writer(db, qapp):
+    import database
+    journal = AutosaveJournal(db, QThreadPool(), lambda kind, obj: True)
+    errors = []
+    journal.failed.connect(errors.append)
+    journal.start('tree')
+    journal.touch('person', Person(id='a', name='A'))
+    
+    # 다른 연결(작업 스레드의 저장 등)이 쓰기 잠금을 잡고 있음
+    other = sqlite3.connect(database.DB_PATH)
+    other.execute('BEGIN IMMEDIATE')
+    try:
+        start = time.perf_counter()
+        journal.flush()
+        assert time.perf_counter() - start < 1.0
+        assert errors and 'locked' in errors[0]
+        assert list(journal.pending) == [('person', 'a')]
+        assert journal.flush_timer.isActive()
+    finally:
+        other.rollback()
+        other.close()
+    # 다른 쓰기가 끝나면 기본 대기 시간으로 돌아와 기록됨
+    assert db.conn.execute('PRAGMA busy_timeout').fetchone()[0] == 5000
+    journal.flush()
+    assert not journal.pending
+    assert len(db.load_journal('tree')) == 1
+    journal.detach()
+
+
+def test_flush_waits_for_background_write(db, qapp, monkeypatch):
+    busy = [True]
+    journal = AutosaveJournal(db, QThreadPool(), lambda kind, obj: True, lambda: busy[0])
+    journal.start('tree')
+    journal.touch('person', Person(id='a', name='A'))
+    
+    def unexpected(*args):
+        raise AssertionError('작업 스레드가 쓰는 동안 기록을 시도함')
+    
+    append_journal = db.append_journal
+    monkeypatch.setattr(db, 'append_journal', unexpected)
+    # 저장 작업 중에는 기록을 미루고 다음 주기에 다시 시도
+    journal.flush()
+    assert list(journal.pending) == [('person', 'a')]
+    assert journal.flush_timer.isActive()
+    
+    # 기록 정리 작업 중에도 마찬가지
+    busy[0] = False
+    journal.compact_task = object()
+    journal.flush()
+    assert list(journal.pending) == [('person', 'a')]
+    
+    journal.compact_task = None
+    monkeypatch.setattr(db, 'append_journal', append_journal)
+    journal.flush()
+    assert not journal.pending
+    assert len(db.load_journal('tree')) == 1
+    journal.detach()
@@ -0,0 +1,206 @@
+"""
+CanvasWidget 부분 갱신: 편집 후 draw_tree 결과가 처음부터 그린 결과와 같은지 확인
+"""
+import random
+
+import pytest
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QGraphicsLineItem
+
+from models import Person
+from person_index import PersonIndex
+from canvas_widget import CanvasWidget
+from config import LINE_REDRAW_INTERVAL_MS
+
+# 종료 중 뷰 콜백이 정리된 파이썬 속성에 접근하지 않도록 테스트가 끝날 때까지 보관
+_canvases = []
+
+
+def make_canvas(people):
+    index = PersonIndex(people)
+    canvas = CanvasWidget(person_index=index)
+    _canvases.append(canvas)
+    canvas.draw_tree(people)
+    return canvas, index
+
+
+def snapshot(canvas):
+    """노드 상태와 관계선 모양"""
+    nodes = {
+        pid: (node.pos().x(), node.pos().y(), node.visual_state())
+        for pid, node in canvas.node_map.items()
+    }
+    lines = {}
+    for key, item in canvas.line_items.items():
+        if isinstance(item, QGraphicsLineItem):
+            line = item.line()
+            shape = (line.x1(), line.y1(), line.x2(), line.y2())
+        else:
+            path = item.path()
+            shape = tuple((path.elementAt(i).x, path.elementAt(i).y) for i in range(path.elementCount()))
+        lines[key] = (shape, item.pen().style())
+    return nodes, lines
+
+
+def assert_matches_full_draw(canvas, people):
+    fresh, index = make_canvas(list(people))
+    try:
+        assert snapshot(canvas) == snapshot(fresh)
+        assert len(canvas.scene.items()) == len(fresh.scene.items())
+        assert canvas.scene.sceneRect() == fresh.scene.sceneRect()
+    finally:
+        fresh.detach()
+        index.detach()
+
+
+def family():
+    people = [
+        Person(id='a', name='할아버지', x=0, y=0, spouseId='b'),
+        Person(id='b', name='할머니', x=150, y=0, spouseId='a'),
+        Person(id='c', name='아버지', x=0, y=200, parentId='a', spouseId='d'),
+        Person(id='d', name='어머니', x=150, y=200, spouseId='c'),
+        Person(id='e', name='고모', x=300, y=200, parentId='a'),
+        Person(id='f', name='나', x=0, y=400, parentId='c', multipleBirthGroupId='g1', nextIdenticalSiblingId='g'),
+        Person(id='g', name='쌍둥이', x=100, y=400, parentId='c', multipleBirthGroupId='g1'),
+        Person(id='h', name='동생', x=250, y=400, parentId='d'),
+    ]
+    return people
+
+
+@pytest.fixture
+def canvas(qapp):
+    people = family()
+    canvas, index = make_canvas(people)
+    yield canvas, index, people
+    canvas.detach()
+    index.detach()
+
+
+def test_edit_updates_only_changed_units(canvas):
+    canvas, index, people = canvas
+    drawn = {pid: node for pid, node in canvas.node_map.items()}
+    
+    index.get('e').x = 320
+    canvas.draw_tree(people)
+    
+    # 다른 노드는 그대로 재사용
+    assert all(canvas.node_map[pid] is node for pid, node in drawn.items())
+    assert_matches_full_draw(canvas, people)
+
+
+def test_add_and_delete(canvas):
+    canvas, index, people = canvas
+    child = Person(id='i', name='조카', x=300, y=400, parentId='e')
+    people.append(child)
+    index.add(child)
+    canvas.draw_tree(people)
+    assert ('parent', 'e') in canvas.line_items
+    assert_matches_full_draw(canvas, people)
+    
+    # 삭제 (main.delete_selected_person처럼 관계를 먼저 끊음)
+    for person in index.children_of('c'):
+        person.parentId = None
+    index.get('d').spouseId = None
+    people.remove(index.get('c'))
+    index.remove('c')
+    canvas.draw_tree(people)
+    assert 'c' not in canvas.node_map
+    assert_matches_full_draw(canvas, people)
+
+
+def test_remove_parent_keeps_virtual_family(canvas):
+    canvas, index, people = canvas
+    # 관계를 끊지 않고 삭제하면 남은 자녀는 가상 부모의 형제로 묶임
+    people.remove(index.get('c'))
+    index.remove('c')
+    canvas.draw_tree(people)
+    assert_matches_full_draw(canvas, people)
+
+
+def test_scene_rect_shrinks_after_edge_removal(canvas):
+    canvas, index, people = canvas
+    far = Person(id='z', name='아주 긴 이름의 먼 친척', x=3000, y=1200, parentId='e')
+    people.append(far)
+    index.add(far)
+    canvas.draw_tree(people)
+    assert canvas.scene.sceneRect().right() > 3000
+    
+    people.remove(far)
+    index.remove('z')
+    canvas.draw_tree(people)
+    assert canvas.scene.sceneRect().right() < 1000
+    assert_matches_full_draw(canvas, people)
+    
+    # 가장자리 노드를 안쪽으로 옮겨도 줄어듦
+    index.get('e').x = 200
+    canvas.draw_tree(people)
+    assert_matches_full_draw(canvas, people)
+
+
+def test_center_change(canvas):
+    canvas, index, people = canvas
+    canvas.draw_tree(people, 'f')
+    assert canvas.node_map['f'].is_center
+    canvas.draw_tree(people, 'g')
+    assert not canvas.node_map['f'].is_center
+    assert canvas.node_map['g'].is_center
+
+
+def test_drag_redraws_lines_once_per_frame(canvas):
+    canvas, index, people = canvas
+    flushes = canvas.line_flush_count
+    lines_before = snapshot(canvas)[1]
+    
+    # 드래그 중 한 프레임 안에 여러 노드가 여러 번 움직임
+    for step in range(1, 6):
+        canvas.node_map['c'].setPos(step * 10, 200)
+        canvas.node_map['f'].setPos(step * 5, 400)
+    assert canvas.line_flush_count == flushes
+    assert snapshot(canvas)[1] == lines_before
+    
+    QTest.qWait(LINE_REDRAW_INTERVAL_MS * 5)
+    assert canvas.line_flush_count == flushes + 1
+    assert (index.get('c').x, index.get('f').x) == (50, 25)
+    assert_matches_full_draw(canvas, people)
+
+
+def test_random_edits_match_full_draw(qapp):
+    rng = random.Random(7)
+    people = [Person(id=f"p{i:03d}", name=str(i), x=float(i * 37 % 500), y=float(i // 10 * 200))
+              for i in range(40)]
+    canvas, index = make_canvas(people)
+    try:
+        for step in range(300):
+            person = rng.choice(people)
+            other = rng.choice(people)
+            action = rng.randrange(8)
+            if action == 0:
+                person.parentId = other.id if other is not person else None
+            elif action == 1:
+                person.spouseId = other.id if other is not person else None
+                if rng.random() < 0.7:
+                    other.spouseId = person.id
+            elif action == 2:
+                person.nextIdenticalSiblingId = other.id if other is not person else None
+            elif action == 3:
+                person.multipleBirthGroupId = rng.choice((None, 'g1', 'g2'))
+            elif action == 4:
+                person.x += rng.choice((-60, 40, 90))
+                person.y = rng.choice((0, 200, 400))
+            elif action == 5:
+                person.relationshipType = rng.choice((None, 'child', 'adoptedChild', 'divorce', 'cohabitant'))
+            elif action == 6 and len(people) > 10:
+                people.remove(person)
+                index.remove(person.id)
+            else:
+                new = Person(id=f"n{step:03d}", name='새', x=other.x + 20, y=other.y + 200,
+                             parentId=rng.choice((other.id, None)))
+                people.append(new)
+                index.add(new)
+            canvas.draw_tree(people)
+            if step % 25 == 0:
+                assert_matches_full_draw(canvas, people)
+        assert_matches_full_draw(canvas, people)
+    finally:
+        canvas.detach()
+        index.detach()
@@ -0,0 +1,152 @@
+"""
+조상-자손 폐쇄 테이블 테스트 (부부 단위 부모, 증분 갱신 = 전체 재구성)
+"""
+import random
+
+from models import Person
+
+TREE = 'closure-test'
+
+
+def couple(a: Person, b: Person):
+    """두 사람을 서로 배우자로 연결"""
+    a.spouseId = b.id
+    b.spouseId = a.id
+
+
+def family():
+    """조부모(Dad/Mom), 나와 여동생, 아내, 자녀 둘(한 명은 아내 쪽으로 연결), 처가 아버지"""
+    people = {pid: Person(id=pid, name=pid) for pid in
+              ('Dad', 'Mom', 'Me', 'Sis', 'Wife', 'C1', 'C2', 'WifeDad')}
+    couple(people['Dad'], people['Mom'])
+    couple(people['Me'], people['Wife'])
+    people['Me'].parentId = 'Dad'
+    people['Sis'].parentId = 'Mom'
+    people['Wife'].parentId = 'WifeDad'
+    people['C1'].parentId = 'Me'
+    people['C2'].parentId = 'Wife'
+    return people
+
+
+def ids(people):
+    return sorted(p.id for p in people)
+
+
+def closure_rows(db, tree_name=TREE):
+    cursor = db.read_conn.execute(
+        'SELECT ancestor_id, descendant_id, depth FROM PeopleClosure WHERE tree_name = ?', (tree_name,)
+    )
+    return {tuple(row) for row in cursor.fetchall()}
+
+
+def rebuilt_rows(db, tree_name=TREE):
+    """같은 데이터로 전체 재구성했을 때의 폐쇄 테이블 (확인 후 되돌림)"""
+    db.rebuild_closure(tree_name)
+    rows = {tuple(row) for row in db.cursor.execute(
+        'SELECT ancestor_id, descendant_id, depth FROM PeopleClosure WHERE tree_name = ?', (tree_name,)
+    ).fetchall()}
+    db.conn.rollback()
+    return rows
+
+
+def test_couple_children_are_descendants_of_both_parents(db):
+    people = family()
+    db.save_tree_delta(TREE, list(people.values()))
+    
+    assert ids(db.get_ancestors(TREE, 'C2')) == ['Dad', 'Me', 'Mom', 'Wife', 'WifeDad']
+    assert ids(db.get_ancestors(TREE, 'C1')) == ['Dad', 'Me', 'Mom', 'Wife', 'WifeDad']
+    assert ids(db.get_descendants(TREE, 'Me')) == ['C1', 'C2']
+    assert ids(db.get_descendants(TREE, 'Dad')) == ['C1', 'C2', 'Me', 'Sis']
+    assert ids(db.get_descendants(TREE, 'Mom')) == ['C1', 'C2', 'Me', 'Sis']
+    # 세대 순 정렬과 세대 제한
+    assert ids(db.get_descendants(TREE, 'Mom', max_depth=1)) == ['Me', 'Sis']
+    assert [p.id for p in db.get_ancestors(TREE, 'C2')][:2] in (['Me', 'Wife'], ['Wife', 'Me'])
+    assert closure_rows(db) == rebuilt_rows(db)
+
+
+def test_one_sided_spouse_link_is_not_a_couple(db):
+    people = family()
+    # Mom만 Dad를 가리키면 부부 단위가 아님
+    people['Dad'].spouseId = None
+    db.save_tree_delta(TREE, list(people.values()))
+    
+    assert ids(db.get_descendants(TREE, 'Mom')) == ['Sis']
+    assert ids(db.get_ancestors(TREE, 'Me')) == ['Dad']
+
+
+def test_spouse_change_updates_children_of_both(db):
+    people = family()
+    db.save_tree_delta(TREE, list(people.values()))
+    
+    # 이혼: Me와 Wife의 부부 연결을 끊으면 자녀가 각자 한쪽 부모의 자손으로만 남음
+    people['Me'].spouseId = None
+    people['Wife'].spouseId = None
+    db.save_tree_delta(TREE, list(people.values()))
+    assert ids(db.get_descendants(TREE, 'Me')) == ['C1']
+    assert ids(db.get_ancestors(TREE, 'C2')) == ['Wife', 'WifeDad']
+    assert closure_rows(db) == rebuilt_rows(db)
+    
+    # 재혼: 한쪽만 먼저 저장되어도 부부 연결이 완성될 때 반영됨
+    people['Me'].spouseId = 'Wife'
+    db.save_tree_delta(TREE, list(people.values()))
+    assert ids(db.get_descendants(TREE, 'Me')) == ['C1']
+    people['Wife'].spouseId = 'Me'
+    db.save_tree_delta(TREE, list(people.values()))
+    assert ids(db.get_descendants(TREE, 'Me')) == ['C1', 'C2']
+    assert closure_rows(db) == rebuilt_rows(db)
+
+
+def test_deleting_a_parent_keeps_it_as_virtual_ancestor(db):
+    people = family()
+    db.save_tree_delta(TREE, list(people.values()))
+    
+    del people['Me']
+    people['Wife'].spouseId = None
+    db.save_tree_delta(TREE, list(people.values()))
+    
+    # C1은 삭제된 Me를 가상 부모로 유지하고, 조부모와는 끊어짐
+    assert closure_rows(db) == rebuilt_rows(db)
+    assert ('Me', 'C1', 1) in closure_rows(db)
+    assert ids(db.get_descendants(TREE, 'Dad')) == ['Sis']
+    assert ids(db.get_ancestors(TREE, 'C2')) == ['Wife', 'WifeDad']
+
+
+def test_incremental_closure_matches_rebuild_with_couples(db):
+    rng = random.Random(17)
+    people = {}
+    counter = 0
+    
+    def new_person(parent_id=None):
+        nonlocal counter
+        counter += 1
+        person = Person(id=f'p{counter:03d}', name=f'p{counter}', parentId=parent_id)
+        people[person.id] = person
+        return person
+    
+    for _ in range(20):
+        new_person(rng.choice([None, *people]) if people else None)
+    db.save_tree_delta(TREE, list(people.values()))
+    
+    for step in range(150):
+        action = rng.random()
+        pid = rng.choice(list(people))
+        person = people[pid]
+        if action < 0.3:
+            new_person(rng.choice([pid, None, 'virtual-parent']))
+        elif action < 0.5:
+            # 자손을 부모로 삼는 순환은 화면에서 만들 수 없으므로 제외
+            descendants = {p.id for p in db.get_descendants(TREE, pid)} | {pid}
+            person.parentId = rng.choice([None, *(i for i in people if i not in descendants)])
+        elif action < 0.75:
+            # 결혼/이혼 (가끔 한쪽만 바뀐 상태로 저장)
+            other = people[rng.choice(list(people))]
+            if person.spouseId and person.spouseId in people:
+                people[person.spouseId].spouseId = None
+            person.spouseId = other.id if other is not person else None
+            if rng.random() < 0.8 and person.spouseId:
+                other.spouseId = person.id
+        elif len(people) > 5:
+            del people[pid]
+        
+        db.save_tree_delta(TREE, list(people.values()))
+        assert closure_rows(db) == rebuilt_rows(db), f'step {step}'
@@ -0,0 +1,118 @@
+"""
+촌수와 호칭: 아버지 쪽, 어머니 쪽(세대마다 갈아타는 외가 포함), 인척
+"""
+import pytest
+
+from models import Person
+from person_index import PersonIndex
+from kinship import KinshipIndex
+
+
+def family():
+    people = [
+        # 나와 배우자, 자녀
+        Person(id='me', name='나', gender='male', parentId='father', spouseId='wife'),
+        Person(id='wife', name='아내', gender='female', parentId='wife_father', spouseId='me'),
+        Person(id='son', name='아들', gender='male', parentId='me', spouseId='son_wife'),
+        Person(id='son_wife', name='며느리', gender='female', spouseId='son'),
+        Person(id='daughter', name='딸', gender='female', parentId='me', spouseId='daughter_husband'),
+        Person(id='daughter_husband', name='사위', gender='male', spouseId='daughter'),
+        Person(id='brother', name='형', gender='male', parentId='father', spouseId='brother_wife'),
+        Person(id='brother_wife', name='형수', gender='female', spouseId='brother'),
+        # 부모
+        Person(id='father', name='아버지', gender='male', parentId='pgf', spouseId='mother'),
+        Person(id='mother', name='어머니', gender='female', parentId='mgf', spouseId='father'),
+        # 친가
+        Person(id='pgf', name='할아버지', gender='male', spouseId='pgm'),
+        Person(id='pgm', name='할머니', gender='female', spouseId='pgf'),
+        Person(id='uncle', name='삼촌', gender='male', parentId='pgf'),
+        Person(id='aunt', name='고모', gender='female', parentId='pgm'),
+        Person(id='cousin', name='사촌', gender='female', parentId='uncle'),
+        # 외가
+        # 외할아버지도 부모가 있어 외할머니 쪽으로 한 번 더 갈아타야 함
+        Person(id='mgf', name='외할아버지', gender='male', parentId='mgf_father', spouseId='mgm'),
+        Person(id='mgf_father', name='외증조할아버지', gender='male'),
+        Person(id='mgm', name='외할머니', gender='female', parentId='mggf', spouseId='mgf'),
+        Person(id='m_uncle', name='외삼촌', gender='male', parentId='mgm'),
+        Person(id='imo', name='이모', gender='female', parentId='mgf'),
+        Person(id='m_cousin', name='외사촌', gender='male', parentId='imo'),
+        # 외할머니의 친정
+        Person(id='mggf', name='외증조할아버지', gender='male', spouseId='mggm'),
+        Person(id='mggm', name='외증조할머니', gender='female', spouseId='mggf'),
+        Person(id='mgm_brother', name='외종조할아버지', gender='male', parentId='mggm'),
+        # 처가와 장모의 친정
+        Person(id='wife_father', name='장인', gender='male', spouseId='wife_mother'),
+        Person(id='wife_mother', name='장모', gender='female', parentId='wmgf', spouseId='wife_father'),
+        Person(id='wmgf', name='처외조부', gender='male', spouseId='wmgm'),
+        Person(id='wmgm', name='처외조모', gender='female', spouseId='wmgf'),
+        # 이어지지 않은 사람
+        Person(id='stranger', name='남', gender='male'),
+    ]
+    return people
+
+
+@pytest.fixture
+def kinship():
+    index = PersonIndex(family())
+    yield KinshipIndex(index)
+    index.detach()
+
+
+@pytest.mark.parametrize('other, expected', [
+    ('father', (1, '아버지')),
+    ('brother', (2, '형제')),
+    ('pgf', (2, '할아버지')),
+    ('pgm', (2, '할머니')),
+    ('uncle', (3, '삼촌')),
+    ('aunt', (3, '고모')),
+    ('cousin', (4, '사촌')),
+    ('son', (1, '아들')),
+])
+def test_paternal_side(kinship, other, expected):
+    assert kinship.relation('me', other) == expected
+
+
+@pytest.mark.parametrize('other, expected', [
+    ('mother', (1, '어머니')),
+    ('mgf', (2, '외할아버지')),
+    ('mgm', (2, '외할머니')),
+    ('m_uncle', (3, '외삼촌')),
+    ('imo', (3, '이모')),
+    ('m_cousin', (4, '외사촌')),
+    # 어머니 -> 외할머니로 두 번 갈아타야 닿는 외할머니의 친정
+    ('mggf', (3, '외증조할아버지')),
+    ('mggm', (3, '외증조할머니')),
+    ('mgm_brother', (4, '외종조할아버지')),
+    ('mgf_father', (3, '외증조할아버지')),
+])
+def test_maternal_side(kinship, other, expected):
+    assert kinship.relation('me', other) == expected
+
+
+@pytest.mark.parametrize('me, other, expected', [
+    ('me', 'wife', (0, '아내')),
+    ('me', 'wife_father', (1, '장인')),
+    ('me', 'wife_mother', (1, '장모')),
+    ('wife', 'father', (1, '시아버지')),
+    ('wife', 'mgm', (2, '배우자의 외할머니')),
+    ('me', 'wmgm', (2, '배우자의 외할머니')),
+    ('me', 'son_wife', (1, '며느리')),
+    ('me', 'daughter_husband', (1, '사위')),
+    ('me', 'brother_wife', (2, '형제의 배우자')),
+    ('wife', 'brother_wife', (None, '배우자의 형제의 배우자')),
+    ('son_wife', 'wife_mother', (2, '배우자의 외할머니')),
+])
+def test_in_laws(kinship, me, other, expected):
+    assert kinship.relation(me, other) == expected
+
+
+def test_unrelated_and_self(kinship):
+    assert kinship.relation('me', 'stranger') is None
+    assert kinship.relation('me', 'missing') is None
+    assert kinship.relation('me', 'me') == (0, '본인')
+
+
+def test_rebuilds_after_edit(kinship):
+    assert kinship.relation('me', 'stranger') is None
+    kinship.person_index.get('stranger').parentId = 'mggf'
+    assert kinship.relation('me', 'stranger') == (4, '외종조할아버지')
@@ -0,0 +1,188 @@
+"""
+자동 정렬: 서브트리 경계 공유와 증분 배치 비용
+"""
+import random
+
+import layout_engine
+from layout_engine import TidyLayout
+from models import Person
+from config import NODE_WIDTH, LEVEL_SPACING
+
+
+def caterpillar(depth: int, leaves: int = 1):
+    """깊이 depth의 척추에 세대마다 잎 leaves개가 달린 가계도"""
+    people = [Person(id='s0000', name='s', x=0.0, y=0.0)]
+    for d in range(1, depth):
+        for i in range(leaves):
+            people.append(Person(id=f"l{d:04d}_{i:03d}", name='l', x=float(i * 200),
+                                 y=float(d * LEVEL_SPACING), parentId=f"s{d - 1:04d}"))
+        people.append(Person(id=f"s{d:04d}", name='s', x=float(leaves * 200),
+                             y=float(d * LEVEL_SPACING), parentId=f"s{d - 1:04d}"))
+    return people
+
+
+def subtree_edges(unit, people_x):
+    """단위 중심 기준 세대별 (왼쪽, 오른쪽) 경계를 배치 좌표에서 직접 계산"""
+    edges = {}
+    stack = [(unit, 0)]
+    while stack:
+        node, depth = stack.pop()
+        for member in node.members:
+            x = people_x[member.id] - unit.x
+            left, right = edges.get(depth, (x, x))
+            edges[depth] = (min(left, x - NODE_WIDTH / 2), max(right, x + NODE_WIDTH / 2))
+        if not node.members:
+            left, right = edges.get(depth, (0.0, 0.0))
+            edges[depth] = (min(left, node.x - unit.x), max(right, node.x - unit.x))
+        stack.extend((child, depth + 1) for child in node.children)
+    return [edges[d][0] for d in sorted(edges)], [edges[d][1] for d in sorted(edges)]
+
+
+def assert_no_overlap(people):
+    rows = {}
+    for person in people:
+        rows.setdefault(round(person.y, 6), []).append(person.x)
+    for xs in rows.values():
+        xs.sort()
+        assert all(b - a >= NODE_WIDTH - 1e-6 for a, b in zip(xs, xs[1:]))
+
+
+def test_contours_match_positions():
+    rng = random.Random(3)
+    people = [Person(id='p000', name='p', x=0.0, y=0.0)]
+    for i in range(1, 300):
+        parent = rng.choice(people)
+        people.append(Person(id=f"p{i:03d}", name='p', x=parent.x + rng.uniform(-50, 50),
+                             y=parent.y + LEVEL_SPACING, parentId=parent.id))
+    layout = TidyLayout()
+    try:
+        positions = layout.build(people)
+        people_x = {pid: x - layout.origin[0] for pid, (x, y) in positions.items()}
+        for unit in set(layout.unit_of.values()):
+            # 부모를 배치한 뒤에도 자녀의 경계는 그대로 남아 있어야 함
+            lefts, rights = unit.contour.edges()
+            want_lefts, want_rights = subtree_edges(unit, people_x)
+            assert lefts == want_lefts
+            assert rights == want_rights
+    finally:
+        layout.detach()
+
+
+def test_build_merge_work_is_linear(monkeypatch):
+    # 깊은 척추에 잎이 달린 가계도: 경계를 복사하면 인물 수 x 깊이만큼 일함
+    calls = {'separation': 0, 'splice': 0}
+    separation, splice = layout_engine._separation, layout_engine._splice
+    
+    def counting_separation(left, right):
+        calls['separation'] += min(len(left), len(right))
+        return separation(left, right)
+    
+    def counting_splice(head, head_shift, tail, tail_shift, count):
+        calls['splice'] += count
+        return splice(head, head_shift, tail, tail_shift, count)
+    
+    monkeypatch.setattr(layout_engine, '_separation', counting_separation)
+    monkeypatch.setattr(layout_engine, '_splice', counting_splice)
+    people = caterpillar(2000, leaves=2)
+    layout = TidyLayout()
+    try:
+        layout.build(people)
+    finally:
+        layout.detach()
+    assert calls['separation'] <= len(people)
+    assert calls['splice'] <= len(people)
+
+
+def count_relayout(monkeypatch, depth: int, leaves: int):
+    """깊이 depth 가계도의 맨 아래에 한 명을 추가할 때 경계를 다시 계산한 단위 수"""
+    people = caterpillar(depth, leaves)
+    by_id = {p.id: p for p in people}
+    layout = TidyLayout()
+    try:
+        for pid, (x, y) in layout.build(people).items():
+            by_id[pid].x, by_id[pid].y = x, y
+        
+        calls = []
+        layout_unit = layout_engine._layout_unit
+        monkeypatch.setattr(layout_engine, '_layout_unit', lambda unit: (calls.append(unit), layout_unit(unit)))
+        bottom = by_id[f"s{depth - 1:04d}"]
+        child = Person(id='new', name='new', x=bottom.x, y=bottom.y + LEVEL_SPACING, parentId=bottom.id)
+        by_id[child.id] = child
+        for pid, (x, y) in layout.update(by_id.get, [child.id]).items():
+            by_id[pid].x, by_id[pid].y = x, y
+        monkeypatch.setattr(layout_engine, '_layout_unit', layout_unit)
+        assert_no_overlap(by_id.values())
+        return len(calls)
+    finally:
+        layout.detach()
+
+
+def test_update_cost_follows_depth_not_size(monkeypatch):
+    # 같은 깊이에서 인물 수를 늘려도 다시 계산하는 단위 수는 같음
+    assert count_relayout(monkeypatch, 20, 1) == count_relayout(monkeypatch, 20, 40) == 21
+    # 깊이가 늘면 그만큼 늘어남
+    assert count_relayout(monkeypatch, 80, 1) == 81
+
+
+def test_update_places_only_changed_roots():
+    # 서로 떨어진 가계도 200개 중 하나에 자녀를 추가
+    people = []
+    for t in range(200):
+        people.append(Person(id=f"r{t:03d}", name='r', x=float(t * 1000), y=0.0))
+        for c in range(2):
+            people.append(Person(id=f"c{t:03d}_{c}", name='c', x=float(t * 1000 + c * 100),
+                                 y=LEVEL_SPACING, parentId=f"r{t:03d}"))
+    by_id = {p.id: p for p in people}
+    layout = TidyLayout()
+    try:
+        for pid, (x, y) in layout.build(people).items():
+            by_id[pid].x, by_id[pid].y = x, y
+        
+        placed = []
+        place = layout._place_changed_roots
+        layout._place_changed_roots = lambda changed, added: placed.extend(place(changed, added)) or placed
+        # 손자 세대는 다른 가계도와 겹치지 않으므로 그 가계도만 다시 배치
+        parent = by_id['c100_0']
+        child = Person(id='new', name='new', x=parent.x, y=parent.y + LEVEL_SPACING, parentId=parent.id)
+        by_id[child.id] = child
+        for pid, (x, y) in layout.update(by_id.get, [child.id]).items():
+            by_id[pid].x, by_id[pid].y = x, y
+        assert [root.key for root in placed] == ['r100']
+        assert_no_overlap(by_id.values())
+        
+        # 자녀 세대가 넓어지면 빈틈없이 붙어 있던 오른쪽 가계도가 밀림
+        placed.clear()
+        child = Person(id='new2', name='new', x=by_id['r150'].x, y=LEVEL_SPACING, parentId='r150')
+        by_id[child.id] = child
+        for pid, (x, y) in layout.update(by_id.get, [child.id]).items():
+            by_id[pid].x, by_id[pid].y = x, y
+        assert [root.key for root in placed] == [f"r{t:03d}" for t in range(150, 200)]
+        assert_no_overlap(by_id.values())
+    finally:
+        layout.detach()
+
+
+def test_random_updates_keep_trees_apart():
+    rng = random.Random(11)
+    people = [Person(id=f"r{i}", name='r', x=float(i * 500), y=0.0) for i in range(5)]
+    by_id = {p.id: p for p in people}
+    layout = TidyLayout()
+    try:
+        for pid, (x, y) in layout.build(people).items():
+            by_id[pid].x, by_id[pid].y = x, y
+        for step in range(200):
+            if rng.random() < 0.8 or len(by_id) < 10:
+                parent = rng.choice(list(by_id.values()))
+                person = Person(id=f"n{step}", name='n', x=parent.x + rng.uniform(-80, 80),
+                                y=parent.y + LEVEL_SPACING, parentId=parent.id)
+                by_id[person.id] = person
+            else:
+                # 자녀 없는 인물 삭제
+                parents = {p.parentId for p in by_id.values()}
+                person = rng.choice([p for p in by_id.values() if p.id not in parents])
+                del by_id[person.id]
+            for pid, (x, y) in layout.update(by_id.get, [person.id]).items():
+                by_id[pid].x, by_id[pid].y = x, y
+            assert_no_overlap(by_id.values())
+    finally:
+        layout.detach()
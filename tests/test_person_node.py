@@ -0,0 +1,61 @@
+"""
+PersonNode 경계: 그리는 영역이 boundingRect 안에 있어야 이동/선택 해제 후 흔적이 남지 않음
+"""
+import pytest
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QGraphicsScene, QStyleOptionGraphicsItem
+
+from models import Person
+from person_node import PersonNode, BODY_RECT
+
+
+def make_node(scene, **fields):
+    person = Person(id='p', name=fields.pop('name', '홍'), birthYear='1950', **fields)
+    node = PersonNode(person, is_center=True)
+    scene.addItem(node)
+    node.setSelected(True)
+    return node
+
+
+def painted_rect(node, scale: float) -> QRectF:
+    """scale 배율로 노드를 그렸을 때 칠해진 픽셀의 범위 (노드 좌표)"""
+    bounds = node.boundingRect()
+    half = int(max(abs(bounds.left()), abs(bounds.right()), abs(bounds.top()), abs(bounds.bottom())) * scale) + 10
+    size = half * 2
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.translate(half, half)
+    painter.scale(scale, scale)
+    node.paint(painter, QStyleOptionGraphicsItem(), None)
+    painter.end()
+    
+    # 행마다 알파 바이트를 모아 칠해진 행과 열 찾기
+    bits = image.constBits().asstring(image.sizeInBytes())
+    stride = image.bytesPerLine()
+    rows, columns = [], 0
+    for y in range(size):
+        alpha = bits[y * stride + 3:y * stride + size * 4:4]
+        if any(alpha):
+            rows.append(y)
+            columns |= int.from_bytes(bytes(1 if a else 0 for a in alpha), 'little')
+    xs = [x for x in range(size) if columns >> (8 * x) & 1]
+    left, top = (xs[0] - half) / scale, (rows[0] - half) / scale
+    right, bottom = (xs[-1] + 1 - half) / scale, (rows[-1] + 1 - half) / scale
+    return QRectF(left, top, right - left, bottom - top)
+
+
+@pytest.mark.parametrize('fields', [
+    {'gender': 'male'},
+    {'gender': 'female', 'isDeceased': True},
+    {'gender': 'male', 'nodeType': 'pet'},
+    {'gender': 'male', 'name': '아주 긴 이름을 가진 사람입니다'},
+])
+def test_bounding_rect_covers_body(qapp, fields):
+    scene = QGraphicsScene()
+    node = make_node(scene, **fields)
+    assert node.boundingRect().contains(BODY_RECT)
+    # 캐시한 본체 그림(배율 1)과 직접 그리는 큰 배율 모두 경계 안에 그려짐
+    for scale in (1.0, 5.0):
+        assert node.boundingRect().contains(painted_rect(node, scale))
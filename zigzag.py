@@ -0,0 +1,75 @@
+"""
+갈등 관계선의 지그재그 경로 생성
+"""
+import math
+from functools import lru_cache
+from PyQt6.QtGui import QPainterPath, QTransform
+
+# 양 끝의 직선 구간 길이
+ZIGZAG_PADDING = 15
+# 진폭
+ZIGZAG_AMPLITUDE = 6
+# 파장 (선 길이에 맞춰 파동 수를 정한 뒤 늘려서 맞춤)
+ZIGZAG_WAVELENGTH = 12
+
+
+@lru_cache(maxsize=256)
+def unit_zigzag(num_waves: int) -> QPainterPath:
+    """길이 1짜리 지그재그 경로 (x축 방향, 파동 수별로 한 번만 만들어 공유)
+    
+    x는 0~1로 정규화하고 y는 진폭 그대로 둡니다. 반환한 경로는 공유되므로
+    수정하지 말고 변환한 복사본을 사용해야 합니다.
+    """
+    path = QPainterPath()
+    path.moveTo(0, 0)
+    step = 1 / (num_waves * 2)
+    # 반파장 단위 꼭짓점: 0, 위, 0, 아래 순서 반복
+    offsets = (0, ZIGZAG_AMPLITUDE, 0, -ZIGZAG_AMPLITUDE)
+    for i in range(num_waves * 2 + 1):
+        path.lineTo(i * step, offsets[i % 4])
+    return path
+
+
+def zigzag_path(x1, y1, x2, y2) -> QPainterPath:
+    """(x1, y1)에서 (x2, y2)까지의 지그재그 경로
+    
+    파동 수별 단위 지그재그를 선 방향으로 늘리고 회전/이동하는 변환 하나로
+    배치하므로, 선 길이와 관계없이 파이썬 코드 실행량이 일정합니다.
+    """
+    path = QPainterPath()
+    path.moveTo(x1, y1)
+    
+    # 선의 길이와 방향 계산
+    dx = x2 - x1
+    dy = y2 - y1
+    length = math.sqrt(dx*dx + dy*dy)
+    
+    # 너무 짧으면 직선
+    zigzag_length = length - ZIGZAG_PADDING * 2
+    if length < 10 or zigzag_length <= 0:
+        path.lineTo(x2, y2)
+        return path
+    
+    # 정규화된 방향 벡터 (u)와 수직 벡터 (-uy, ux)
+    ux = dx / length
+    uy = dy / length
+    
+    num_waves = int(zigzag_length / ZIGZAG_WAVELENGTH)
+    if num_waves < 1:
+        path.lineTo(x1 + ux * ZIGZAG_PADDING, y1 + uy * ZIGZAG_PADDING)
+        path.lineTo(x2, y2)
+        return path
+    
+    # 단위 지그재그의 x축을 지그재그 구간 길이만큼 늘려 선 방향으로, y축은 수직 방향으로
+    transform = QTransform(
+        ux * zigzag_length, uy * zigzag_length,
+        -uy, ux,
+        x1 + ux * ZIGZAG_PADDING, y1 + uy * ZIGZAG_PADDING
+    )
+    
+    # 시작 직선 구간 -> 지그재그 -> 마지막 직선 구간
+    # (connectPath는 moveTo만 있는 경로에 붙이면 그 moveTo를 버리므로 시작 구간을 먼저 그림)
+    path.lineTo(transform.dx(), transform.dy())
+    path.connectPath(transform.map(unit_zigzag(num_waves)))
+    path.lineTo(x2, y2)
+    return path